@@ -0,0 +1,95 @@
+import threading
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from LOR_python_app.code import repository
+from LOR_python_app.code.lor_generator import generate_lor_data
+from LOR_python_app.code.mailer import queue_letter_email, queue_rejection_email
+
+
+class TaskSignals(QObject):
+    # QRunnable is not a QObject, so its signals live here. They are emitted on the
+    # worker thread and delivered on the thread that created this object.
+    progress = pyqtSignal(int, int)  # done, total
+    item_failed = pyqtSignal(str, str)  # username, error
+    finished = pyqtSignal(int, int, bool)  # succeeded, failed, cancelled
+
+
+class AdminTask(QRunnable):
+    """
+    Runs an admin action for a list of applicants on a QThreadPool thread,
+    one applicant at a time. The applicants are plain snapshots taken on the
+    GUI thread, so the worker never touches the table model.
+    """
+
+    def __init__(self, applicants):
+        super(AdminTask, self).__init__()
+        self.applicants = applicants
+        self.signals = TaskSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        # Takes effect before the next applicant; the current one is finished first
+        self._cancelled.set()
+
+    def prepare(self):
+        pass
+
+    def process(self, applicant):
+        raise NotImplementedError
+
+    def run(self):
+        succeeded = failed = 0
+        try:
+            self.prepare()
+            for done, applicant in enumerate(self.applicants, start=1):
+                if self._cancelled.is_set():
+                    break
+                try:
+                    self.process(applicant)
+                    succeeded += 1
+                except Exception as e:
+                    print(f"Error occurred while processing {applicant.name}:", e)
+                    failed += 1
+                    self.signals.item_failed.emit(applicant.name, str(e))
+                self.signals.progress.emit(done, len(self.applicants))
+        except Exception as e:
+            print("Error occurred while running admin task:", e)
+            failed = len(self.applicants) - succeeded
+            self.signals.item_failed.emit("", str(e))
+        finally:
+            # Pool threads come and go, so do not leave their connections open
+            repository.close_connections()
+            self.signals.finished.emit(succeeded, failed, self._cancelled.is_set())
+
+
+class GenerateLettersTask(AdminTask):
+    """
+    Generate the letter for each applicant and queue it for email.
+    """
+
+    def __init__(self, applicants, admin_username):
+        super(GenerateLettersTask, self).__init__(applicants)
+        self.admin_username = admin_username
+        self.selected_branches = {}
+
+    def prepare(self):
+        # Classify every distinct branch in one pass instead of once per letter
+        from LOR_python_app.code.branch_matcher import get_branch_similarities
+        branches = list(dict.fromkeys(applicant.branch or "" for applicant in self.applicants))
+        self.selected_branches = dict(zip(branches, get_branch_similarities(branches)))
+
+    def process(self, applicant):
+        # The letter goes from memory straight into the outbox, the copy on disk is written in the background
+        file_name, data = generate_lor_data(applicant.name, applicant.full_name or "", applicant.branch or "",
+                                            applicant.specialization or "", applicant.requirement or "",
+                                            applicant.gender or "", self.admin_username,
+                                            self.selected_branches[applicant.branch or ""])
+        queue_letter_email(applicant.email, data, file_name, applicant.name)
+
+
+class RejectApplicationsTask(AdminTask):
+    """
+    Queue the rejection email for each applicant.
+    """
+
+    def process(self, applicant):
+        queue_rejection_email(applicant.email, applicant.name)
@@ -1,14 +1,21 @@
-import sqlite3
 from PyQt6.QtWidgets import QMainWindow, QApplication, QMessageBox
-from PyQt6.uic import loadUi
+from LOR_python_app.code.ui_forms import reuse_window, setup_ui
 from LOR_python_app.code.login import Login
+from LOR_python_app.code import repository
+from LOR_python_app.code.migrations import run_migrations
 
 class AdminWindow(QMainWindow):
     def __init__(self):
         super(AdminWindow, self).__init__()
-        loadUi("../UI/admin.ui", self)  # Load the UI from admin.ui
+        setup_ui(self, "admin")  # Build the UI from the class compiled from admin.ui
         self.button_signup.clicked.connect(self.store_admin_data)
 
+    def reset(self):
+        # Clear the form when the window is opened again
+        self.lineedit_username.clear()
+        self.lineedit_password.clear()
+        self.lineedit_professor_id.clear()
+
     def store_admin_data(self):
         username = self.lineedit_username.text()
         password = self.lineedit_password.text()
@@ -33,13 +40,7 @@ class AdminWindow(QMainWindow):
             return
 
         try:
-            connection = sqlite3.connect("../database/admin.db")
-            cursor = connection.cursor()
-            cursor.execute("CREATE TABLE IF NOT EXISTS admins (username TEXT, password_admin TEXT, professor_id INTEGER)")
-            cursor.execute("INSERT INTO admins (username, password_admin, professor_id) VALUES (?, ?, ?)",
-                           (username, password, professor_id_int))
-            connection.commit()
-            connection.close()
+            repository.insert_admin(username, password, professor_id_int)
             print("Admin data stored successfully.")
 
             # Open the login window and close all other windows
@@ -55,7 +56,7 @@ class AdminWindow(QMainWindow):
                 widget.close()
 
         # Open the login window
-        self.login_window = Login()
+        self.login_window = reuse_window(Login)
         self.login_window.show()
 
     def show_error_dialog(self, message):
@@ -66,6 +67,7 @@ class AdminWindow(QMainWindow):
         msg_box.exec()
 
 def main():
+    run_migrations()
     app = QApplication([])
     admin_window = AdminWindow()
     admin_window.show()
@@ -0,0 +1,279 @@
+import re
+from PyQt6.QtCore import QAbstractTableModel, QEvent, QModelIndex, Qt, pyqtSignal
+from PyQt6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton
+from LOR_python_app.code import metrics, repository
+from LOR_python_app.code.migrations import UNIQUE_COLUMNS
+
+# Columns read from the users table, in display order
+DATA_COLUMNS = repository.APPLICANT_COLUMNS
+
+# Header labels, including the action button columns after the data columns
+COLUMN_NAMES = ["username", "email", "password", "full-name", "branch", "specialization", "Requirement",
+                "Gender", "Generate LOR", "Reject", "Delete"]
+
+GENERATE_COLUMN = 8
+REJECT_COLUMN = 9
+DELETE_COLUMN = 10
+ACTION_COLUMNS = (GENERATE_COLUMN, REJECT_COLUMN, DELETE_COLUMN)
+
+# Columns the admin view can filter on, and the columns it can sort by
+FILTER_COLUMNS = ("branch", "phone", "gender")
+SORT_COLUMNS = ("name", "email", "full_name", "branch", "specialization", "phone", "gender")
+# Columns covered by the users_search full-text index
+SEARCH_COLUMNS = ("full_name", "branch", "specialization")
+
+SEARCH_TOKEN_PATTERN = re.compile(r"\w+")
+# users_search indexes prefixes of 2 and 3 characters (prefix='2 3'); a 1-character prefix would read
+# the whole index, so such words are only searched for once the next character is typed
+MIN_TOKEN_LENGTH = 2
+
+
+def _sort_key(column):
+    # name and email are never NULL and have a unique index of their own
+    if column.rsplit(".", 1)[-1] in UNIQUE_COLUMNS:
+        return column
+    # NULLs compare as '' so keyset comparisons work; the indexes from migrations are on the same expression
+    return f"IFNULL({column}, '')"
+
+
+def _match_query(text):
+    """
+    Turn search box text into an FTS5 query matching rows that contain every
+    word as a prefix. Returns None if there is nothing to search.
+    """
+    tokens = [token for token in SEARCH_TOKEN_PATTERN.findall(text) if len(token) >= MIN_TOKEN_LENGTH]
+    if not tokens:
+        return None
+    # Quoting keeps FTS5 operators (AND, NEAR, ...) typed by the admin literal
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+class ApplicantTableModel(QAbstractTableModel):
+    """
+    Table model backed by the users table of signup.db. Rows are fetched one
+    page at a time as the view scrolls, with filtering and sorting done by
+    SQLite. Pages use keyset pagination (continue after the last sort key
+    seen) so every page is one indexed range query, however deep it is.
+    """
+
+    FETCH_SIZE = 200
+    # Searches matching at most this many applicants are listed best match first. Ranking scores every
+    # match, so broader searches (the first letters typed) are listed in signup order instead.
+    RANKED_SEARCH_LIMIT = 1000
+
+    def __init__(self, connection=None, parent=None):
+        super(ApplicantTableModel, self).__init__(parent)
+        self._connection = connection if connection is not None else repository.signup_db()
+        self._filters = {}
+        # The pending queue by default; None shows applicants in every status
+        self._status = repository.STATUS_PENDING
+        self._sort_column = None
+        self._descending = False
+        self._rows = []
+        self._last_key = None
+        self._has_more = True
+        # FTS5 query of the search box, or None when not searching
+        self._search = None
+        self._ranked = False
+        self._full_text = self._connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'users_search'").fetchone() is not None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMN_NAMES)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if index.column() in ACTION_COLUMNS:
+            return COLUMN_NAMES[index.column()]
+        return self.cell_text(index.row(), index.column())
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return COLUMN_NAMES[section]
+        return str(section + 1)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        rows = self._fetch_page()
+        self._has_more = len(rows) == self.FETCH_SIZE
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1)
+        self._rows.extend(row[:-1] for row in rows)
+        self._last_key = rows[-1][-1], rows[-1][0]
+        self.endInsertRows()
+
+    def _fetch_page(self):
+        conditions = []
+        params = []
+        if self._status is not None:
+            # Served by the (status, archived_at, sort key) indexes
+            conditions.append("u.status = ? AND u.archived_at IS NULL")
+            params.append(self._status)
+        else:
+            # The unary + keeps SQLite off the archived_at index, so it walks the sort key's index instead
+            conditions.append("+u.archived_at IS NULL")
+        for column, value in self._filters.items():
+            conditions.append(f"{_sort_key('u.' + column)} = ?")
+            params.append(value)
+
+        source = "users u"
+        rowid = "u.rowid"
+        sort_key = None if self._sort_column is None else _sort_key("u." + self._sort_column)
+        if self._search is not None and self._full_text:
+            if self._ranked or sort_key is None:
+                # Read the matches first, best first or in rowid order. CROSS JOIN keeps them the outer
+                # loop; walking a users index instead would run the full-text query once per applicant.
+                source = "users_search s CROSS JOIN users u ON u.rowid = s.rowid"
+                rowid = "s.rowid"
+                conditions.append("users_search MATCH ?")
+                if self._ranked and sort_key is None:
+                    sort_key = "s.rank"
+            else:
+                # Many matches in the sorted column's order: walk its index, looking rows up in the matches
+                conditions.append("u.rowid IN (SELECT rowid FROM users_search WHERE users_search MATCH ?)")
+            params.append(self._search)
+        elif self._search is not None:
+            # Without the full-text index searching falls back to a scan
+            conditions.append("(" + " OR ".join(f"u.{column} LIKE ?" for column in SEARCH_COLUMNS) + ")")
+            params.extend([f"%{self._search}%"] * len(SEARCH_COLUMNS))
+
+        # Continue after the last (sort key, rowid) we have instead of using OFFSET. The
+        # "key >= ?" term lets SQLite seek in the index, rowid breaks ties between equal keys.
+        direction = "DESC" if self._descending else "ASC"
+        after = "<" if self._descending else ">"
+        if self._last_key is not None:
+            last_value, last_rowid = self._last_key
+            if sort_key is None:
+                conditions.append(f"{rowid} {after} ?")
+                params.append(last_rowid)
+            else:
+                conditions.append(f"{sort_key} {after}= ? AND ({sort_key} {after} ? OR {rowid} {after} ?)")
+                params.extend([last_value, last_value, last_rowid])
+        # rowid breaks ties; it is not repeated when it is the sort key, or FTS5 stops returning matches in order
+        order = f"{rowid} {direction}" if sort_key is None else f"{sort_key} {direction}, {rowid} {direction}"
+        sort_key = sort_key or rowid
+
+        where = f"WHERE {' AND '.join(conditions)}"
+        with metrics.span("lor_db_seconds", operation="fetch_applicant_page"):
+            cursor = self._connection.execute(
+                f"SELECT u.rowid, {', '.join('u.' + column for column in DATA_COLUMNS)}, {sort_key} "
+                f"FROM {source} {where} ORDER BY {order} LIMIT ?",
+                params + [self.FETCH_SIZE])
+            return cursor.fetchall()
+
+    def _count_matches(self, limit):
+        # Stops at limit, so telling a narrow search from a broad one does not read every match
+        with metrics.span("lor_db_seconds", operation="count_search_matches"):
+            cursor = self._connection.execute("SELECT COUNT(*) FROM (SELECT rowid FROM users_search "
+                                              "WHERE users_search MATCH ? LIMIT ?)", (self._search, limit))
+            return cursor.fetchone()[0]
+
+    def _reload(self):
+        self.beginResetModel()
+        self._rows = []
+        self._last_key = None
+        self._has_more = True
+        self._ranked = False
+        if self._search is not None and self._full_text:
+            self._ranked = self._count_matches(self.RANKED_SEARCH_LIMIT + 1) <= self.RANKED_SEARCH_LIMIT
+        self.endResetModel()
+        self.fetchMore()
+
+    def set_search(self, text):
+        """
+        Show only applicants whose full name, branch or specialization contain
+        every word of text as a prefix, best matches first unless more than
+        RANKED_SEARCH_LIMIT applicants match. An empty text shows everyone again.
+        """
+        search = _match_query(text) if self._full_text else (text.strip() or None)
+        if search == self._search:
+            return
+        self._search = search
+        self._reload()
+
+    def set_filters(self, status=repository.STATUS_PENDING, **filters):
+        """
+        Show only applicants in the given application status whose columns
+        equal the given values, e.g. set_filters(branch="IT", gender="Female").
+        None means no filter.
+        """
+        self._status = status
+        self._filters = {column: value for column, value in filters.items()
+                         if column in FILTER_COLUMNS and value is not None}
+        self._reload()
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if column >= len(DATA_COLUMNS) or DATA_COLUMNS[column] not in SORT_COLUMNS:
+            return
+        self._sort_column = DATA_COLUMNS[column]
+        self._descending = order == Qt.SortOrder.DescendingOrder
+        self._reload()
+
+    def distinct_values(self, column):
+        # Served from the column's index alone, so values of archived applicants are included
+        cursor = self._connection.execute(f"SELECT DISTINCT {_sort_key(column)} FROM users "
+                                          f"ORDER BY {_sort_key(column)}")
+        return [row[0] for row in cursor.fetchall()]
+
+    def cell_text(self, row, column):
+        # Same text the old QTableWidget cells showed
+        return str(self._rows[row][column + 1])
+
+    def applicant(self, row):
+        # Snapshot of the row that can be handed to a worker thread
+        return repository.Applicant(*self._rows[row][1:len(DATA_COLUMNS) + 1])
+
+    def row_id(self, row):
+        # The rowid identifies an applicant however the rows shift
+        return self._rows[row][0]
+
+    def remove_ids(self, rowids):
+        """
+        Remove the rows with the given rowids from the view without reloading,
+        one contiguous block at a time from the bottom up.
+        """
+        rowids = set(rowids)
+        positions = [row for row, values in enumerate(self._rows) if values[0] in rowids]
+        while positions:
+            last = first = positions.pop()
+            while positions and positions[-1] == first - 1:
+                first = positions.pop()
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """
+    Draws a push button in a cell and reports clicks on it, so the table does
+    not need a QPushButton widget per row.
+    """
+
+    clicked = pyqtSignal(int, int)  # row, column
+
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = index.data()
+        button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+        style = option.widget.style() if option.widget is not None else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and option.rect.contains(event.position().toPoint())):
+            self.clicked.emit(index.row(), index.column())
+            return True
+        return super(ActionButtonDelegate, self).editorEvent(event, model, option, index)
@@ -0,0 +1,92 @@
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from LOR_python_app.code import metrics, repository
+from LOR_python_app.code.lor_generator import OUTPUT_ROOT, TEMPLATE_PATHS, plan_letter, record_letter, render_letter
+from LOR_python_app.code.migrations import run_migrations
+
+# Every student whose application was not rejected
+BATCH_STATUSES = [repository.STATUS_PENDING, repository.STATUS_GENERATED, repository.STATUS_SENT]
+
+
+def render_timed(job):
+    # Runs inside a worker process, so only plain values go in and out
+    start = time.perf_counter()
+    render_letter(job)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate recommendation letters for every eligible student.")
+    parser.add_argument("--signup-db", default=repository.SIGNUP_DB_PATH)
+    parser.add_argument("--admin-db", default=repository.ADMIN_DB_PATH)
+    parser.add_argument("--professor-id", type=int, help="admin signing the letters (defaults to the admin who logged in last)")
+    parser.add_argument("--output", default=OUTPUT_ROOT, help="root folder for the generated letters")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of rendering processes")
+    # Letters of generated and sent students are only rewritten when their template or details changed
+    parser.add_argument("--status", nargs="+", choices=repository.APPLICATION_STATUSES, default=BATCH_STATUSES,
+                        help="application statuses to generate letters for (default: pending, generated, sent)")
+    args = parser.parse_args()
+
+    repository.configure(args.signup_db, args.admin_db)
+    run_migrations()
+    applicants = repository.fetch_eligible_applicants(TEMPLATE_PATHS, args.status)
+    if not applicants:
+        print("No eligible students found.")
+        return
+    if args.professor_id is None:
+        admin_username = repository.fetch_admin_username()
+    else:
+        admin = repository.get_admin(args.professor_id)
+        admin_username = admin.username if admin is not None else None
+    if admin_username is None:
+        raise SystemExit("No admin found to sign the letters.")
+
+    # Classify every distinct branch once here, so the workers only render documents
+    from LOR_python_app.code.branch_matcher import get_branch_similarities
+    branches = list(dict.fromkeys(applicant.branch or "" for applicant in applicants))
+    selected_branches = dict(zip(branches, get_branch_similarities(branches)))
+
+    # Only letters whose template or details changed since they were last generated need rendering
+    jobs = [plan_letter(a.name, a.full_name, a.branch or "", a.specialization or "", a.requirement, a.gender or "",
+                        admin_username, selected_branches[a.branch or ""], args.output)
+            for a in applicants]
+    generated = repository.find_generated_letters(job.content_hash for job in jobs)
+    jobs = [job for job in jobs
+            if job.content_hash not in generated or not os.path.exists(generated[job.content_hash])]
+    unchanged = len(applicants) - len(jobs)
+
+    print(f"Generating {len(jobs)} letters with {args.workers} workers ({unchanged} unchanged)...")
+    timings = []
+    failures = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {executor.submit(render_timed, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                elapsed = future.result()
+                record_letter(job)
+            except Exception as e:
+                failures += 1
+                print(f"FAILED  {job.username}: {e}")
+                continue
+            timings.append(elapsed)
+            # Spans recorded inside the workers stay there, so the parent records the render time
+            metrics.observe("lor_letter_render_seconds", elapsed)
+            print(f"{elapsed * 1000:8.1f} ms  {job.username} -> {job.file_path}")
+    wall_time = time.perf_counter() - start
+
+    # Throughput summary
+    print()
+    print(f"Letters generated: {len(timings)}  unchanged: {unchanged}  failed: {failures}")
+    if timings:
+        print(f"Wall time: {wall_time:.2f} s  throughput: {len(timings) / wall_time:.1f} letters/s")
+        print(f"Per letter: mean {statistics.mean(timings) * 1000:.1f} ms  "
+              f"median {statistics.median(timings) * 1000:.1f} ms  max {max(timings) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
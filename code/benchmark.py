@@ -0,0 +1,250 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# The admin view is measured without opening windows
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from LOR_python_app.code import repository
+from LOR_python_app.code.lor_generator import plan_letter, render_letter
+from LOR_python_app.code.migrations import run_migrations
+
+# Row counts the admin view is measured at
+TABLE_SIZES = [1000, 10000, 100000]
+# professor_id is limited to 1-100, so this is the most admins a database can hold
+ADMIN_COUNT = 100
+BRANCHES = ["Information Technology", "Electrical Engineering", "IT", "Electronics", "Computer Science"]
+REQUIREMENTS = ["Higher Studies", "Professional"]
+# Slowdowns smaller than this many seconds are timer noise, however large they are relative to the baseline
+NOISE_FLOOR = 0.001
+
+
+def time_call(function, repeat):
+    """
+    Call function repeat times and return the wall-clock seconds of each call.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def summarize(timings):
+    return {"median": statistics.median(timings), "min": min(timings), "max": max(timings), "runs": len(timings)}
+
+
+def synthetic_applicants(count, prefix="bench"):
+    return [repository.Applicant(f"{prefix}{i}", f"{prefix}{i}@student.sfit.ac.in", "password",
+                                 f"Student {i}", BRANCHES[i % len(BRANCHES)], "Machine Learning",
+                                 REQUIREMENTS[i % len(REQUIREMENTS)], "Male" if i % 2 else "Female")
+            for i in range(count)]
+
+
+def create_databases(directory, students):
+    """
+    Create a signup.db with the given number of synthetic students and an
+    admin.db with ADMIN_COUNT admins in directory, and point the repository at them.
+    """
+    repository.configure(os.path.join(directory, f"signup_{students}.db"),
+                         os.path.join(directory, "admin.db"))
+    run_migrations()
+    if not repository.username_exists("bench0"):
+        repository.insert_users(synthetic_applicants(students))
+    if repository.get_admin(ADMIN_COUNT) is None:
+        for professor_id in range(1, ADMIN_COUNT + 1):
+            repository.insert_admin(f"Professor {professor_id}", "password", professor_id)
+
+
+def bench_branch_similarity(repeat):
+    from LOR_python_app.code.branch_matcher import create_matcher, get_branch_similarity, set_matcher
+    results = {}
+    for engine in ("ngram", "spacy"):
+        # Cold: the first call creates the matcher (and loads the model for spaCy)
+        set_matcher(None)
+        try:
+            results[f"branch_similarity_{engine}_cold"] = summarize(
+                time_call(lambda: set_matcher(create_matcher(engine)) or get_branch_similarity("Comp Sci"), 1))
+        except (ImportError, OSError) as e:
+            print(f"Skipping the {engine} branch matcher:", e)
+            continue
+        results[f"branch_similarity_{engine}_warm"] = summarize(
+            time_call(lambda: get_branch_similarity("Comp Sci"), repeat))
+        # A string never seen before misses the cache and runs the matcher
+        unseen = iter(range(repeat))
+        results[f"branch_similarity_{engine}_uncached"] = summarize(
+            time_call(lambda: get_branch_similarity(f"Elec Engg {next(unseen)}"), repeat))
+    set_matcher(None)
+    return results
+
+
+def bench_letter(directory, repeat):
+    def render():
+        job = plan_letter("bench0", "Student 0", "Information Technology", "Machine Learning", "Higher Studies",
+                          "Female", "Professor 1", "IT", output_root=directory)
+        render_letter(job)
+    return {"letter_render": summarize(time_call(render, repeat))}
+
+
+def bench_admin_view(app, sizes, repeat):
+    from PyQt6.QtCore import Qt
+    from LOR_python_app.code.database_window import DatabaseWindow
+    from LOR_python_app.code.session import Session
+    results = {}
+    for size in sizes:
+        create_databases(os.path.dirname(repository.SIGNUP_DB_PATH), size)
+        admin = repository.get_admin(1)
+        session = Session(admin.username, admin)
+
+        def open_window():
+            window = DatabaseWindow(session)
+            window.show()
+            app.processEvents()
+            window.close()
+
+        def scroll_all():
+            # Fetch every row the way scrolling to the bottom would
+            window = DatabaseWindow(session)
+            while window.model.canFetchMore():
+                window.model.fetchMore()
+            window.close()
+
+        def sort_by_branch():
+            window = DatabaseWindow(session)
+            window.model.sort(4, Qt.SortOrder.DescendingOrder)
+            window.close()
+
+        results[f"admin_view_open_{size}"] = summarize(time_call(open_window, repeat))
+        results[f"admin_view_scroll_all_{size}"] = summarize(time_call(scroll_all, 1))
+        results[f"admin_view_sort_{size}"] = summarize(time_call(sort_by_branch, repeat))
+    return results
+
+
+def bench_login(repeat):
+    from LOR_python_app.code.login import Login
+    window = Login()
+    results = {
+        # The admin with the highest id and a student, who is only checked after the admin lookup misses
+        "login_admin": summarize(time_call(lambda: window.authenticate(str(ADMIN_COUNT), "password",
+                                                                       str(ADMIN_COUNT)), repeat)),
+        "login_student": summarize(time_call(lambda: window.authenticate("bench1", "password", "bench1"), repeat)),
+    }
+    window.close()
+    return results
+
+
+def bench_windows(app, repeat):
+    """
+    Time building each window from scratch and reopening the cached one, up
+    to the first processed event after show().
+    """
+    from LOR_python_app.code.ui_forms import reuse_window
+    from LOR_python_app.code.adminwindow import AdminWindow
+    from LOR_python_app.code.details import FillDetailsWindow
+    from LOR_python_app.code.login import Login
+    from LOR_python_app.code.session import Session
+    from LOR_python_app.code.signup import SignUpWindow
+    windows = {
+        "login": Login,
+        "signup": SignUpWindow,
+        "admin": AdminWindow,
+        "fill_details": lambda: FillDetailsWindow(Session("bench0")),
+    }
+    results = {}
+    for name, open_window in windows.items():
+        def open_and_close():
+            window = open_window()
+            window.show()
+            app.processEvents()
+            window.close()
+        results[f"window_open_{name}"] = summarize(time_call(open_and_close, repeat))
+
+    for name, window_class in (("login", Login), ("signup", SignUpWindow), ("admin", AdminWindow)):
+        def reopen():
+            window = reuse_window(window_class)
+            window.show()
+            app.processEvents()
+            window.close()
+        results[f"window_reopen_{name}"] = summarize(time_call(reopen, repeat))
+    return results
+
+
+def bench_signup_checks(repeat):
+    def check_new_user():
+        repository.username_exists("new_student")
+        repository.email_exists("new_student@student.sfit.ac.in")
+    return {"signup_checks": summarize(time_call(check_new_user, repeat))}
+
+
+def compare(results, baseline, tolerance):
+    """
+    Return (name, baseline median, median) for every benchmark whose median
+    is more than tolerance (and NOISE_FLOOR) slower than in the baseline.
+    """
+    regressions = []
+    for name, result in results["benchmarks"].items():
+        previous = baseline["benchmarks"].get(name)
+        if previous is None:
+            continue
+        if result["median"] - previous["median"] > max(previous["median"] * tolerance, NOISE_FLOOR):
+            regressions.append((name, previous["median"], result["median"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the application's hot paths on synthetic data.")
+    parser.add_argument("--output", default="benchmark_results.json", help="file to write the results to")
+    parser.add_argument("--baseline", help="results of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown over the baseline median before failing (0.25 = 25%%)")
+    parser.add_argument("--repeat", type=int, default=20, help="runs per benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=TABLE_SIZES, help="admin view row counts")
+    args = parser.parse_args()
+
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+
+    benchmarks = {}
+    with tempfile.TemporaryDirectory() as directory:
+        create_databases(directory, min(args.sizes))
+        benchmarks.update(bench_branch_similarity(args.repeat))
+        benchmarks.update(bench_letter(directory, args.repeat))
+        benchmarks.update(bench_login(args.repeat))
+        benchmarks.update(bench_signup_checks(args.repeat))
+        benchmarks.update(bench_windows(app, args.repeat))
+        benchmarks.update(bench_admin_view(app, args.sizes, args.repeat))
+        repository.close_connections()
+
+    results = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": benchmarks,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    for name, result in benchmarks.items():
+        print(f"{name:32} median {result['median'] * 1000:9.2f} ms  min {result['min'] * 1000:9.2f} ms")
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for name, previous, current in regressions:
+            print(f"Regression: {name} {previous * 1000:.2f} ms -> {current * 1000:.2f} ms")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against the baseline.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+import json
+import math
+import os
+import re
+import threading
+from collections import OrderedDict
+from LOR_python_app.code import metrics, repository
+
+# Branch taxonomy used when the branch_taxonomy table is empty: {folder under All_LORs: [aliases]}
+TAXONOMY_FILE = os.getenv("LOR_BRANCHES_FILE", "../branches.json")
+# Last resort when there is no taxonomy at all, the folders letters always went to
+DEFAULT_BRANCHES = ["IT", "Electrical"]
+
+# "ngram" (default) or "spacy"
+MATCHER_ENGINE = os.getenv("LOR_BRANCH_MATCHER", "ngram")
+
+# Maximum number of classified branch strings kept in memory
+CACHE_SIZE = 1024
+
+NON_WORD_PATTERN = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text):
+    # "Elec. Engg" and "elec engg" are the same entry
+    return NON_WORD_PATTERN.sub(" ", text.lower().replace("&", " and ")).strip()
+
+
+def load_taxonomy():
+    """
+    Return the branch taxonomy as {branch: [aliases]}, from the
+    branch_taxonomy table if it has rows, otherwise from TAXONOMY_FILE.
+    """
+    taxonomy = {}
+    for branch, alias in repository.fetch_branch_taxonomy():
+        taxonomy.setdefault(branch, []).append(alias)
+    if taxonomy:
+        return taxonomy
+    if os.path.exists(TAXONOMY_FILE):
+        with open(TAXONOMY_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    return {branch: [branch] for branch in DEFAULT_BRANCHES}
+
+
+class BranchMatcher:
+    """
+    Maps the free-text branch a student typed to one of the taxonomy's
+    branches. Engines implement match_many.
+    """
+
+    def __init__(self, taxonomy):
+        self.taxonomy = taxonomy
+        self.branches = list(taxonomy)
+
+    def match_many(self, texts):
+        """
+        Return the best matching branch for each text, in order.
+        """
+        raise NotImplementedError
+
+
+class NgramBranchMatcher(BranchMatcher):
+    """
+    Looks a text up in the alias table, and otherwise picks the alias with
+    the most similar character trigrams (cosine over binary trigram sets).
+    Pure Python, no model to load.
+    """
+
+    def __init__(self, taxonomy):
+        super(NgramBranchMatcher, self).__init__(taxonomy)
+        self._aliases = {}
+        self._alias_branches = []
+        self._alias_norms = []
+        # trigram -> indexes of the aliases containing it
+        self._index = {}
+        for branch, aliases in taxonomy.items():
+            for alias in [branch] + list(aliases):
+                key = normalize(alias)
+                if not key or key in self._aliases:
+                    continue
+                self._aliases[key] = branch
+                grams = self._trigrams(key)
+                alias_id = len(self._alias_branches)
+                self._alias_branches.append(branch)
+                self._alias_norms.append(math.sqrt(len(grams)))
+                for gram in grams:
+                    self._index.setdefault(gram, []).append(alias_id)
+
+    @staticmethod
+    def _trigrams(key):
+        padded = f"  {key} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def match(self, text):
+        key = normalize(text)
+        branch = self._aliases.get(key)
+        if branch is not None:
+            return branch
+        grams = self._trigrams(key)
+        scores = {}
+        for gram in grams:
+            for alias_id in self._index.get(gram, ()):
+                scores[alias_id] = scores.get(alias_id, 0) + 1
+        if not scores:
+            return self.branches[0]
+        best = max(scores, key=lambda alias_id: (scores[alias_id] / self._alias_norms[alias_id], -alias_id))
+        return self._alias_branches[best]
+
+    def match_many(self, texts):
+        return [self.match(text) for text in texts]
+
+
+def create_matcher(engine=None, taxonomy=None):
+    engine = engine or MATCHER_ENGINE
+    taxonomy = taxonomy if taxonomy is not None else load_taxonomy()
+    if engine == "spacy":
+        from LOR_python_app.code.nlp import SpacyBranchMatcher
+        return SpacyBranchMatcher(taxonomy)
+    if engine == "ngram":
+        return NgramBranchMatcher(taxonomy)
+    raise ValueError(f"Unknown branch matcher engine: {engine}")
+
+
+_matcher = None
+_matcher_lock = threading.Lock()
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def get_matcher():
+    """
+    Return the configured matcher, creating it on first use.
+    """
+    global _matcher
+    if _matcher is None:
+        with _matcher_lock:
+            if _matcher is None:
+                _matcher = create_matcher()
+    return _matcher
+
+
+def set_matcher(matcher):
+    """
+    Use another matcher from now on, e.g. after the taxonomy changed.
+    """
+    global _matcher
+    with _matcher_lock:
+        _matcher = matcher
+    with _cache_lock:
+        _cache.clear()
+
+
+def is_matcher_loaded():
+    return _matcher is not None
+
+
+def get_branch_similarities(branches):
+    """
+    Classify many branch strings at once. Returns the matching taxonomy
+    branch (the All_LORs folder) for each input, in order.
+    """
+    # "Comp Sci", "comp sci" and "Comp. Sci" are classified once
+    keys = [normalize(branch) for branch in branches]
+    results = {}
+    with _cache_lock:
+        for key in keys:
+            if key in _cache:
+                _cache.move_to_end(key)
+                results[key] = _cache[key]
+    missing = list(dict.fromkeys(key for key in keys if key not in results))
+    metrics.increment("lor_branch_cache_hits_total", len(keys) - len(missing))
+    metrics.increment("lor_branch_cache_misses_total", len(missing))
+
+    if missing:
+        matcher = get_matcher()
+        with metrics.span("lor_branch_classification_seconds"):
+            matches = matcher.match_many(missing)
+        with _cache_lock:
+            for key, branch in zip(missing, matches):
+                results[key] = _cache[key] = branch
+            while len(_cache) > CACHE_SIZE:
+                _cache.popitem(last=False)
+
+    return [results[key] for key in keys]
+
+
+def get_branch_similarity(branch):
+    """
+    Return the taxonomy branch most similar to the given branch.
+    """
+    return get_branch_similarities([branch])[0]
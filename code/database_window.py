@@ -1,228 +1,275 @@
-import os
-import sqlite3
-import smtplib
-from email.message import EmailMessage
-from PyQt6.QtWidgets import QMainWindow, QTableWidget, QTableWidgetItem, QPushButton, QMessageBox
-from PyQt6.uic import loadUi
-from docx import Document
-from nlp import get_branch_similarity
+from PyQt6.QtCore import QThreadPool, QTimer
+from PyQt6.QtWidgets import (QAbstractItemView, QComboBox, QLineEdit, QMainWindow, QMessageBox, QProgressBar,
+                             QPushButton)
+from LOR_python_app.code.admin_tasks import GenerateLettersTask, RejectApplicationsTask
+from LOR_python_app.code.applicant_model import (ACTION_COLUMNS, DELETE_COLUMN, GENERATE_COLUMN, REJECT_COLUMN,
+                                                 ActionButtonDelegate, ApplicantTableModel)
+from LOR_python_app.code.lor_generator import TEMPLATE_PATHS, get_template_path
+from LOR_python_app.code import repository
+from LOR_python_app.code.ui_forms import setup_ui
+
+# Milliseconds without typing before the search runs
+SEARCH_DELAY_MS = 250
+
 
 class DatabaseWindow(QMainWindow):
-    def __init__(self, data):
+    def __init__(self, session):
         super(DatabaseWindow, self).__init__()
-        loadUi("../UI/database.ui", self)
+        setup_ui(self, "database")
         self.setWindowTitle("Database Contents")
-
-        # Database initialization
-        self.db_connection = sqlite3.connect("../database/signup.db")
-        self.cursor = self.db_connection.cursor()
-
-        self.tableWidget = QTableWidget(self)
-        self.tableWidget.setGeometry(10, 10, 1150, 600)
-        self.tableWidget.setRowCount(0)
-        self.tableWidget.setColumnCount(11)  # Increase the column count to accommodate the Reject button
-
-        # Set column names
-        column_names = ["username", "email", "password", "full-name", "branch", "specialization", "Requirement",
-                        "Gender","Generate LOR", "Reject", "Delete"]
-        self.tableWidget.setHorizontalHeaderLabels(column_names)
-
-        self.populate_table(data)
-
-    def populate_table(self, data):
-        self.tableWidget.setRowCount(len(data))
-
-        # Populate table with data
-        for row_num, row_data in enumerate(data):
-            for col_num, cell_data in enumerate(row_data):
-                self.tableWidget.setItem(row_num, col_num, QTableWidgetItem(str(cell_data)))
-
-            # Add delete button to the second last column of each row
-            delete_button = QPushButton("Delete")
-            delete_button.clicked.connect(lambda _, row=row_num: self.delete_row(row))
-            self.tableWidget.setCellWidget(row_num, 10, delete_button)
-
-            # Add "Generate LOR" button to the second last column of each row
-            generate_lor_button = QPushButton("Generate LOR")
-            generate_lor_button.clicked.connect(lambda _, row=row_num: self.generate_lor(row))
-            self.tableWidget.setCellWidget(row_num, 8, generate_lor_button)
-
-            # Add "Reject" button to the last column of each row
-            reject_button = QPushButton("Reject")
-            reject_button.clicked.connect(lambda _, row=row_num: self.reject_application(row))
-            self.tableWidget.setCellWidget(row_num, 9, reject_button)
+        # The signed-in admin, who signs the letters, and the session's database connections
+        self.session = session
+
+        # Applicants are read from the database in chunks as the table scrolls
+        self.model = ApplicantTableModel(session.signup_db, parent=self)
+        self.tableView.setModel(self.model)
+        self.tableView.setGeometry(10, 50, 1130, 505)
+
+        # Clicking a header sorts by that column in the database
+        self.tableView.setSortingEnabled(True)
+
+        # Full-text search over name, branch and specialization, run once the admin pauses typing
+        self.search_input = QLineEdit(self)
+        self.search_input.setGeometry(10, 10, 240, 30)
+        self.search_input.setPlaceholderText("Search name, branch, specialization")
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.apply_search)
+        self.search_input.textChanged.connect(self.search_timer.start)
+
+        # Filters, applied by the database query rather than by hiding rows
+        self.branch_filter = QComboBox(self)
+        self.branch_filter.setGeometry(260, 10, 170, 30)
+        self.branch_filter.addItem("All branches", None)
+        for branch in self.model.distinct_values("branch"):
+            if branch:
+                self.branch_filter.addItem(branch, branch)
+
+        self.requirement_filter = QComboBox(self)
+        self.requirement_filter.setGeometry(440, 10, 150, 30)
+        self.requirement_filter.addItem("All requirements", None)
+        for requirement in TEMPLATE_PATHS:
+            self.requirement_filter.addItem(requirement, requirement)
+
+        self.gender_filter = QComboBox(self)
+        self.gender_filter.setGeometry(600, 10, 110, 30)
+        self.gender_filter.addItem("All genders", None)
+        for gender in ["Male", "Female"]:
+            self.gender_filter.addItem(gender, gender)
+
+        # Only the applications still waiting for a decision are loaded unless asked otherwise
+        self.status_filter = QComboBox(self)
+        self.status_filter.setGeometry(1000, 10, 140, 30)
+        for label, status in (("Pending", repository.STATUS_PENDING),
+                              ("Letter generated", repository.STATUS_GENERATED),
+                              ("Letter sent", repository.STATUS_SENT),
+                              ("Rejected", repository.STATUS_REJECTED),
+                              ("All applications", None)):
+            self.status_filter.addItem(label, status)
+
+        for combo_box in (self.branch_filter, self.requirement_filter, self.gender_filter, self.status_filter):
+            combo_box.currentIndexChanged.connect(self.apply_filters)
+
+        # Draw the Generate LOR, Reject and Delete buttons instead of creating widgets for every row
+        self.action_delegate = ActionButtonDelegate(self.tableView)
+        self.action_delegate.clicked.connect(self.on_action_clicked)
+        for column in ACTION_COLUMNS:
+            self.tableView.setItemDelegateForColumn(column, self.action_delegate)
+
+        # Several applicants can be selected and handled in one go
+        self.tableView.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.tableView.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+
+        self.generate_button = QPushButton("Generate selected", self)
+        self.generate_button.setGeometry(720, 10, 130, 30)
+        self.generate_button.clicked.connect(self.generate_selected)
+
+        self.reject_button = QPushButton("Reject selected", self)
+        self.reject_button.setGeometry(860, 10, 130, 30)
+        self.reject_button.clicked.connect(self.reject_selected)
+
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setGeometry(900, 562, 160, 30)
+        self.progress_bar.hide()
+
+        self.cancel_button = QPushButton("Cancel", self)
+        self.cancel_button.setGeometry(1070, 562, 70, 30)
+        self.cancel_button.clicked.connect(self.cancel_task)
+        self.cancel_button.hide()
+
+        # Removing applicants runs in one transaction however many are selected
+        self.archive_button = QPushButton("Archive selected", self)
+        self.archive_button.setGeometry(10, 562, 130, 30)
+        self.archive_button.clicked.connect(self.archive_selected)
+
+        self.delete_button = QPushButton("Delete selected", self)
+        self.delete_button.setGeometry(150, 562, 130, 30)
+        self.delete_button.clicked.connect(self.delete_selected)
+
+        # The action running on the thread pool, if any
+        self.task = None
+        self.task_errors = []
+
+    def reset(self, session):
+        # Opened again after another login, show the applicants as they are now
+        self.session = session
+        self.apply_filters()
+
+    def apply_search(self):
+        self.model.set_search(self.search_input.text())
+
+    def apply_filters(self):
+        self.model.set_filters(status=self.status_filter.currentData(),
+                               branch=self.branch_filter.currentData(),
+                               phone=self.requirement_filter.currentData(),
+                               gender=self.gender_filter.currentData())
+
+    def on_action_clicked(self, row, column):
+        if column == GENERATE_COLUMN:
+            self.generate_lor(row)
+        elif column == REJECT_COLUMN:
+            self.reject_application(row)
+        elif column == DELETE_COLUMN:
+            self.delete_row(row)
+
+    def selected_rows(self):
+        return sorted(index.row() for index in self.tableView.selectionModel().selectedRows())
+
+    def generate_selected(self):
+        self.generate_letters(self.selected_rows())
+
+    def reject_selected(self):
+        self.reject_applications(self.selected_rows())
 
     def reject_application(self, row):
-        try:
-            # Get user email from the table
-            recipient_email = self.tableWidget.item(row, 1).text()  # Assuming email is in the second column
-
-            # Send rejection email
-            self.send_rejection_email(recipient_email)
+        self.reject_applications([row])
 
-            QMessageBox.information(self, "Application Rejected",
-                                    "The application has been rejected. An email notification has been sent.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error",
-                                 f"An error occurred while sending the rejection email: {str(e)}")
-
-    def send_rejection_email(self, recipient_email):
-        try:
-            # Set up the rejection email message
-            msg = EmailMessage()
-            msg['Subject'] = 'Application Rejection'
-            msg['From'] = os.getenv('MY_MAIL')  # Sender's email
-            msg['To'] = recipient_email
-            msg.set_content('Dear Applicant,\n\nYour application has been rejected. '
-                            'If you have any questions, please contact the authority.')
-
-            # Connect to the SMTP server and send the email
-            with smtplib.SMTP('smtp.gmail.com', 587) as smtp:
-                smtp.starttls()
-                smtp.login(os.getenv('MY_MAIL'), os.getenv('PASSWORD'))
-                smtp.send_message(msg)
-        except Exception as e:
-            raise e  # Handle the exception appropriately in your application
+    def reject_applications(self, rows):
+        if not rows:
+            QMessageBox.information(self, "No Applicants Selected", "Please select the applicants to reject.")
+            return
+        # Queueing the rejection emails runs on a worker thread
+        self.start_task(RejectApplicationsTask([self.model.applicant(row) for row in rows]))
 
     def delete_row(self, row):
-        # Get username of the row to be deleted
-        username = self.tableWidget.item(row, 0).text()
-        print("Deleting user:", username)
-
-        # Remove row from the table
-        self.tableWidget.removeRow(row)
-
-        # Delete corresponding row from the database
-        self.cursor.execute("DELETE FROM users WHERE name = ?", (username,))
-        self.db_connection.commit()
-
-    def generate_lor(self, row):
+        print("Deleting user:", self.model.cell_text(row, 0))
+        self.delete_rows([row])
+
+    def delete_selected(self):
+        rows = self.selected_rows()
+        if rows and self.confirm("Delete Applicants", f"Permanently delete {len(rows)} applicant(s)?"):
+            self.delete_rows(rows)
+
+    def archive_selected(self):
+        rows = self.selected_rows()
+        if rows and self.confirm("Archive Applicants", f"Archive {len(rows)} applicant(s)? "
+                                                       "They will no longer be shown."):
+            self.archive_rows(rows)
+
+    def confirm(self, title, message):
+        answer = QMessageBox.question(self, title, message)
+        return answer == QMessageBox.StandardButton.Yes
+
+    def delete_rows(self, rows):
+        # Rows are identified by rowid, which stays the same while rows above it are removed
+        rowids = [self.model.row_id(row) for row in rows]
         try:
-            # Get the value in the 6th column (Requirement)
-            requirement = self.tableWidget.item(row, 6).text()
-
-            # Select the appropriate letter format based on the requirement
-            if requirement == "Higher Studies":
-                letter_template_path = "../LOR.docx"
-            elif requirement == "Professional":
-                letter_template_path = "../LOR1.docx"
-            else:
-                QMessageBox.warning(self, "Invalid Requirement",
-                                    "Requirement must be either 'Higher Studies' or 'Professional'.")
-                return
-
-            # Open the letter template
-            doc = Document(letter_template_path)
-
-            # Get user details from the table
-            username = self.tableWidget.item(row, 0).text()
-            full_name = self.tableWidget.item(row, 3).text()
-            branch = self.tableWidget.item(row, 4).text()
-            specialization = self.tableWidget.item(row, 5).text()
-            phone = self.tableWidget.item(row, 6).text()
-            gender = self.tableWidget.item(row, 7).text()
-
-            # Determine the most similar predefined branch
-            selected_branch = get_branch_similarity(branch)
-
-            # Determine pronouns based on the gender
-            if gender.lower() == "male":
-                he_or_she = "he"
-                his_or_her = "his"
-                him_or_her = "him"
-            else:
-                he_or_she = "she"
-                his_or_her = "her"
-                him_or_her = "her"
-
-            # Get the admin username
-            admin_username = self.fetch_admin_username()
-
-            # Fill in the placeholders in the letter template with user details and pronouns
-            for paragraph in doc.paragraphs:
-                if "{full_name}" in paragraph.text:
-                    paragraph.text = paragraph.text.replace("{full_name}", full_name)
-                if "{branch}" in paragraph.text:
-                    paragraph.text = paragraph.text.replace("{branch}", branch)
-                if "{specialization}" in paragraph.text:
-                    paragraph.text = paragraph.text.replace("{specialization}", specialization)
-                if "{phone}" in paragraph.text:
-                    paragraph.text = paragraph.text.replace("{phone}", phone)
-                if "{username}" in paragraph.text:
-                    paragraph.text = paragraph.text.replace("{username}", username)
-                if "{admin_username}" in paragraph.text:
-                    paragraph.text = paragraph.text.replace("{admin_username}", admin_username)
-                # Add pronouns
-                if "{he_or_she}" in paragraph.text:
-                    paragraph.text = paragraph.text.replace("{he_or_she}", he_or_she)
-                if "{his_or_her}" in paragraph.text:
-                    paragraph.text = paragraph.text.replace("{his_or_her}", his_or_her)
-                if "{him_or_her}" in paragraph.text:
-                    paragraph.text = paragraph.text.replace("{him_or_her}", him_or_her)
-
-            # Specify the folder path for saving the recommendation letters
-            folder_path = f"../All_LORs/{selected_branch}"
-            os.makedirs(folder_path, exist_ok=True)  # Create the folder if it doesn't exist
-
-            # Save the recommendation letter as a Word document
-            file_path = os.path.join(folder_path, f"{full_name}_LOR.docx")
-            doc.save(file_path)
-
-            QMessageBox.information(self, "Recommendation Letter Generated",
-                                    "The recommendation letter has been generated and saved.")
-
-            # Send the generated recommendation letter via email
-            recipient_email = self.tableWidget.item(row, 1).text()  # Assuming email is in the second column
-            self.send_email(recipient_email, file_path)
-
+            repository.delete_users(rowids)
         except Exception as e:
-            QMessageBox.critical(self, "Error",
-                                 f"An error occurred while generating or sharing the recommendation letter: {str(e)}")
+            QMessageBox.critical(self, "Error", f"An error occurred while deleting the applicants: {str(e)}")
+            return
+        # Only the affected rows leave the view, the rest is not reloaded
+        self.model.remove_ids(rowids)
 
-    def fetch_admin_username(self):
+    def archive_rows(self, rows):
+        rowids = [self.model.row_id(row) for row in rows]
         try:
-            # Connect to the admin.db database
-            admin_db_connection = sqlite3.connect("../database/admin.db")
-            admin_cursor = admin_db_connection.cursor()
-
-            # Fetch the admin username from admin.db
-            admin_cursor.execute("SELECT username FROM admins LIMIT 1")
-            admin_username = admin_cursor.fetchone()[0]  # Fetch the first row and extract the username
-
-            # Close the admin database connection
-            admin_db_connection.close()
-
-            return admin_username
+            repository.archive_users(rowids)
         except Exception as e:
-            print("Error fetching admin username:", e)
-
-    def send_email(self, recipient_email, attachment_path):
-        try:
-            # Set up the email message
-            msg = EmailMessage()
-            msg['Subject'] = 'Recommendation Letter'
-            msg['From'] = os.getenv('MY_MAIL')  # Sender's email
-            msg['To'] = recipient_email
-            msg.set_content('Please find the attached recommendation letter.')
-
-            # Attach the recommendation letter file
-            with open(attachment_path, 'rb') as f:
-                file_data = f.read()
-            msg.add_attachment(file_data, maintype='application', subtype='octet-stream',
-                               filename=os.path.basename(attachment_path))
-
-            # Connect to the SMTP server and send the email
-            with smtplib.SMTP('smtp.gmail.com', 587) as smtp:
-                smtp.starttls()
-                smtp.login(os.getenv('MY_MAIL'), os.getenv('PASSWORD'))
-                smtp.send_message(msg)
-
-            QMessageBox.information(self, "Email Sent",
-                                    "The recommendation letter has been sent via email.")
+            QMessageBox.critical(self, "Error", f"An error occurred while archiving the applicants: {str(e)}")
+            return
+        self.model.remove_ids(rowids)
 
-        except Exception as e:
+    def generate_lor(self, row):
+        # Check that a letter format exists for the requirement
+        if get_template_path(self.model.cell_text(row, 6)) is None:
+            QMessageBox.warning(self, "Invalid Requirement",
+                                "Requirement must be either 'Higher Studies' or 'Professional'.")
+            return
+        self.generate_letters([row])
+
+    def generate_letters(self, rows):
+        if not rows:
+            QMessageBox.information(self, "No Applicants Selected",
+                                    "Please select the applicants to generate letters for.")
+            return
+        # Rendering the letters and queueing the emails runs on a worker thread
+        self.start_task(GenerateLettersTask([self.model.applicant(row) for row in rows], self.session.admin_username))
+
+    def start_task(self, task):
+        if self.task is not None:
+            QMessageBox.information(self, "Please Wait",
+                                    "Another action is still running. Wait for it to finish or cancel it.")
+            return
+        self.task = task
+        self.task_errors = []
+        task.signals.progress.connect(self.on_task_progress)
+        task.signals.item_failed.connect(self.on_task_item_failed)
+        task.signals.finished.connect(self.on_task_finished)
+        # The window keeps the task, so it must not be deleted by the pool
+        task.setAutoDelete(False)
+
+        self.progress_bar.setRange(0, len(task.applicants))
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.cancel_button.show()
+        self.generate_button.setEnabled(False)
+        self.reject_button.setEnabled(False)
+        QThreadPool.globalInstance().start(task)
+
+    def cancel_task(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.cancel_button.setEnabled(False)
+
+    def on_task_progress(self, done, total):
+        self.progress_bar.setValue(done)
+
+    def on_task_item_failed(self, username, error):
+        self.task_errors.append(f"{username}: {error}" if username else error)
+
+    def on_task_finished(self, succeeded, failed, cancelled):
+        task, self.task = self.task, None
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        self.cancel_button.setEnabled(True)
+        self.generate_button.setEnabled(True)
+        self.reject_button.setEnabled(True)
+        # The handled applicants changed status, so they may no longer belong in the view
+        if succeeded:
+            self.apply_filters()
+
+        generating = isinstance(task, GenerateLettersTask)
+        if failed:
+            action = ("generating or sharing the recommendation letter" if generating
+                      else "queueing the rejection email")
             QMessageBox.critical(self, "Error",
-                                 f"An error occurred while sending the email: {str(e)}")
+                                 f"An error occurred while {action}:\n" + "\n".join(self.task_errors))
+        elif cancelled:
+            QMessageBox.information(self, "Cancelled",
+                                    f"Cancelled after {succeeded} of {len(task.applicants)} applicants.")
+        elif generating:
+            QMessageBox.information(self, "Recommendation Letter Generated",
+                                    f"{succeeded} recommendation letter(s) have been generated and saved. "
+                                    "They will be sent via email shortly.")
+        else:
+            QMessageBox.information(self, "Application Rejected",
+                                    f"{succeeded} application(s) have been rejected. "
+                                    "An email notification will be sent shortly.")
 
     def closeEvent(self, event):
-        self.db_connection.close()
\ No newline at end of file
+        # Stop a running action after its current applicant
+        self.cancel_task()
+        # The database connections are shared with the rest of the application and stay open
+        super(DatabaseWindow, self).closeEvent(event)
\ No newline at end of file
@@ -1,17 +1,19 @@
 import sqlite3
 from PyQt6.QtWidgets import QMainWindow, QMessageBox
-from PyQt6.uic import loadUi
 from dotenv import load_dotenv
+from LOR_python_app.code import repository
+from LOR_python_app.code.ui_forms import setup_ui
 
 load_dotenv()
 
 
 class FillDetailsWindow(QMainWindow):
-    def __init__(self, username):
+    def __init__(self, session):
         super(FillDetailsWindow, self).__init__()
+        username = session.username
 
-        # Load the .ui file
-        loadUi('../UI/fill_details.ui', self)
+        # Build the UI from the class compiled from fill_details.ui
+        setup_ui(self, "fill_details")
 
         self.setWindowTitle("Fill Details")
 
@@ -21,45 +23,20 @@ class FillDetailsWindow(QMainWindow):
         # Connect the submit button to the submit_details method
         self.submit_button.clicked.connect(self.submit_details)
 
-        # Save the username as an instance variable
+        # Save the session and username as instance variables
+        self.session = session
         self.username = username
 
-        # Update the users table if necessary
-        self.update_users_table()
-
         # Load saved values
         self.load_saved_values(username)
 
         # Set default gender value to Male
         self.gender_input.setCurrentText("Male")
 
-    def update_users_table(self):
-        try:
-            connection = sqlite3.connect("../database/signup.db")
-            cursor = connection.cursor()
-
-            # Check if the columns already exist
-            cursor.execute("PRAGMA table_info(users)")
-            columns = [column[1] for column in cursor.fetchall()]
-            required_columns = ["full_name", "branch", "specialization", "phone", "gender"]  # Include 'gender'
-
-            # Add the columns that do not exist
-            for column in required_columns:
-                if column not in columns:
-                    cursor.execute(f"ALTER TABLE users ADD COLUMN {column} TEXT")
-                    connection.commit()
-
-        except sqlite3.Error as e:
-            QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
-
     def load_saved_values(self, username):
         try:
-            connection = sqlite3.connect("../database/signup.db")
-            cursor = connection.cursor()
-
             # Fetch user details from the database
-            cursor.execute("SELECT full_name, branch, specialization, phone, gender FROM users WHERE name = ?", (username,))
-            user_details = cursor.fetchone()
+            user_details = repository.get_user_details(username)
 
             if user_details:
                 # Populate input fields with saved values
@@ -70,9 +47,6 @@ class FillDetailsWindow(QMainWindow):
                 self.phone_input.setCurrentText(phone)
                 self.gender_input.setCurrentText(gender)
 
-            # Close the connection
-            connection.close()
-
         except sqlite3.Error as e:
             QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
 
@@ -91,18 +65,8 @@ class FillDetailsWindow(QMainWindow):
 
         # Connect to the database and update user details
         try:
-            connection = sqlite3.connect("../database/signup.db")
-            cursor = connection.cursor()
-
             # Update the user details in the database
-            cursor.execute("UPDATE users SET full_name = ?, branch = ?, specialization = ?, phone = ?, gender = ? WHERE name = ?",
-                           (full_name, branch, specialization, phone, gender, self.username))
-
-            # Commit the transaction
-            connection.commit()
-
-            # Close the connection
-            connection.close()
+            repository.update_user_details(self.username, full_name, branch, specialization, phone, gender)
 
             # Display a success message
             QMessageBox.information(self, "Success", "User details updated successfully.")
@@ -0,0 +1,112 @@
+import argparse
+import json
+import os
+import zipfile
+from datetime import datetime
+from LOR_python_app.code.lor_generator import OUTPUT_ROOT
+
+
+def iter_letters(output_root=OUTPUT_ROOT, branch=None, since=None, until=None):
+    """
+    Yield (archive name, path, stat) for every generated letter, walking the
+    branch folders once in name order. since/until are datetimes compared
+    with the letter's modification time.
+    """
+    if branch is not None:
+        branches = [branch]
+    elif os.path.isdir(output_root):
+        branches = sorted(entry.name for entry in os.scandir(output_root) if entry.is_dir())
+    else:
+        # No letter was generated yet
+        return
+    for branch_name in branches:
+        folder = os.path.join(output_root, branch_name)
+        if not os.path.isdir(folder):
+            continue
+        for entry in sorted(os.scandir(folder), key=lambda entry: entry.name):
+            if not entry.is_file() or not entry.name.endswith(".docx"):
+                continue
+            stat = entry.stat()
+            modified = datetime.fromtimestamp(stat.st_mtime)
+            if (since is not None and modified < since) or (until is not None and modified >= until):
+                continue
+            yield f"{branch_name}/{entry.name}", entry.path, stat
+
+
+def load_manifest(manifest_path):
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(manifest_path, manifest):
+    # Write to a temporary file first so an interrupted export keeps the old manifest
+    temporary_path = manifest_path + ".tmp"
+    with open(temporary_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(temporary_path, manifest_path)
+
+
+def export_letters(archive_path, output_root=OUTPUT_ROOT, branch=None, since=None, until=None,
+                   manifest_path=None):
+    """
+    Stream the matching letters into a ZIP archive. With a manifest_path only
+    letters added or changed since the last export using that manifest are
+    written. Returns the number of letters exported.
+    """
+    manifest = load_manifest(manifest_path) if manifest_path is not None else {}
+    exported = 0
+    archive = None
+    try:
+        for name, path, stat in iter_letters(output_root, branch, since, until):
+            version = [stat.st_mtime_ns, stat.st_size]
+            if manifest.get(name) == version:
+                continue
+            # The archive is only created once there is a letter to put in it
+            if archive is None:
+                # Letters are .docx files, which are already compressed, so they are stored as they are
+                archive = zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_STORED)
+            # ZipFile.write copies each file in small chunks, so memory stays bounded however many there are
+            archive.write(path, arcname=name)
+            manifest[name] = version
+            exported += 1
+    finally:
+        if archive is not None:
+            archive.close()
+
+    if exported and manifest_path is not None:
+        save_manifest(manifest_path, manifest)
+    return exported
+
+
+def parse_date(value):
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export generated recommendation letters into a ZIP archive.")
+    parser.add_argument("archive", help="path of the ZIP archive to write")
+    parser.add_argument("--branch", help="only export this branch folder")
+    parser.add_argument("--since", type=parse_date, help="only letters modified on or after YYYY-MM-DD")
+    parser.add_argument("--until", type=parse_date, help="only letters modified before YYYY-MM-DD")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only export letters added or changed since the last incremental export")
+    parser.add_argument("--manifest", help="manifest used by --incremental "
+                                           "(defaults to .export_manifest_<branch>.json in the letters folder)")
+    parser.add_argument("--output", default=OUTPUT_ROOT, help="root folder of the generated letters")
+    args = parser.parse_args()
+
+    manifest_path = None
+    if args.incremental:
+        manifest_path = args.manifest or os.path.join(args.output, f".export_manifest_{args.branch or 'all'}.json")
+
+    exported = export_letters(args.archive, args.output, args.branch, args.since, args.until, manifest_path)
+    if exported:
+        print(f"Exported {exported} letters to {args.archive}")
+    else:
+        print("No letters to export.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+import argparse
+import csv
+import json
+import os
+from LOR_python_app.code import repository
+from LOR_python_app.code.migrations import SIGNUP_MIGRATIONS, migrate
+from LOR_python_app.code.validation import validate_signup
+
+# Optional detail columns; "phone" holds the requirement like in the users table
+DETAIL_FIELDS = ["full_name", "branch", "specialization", "phone", "gender"]
+
+
+def read_students(path):
+    """
+    Read students from a CSV file with a header row or a JSON list of objects.
+    Each student needs name, email and password; the detail fields are optional.
+    """
+    if os.path.splitext(path)[1].lower() == ".json":
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def check_students(records):
+    """
+    Validate every record in one pass. Returns the accepted applicants and
+    a list of (row number, name, reason) rejections.
+    """
+    accepted = []
+    rejected = []
+    seen_names = {}
+    seen_emails = {}
+    for row_number, record in enumerate(records, start=1):
+        name = (record.get("name") or "").strip()
+        email = (record.get("email") or "").strip()
+        password = record.get("password") or ""
+
+        error = validate_signup(name, email, password)
+        if error is None and name in seen_names:
+            error = f"Username already used on row {seen_names[name]}"
+        if error is None and email in seen_emails:
+            error = f"Email already used on row {seen_emails[email]}"
+        if error is not None:
+            rejected.append((row_number, name, error))
+            continue
+
+        seen_names[name] = row_number
+        seen_emails[email] = row_number
+        details = [record.get(field) or None for field in DETAIL_FIELDS]
+        accepted.append((row_number, repository.Applicant(name, email, password, *details)))
+
+    # Check the remaining rows against the database with one query
+    existing = repository.find_existing_users([(a.name, a.email) for _, a in accepted])
+    existing_names = {name for name, _ in existing}
+    existing_emails = {email for _, email in existing}
+    applicants = []
+    for row_number, applicant in accepted:
+        if applicant.name in existing_names:
+            rejected.append((row_number, applicant.name, "Username already exists"))
+        elif applicant.email in existing_emails:
+            rejected.append((row_number, applicant.name, "Email already exists"))
+        else:
+            applicants.append(applicant)
+    rejected.sort()
+    return applicants, rejected
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import students into signup.db from a CSV or JSON file.")
+    parser.add_argument("path", help="CSV (with a header row) or JSON file of students")
+    parser.add_argument("--signup-db", default=repository.SIGNUP_DB_PATH)
+    parser.add_argument("--dry-run", action="store_true", help="validate only, do not insert")
+    args = parser.parse_args()
+
+    repository.configure(signup_path=args.signup_db)
+    # Only signup.db is touched, so admin.db is left alone
+    migrate(repository.signup_db(), SIGNUP_MIGRATIONS)
+
+    records = read_students(args.path)
+    applicants, rejected = check_students(records)
+
+    for row_number, name, reason in rejected:
+        print(f"Row {row_number} ({name or 'no name'}): {reason}")
+
+    if not args.dry_run and applicants:
+        repository.insert_users(applicants)
+    action = "Would import" if args.dry_run else "Imported"
+    print(f"{action} {len(applicants)} of {len(records)} students, rejected {len(rejected)}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,392 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+# The flows run headless, and letters are emailed from memory instead of being written to ../All_LORs
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("LOR_SAVE_LETTERS", "0")
+
+from LOR_python_app.code import mailer, repository
+from LOR_python_app.code.lor_generator import TEMPLATE_PATHS
+from LOR_python_app.code.migrations import run_migrations
+
+# What students type into the details form, spelled the many ways they spell it
+BRANCHES = ["Information Technology", "IT", "Comp Sci", "Computer Engineering", "CSE", "EXTC",
+            "Electronics & Telecom", "Electrical", "Elec Engg", "Electronics"]
+SPECIALIZATIONS = ["Machine Learning", "Data Science", "Web Development", "Cyber Security", "Cloud Computing",
+                   "Embedded Systems", "VLSI Design", "Power Systems", "Signal Processing", "Robotics"]
+FIRST_NAMES = ["Aarav", "Aditi", "Rohan", "Sneha", "Vikram", "Priya", "Karan", "Ananya", "Siddharth", "Neha",
+               "Rahul", "Pooja", "Arjun", "Kavya", "Nikhil", "Riya", "Omkar", "Shruti", "Yash", "Tanvi"]
+LAST_NAMES = ["Sharma", "Patil", "D'Souza", "Iyer", "Kulkarni", "Fernandes", "Joshi", "Nair", "Deshmukh", "Pereira",
+              "Gupta", "Rao", "Mehta", "Pillai", "Shetty"]
+PASSWORD = "password"
+
+# Seconds to wait for the stub SMTP server to receive every queued email
+DELIVERY_TIMEOUT = 300
+
+
+def synthetic_students(count, rng, prefix="load"):
+    """
+    Return count students with realistic names, branches and requirements,
+    as repository.Applicant values.
+    """
+    students = []
+    for i in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        name = f"{prefix}_{first.lower()}{i}"
+        students.append(repository.Applicant(name, f"{prefix}{first.lower()}{i}@student.sfit.ac.in", PASSWORD,
+                                             f"{first} {last}", rng.choice(BRANCHES), rng.choice(SPECIALIZATIONS),
+                                             rng.choice(list(TEMPLATE_PATHS)), rng.choice(["Male", "Female"])))
+    return students
+
+
+def copy_database(source, target):
+    # The backup API gives a consistent copy even while the application has the database open
+    if source is None or not os.path.exists(source):
+        return
+    source_connection, target_connection = sqlite3.connect(source), sqlite3.connect(target)
+    try:
+        source_connection.backup(target_connection)
+    finally:
+        source_connection.close()
+        target_connection.close()
+
+
+def create_scratch_databases(directory, signup_source, admin_source):
+    """
+    Copy the given databases into directory (or start from empty ones), point
+    the repository at the copies and bring them to the current schema.
+    """
+    signup_path, admin_path = os.path.join(directory, "signup.db"), os.path.join(directory, "admin.db")
+    copy_database(signup_source, signup_path)
+    copy_database(admin_source, admin_path)
+    repository.configure(signup_path, admin_path)
+    run_migrations()
+
+
+def insert_admins(count):
+    """
+    Add count admins with professor ids not taken yet. Returns their ids.
+    """
+    taken = {row[0] for row in repository.admin_db().execute("SELECT professor_id FROM admins").fetchall()}
+    professor_ids = [professor_id for professor_id in range(1, 101) if professor_id not in taken][:count]
+    for professor_id in professor_ids:
+        repository.insert_admin(f"Professor {professor_id}", PASSWORD, professor_id)
+    return professor_ids
+
+
+class StubSMTPHandler:
+    """
+    aiosmtpd handler that accepts every message and only counts it.
+    """
+
+    def __init__(self):
+        self.received = 0
+        self._lock = threading.Lock()
+
+    async def handle_DATA(self, server, session, envelope):
+        with self._lock:
+            self.received += 1
+        return "250 Message accepted for delivery"
+
+
+def start_smtp_stub(port):
+    try:
+        from aiosmtpd.controller import Controller
+    except ImportError:
+        raise SystemExit("The load test needs aiosmtpd for its local SMTP server: pip install aiosmtpd")
+    handler = StubSMTPHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    # Send through the stub: no TLS, and no login since it does not authenticate
+    mailer.SMTP_HOST, mailer.SMTP_PORT, mailer.SMTP_STARTTLS = "127.0.0.1", port, False
+    os.environ.pop("PASSWORD", None)
+    return controller, handler
+
+
+def answer_message_boxes(answers):
+    """
+    Make every message box return at once, recording (title, text) in
+    answers, so the flows never wait for a click.
+    """
+    from PyQt6.QtWidgets import QMessageBox
+
+    def record(parent, title, text, *args, **kwargs):
+        answers.append((title, text))
+        return QMessageBox.StandardButton.Yes
+
+    QMessageBox.information = staticmethod(record)
+    QMessageBox.warning = staticmethod(record)
+    QMessageBox.critical = staticmethod(record)
+    QMessageBox.question = staticmethod(record)
+    QMessageBox.exec = lambda box: answers.append((box.windowTitle(), box.text()))
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS; the resource module does not exist on Windows
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def percentile(values, fraction):
+    # Nearest-rank percentile
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def stage_result(latencies, seconds, failures=0):
+    """
+    Summarize a stage: operations, throughput, p50/p99 latency in seconds
+    and the process's peak RSS so far in MB.
+    """
+    return {
+        "operations": len(latencies),
+        "failures": failures,
+        "seconds": seconds,
+        "throughput": len(latencies) / seconds if seconds > 0 else 0.0,
+        "p50": percentile(latencies, 0.50) if latencies else None,
+        "p99": percentile(latencies, 0.99) if latencies else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_stage(operations):
+    """
+    Call every operation in turn and return the stage_result of their timings.
+    """
+    latencies = []
+    start = time.perf_counter()
+    for operation in operations:
+        operation_start = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - operation_start)
+    return stage_result(latencies, time.perf_counter() - start)
+
+
+def last_outbox_id():
+    return repository.signup_db().execute("SELECT IFNULL(MAX(id), 0) FROM outbox").fetchone()[0]
+
+
+def outbox_rows_after(message_id):
+    cursor = repository.signup_db().execute("SELECT created_at, sent_at FROM outbox WHERE id > ? ORDER BY id",
+                                            (message_id,))
+    return cursor.fetchall()
+
+
+def stage_signup(app, students):
+    from LOR_python_app.code.signup import SignUpWindow
+    from LOR_python_app.code.ui_forms import reuse_window
+
+    def sign_up(student):
+        window = reuse_window(SignUpWindow)
+        window.lineEdit.setText(student.name)
+        window.lineEdit_2.setText(student.email)
+        window.lineEdit_3.setText(student.password)
+        window.on_signup_button_clicked()
+        app.processEvents()
+    return run_stage(lambda student=student: sign_up(student) for student in students)
+
+
+def stage_details(app, students):
+    from LOR_python_app.code.login import Login
+    from LOR_python_app.code.ui_forms import reuse_window
+
+    def submit_details(student):
+        # Log in as the student, which opens the details form, and submit it
+        login = reuse_window(Login)
+        login.lineEdit.setText(student.name)
+        login.lineEdit_2.setText(student.password)
+        login.on_login_button_clicked()
+        form = login.fill_details_window
+        form.full_name_input.setText(student.full_name)
+        form.branch_input.setText(student.branch)
+        form.specialization_input.setText(student.specialization)
+        form.phone_input.setCurrentText(student.requirement)
+        form.gender_input.setCurrentText(student.gender)
+        form.submit_details()
+        app.processEvents()
+    return run_stage(lambda student=student: submit_details(student) for student in students)
+
+
+def stage_admin_login(app, professor_ids):
+    """
+    Log in as every admin in turn. Returns the stage result and the login
+    window, which holds the database window of the last admin.
+    """
+    from LOR_python_app.code.login import Login
+    from LOR_python_app.code.ui_forms import reuse_window
+    login = reuse_window(Login)
+
+    def log_in(professor_id):
+        login.lineEdit.setText(str(professor_id))
+        login.lineEdit_2.setText(PASSWORD)
+        login.on_login_button_clicked()
+        app.processEvents()
+    return run_stage(lambda professor_id=professor_id: log_in(professor_id) for professor_id in professor_ids), login
+
+
+def stage_table_open(app, session, repeat):
+    from LOR_python_app.code.database_window import DatabaseWindow
+
+    def open_table():
+        window = DatabaseWindow(session)
+        window.show()
+        app.processEvents()
+        window.close()
+    return run_stage(open_table for _ in range(repeat))
+
+
+def run_bulk_action(app, window, count, action):
+    """
+    Select the first count applicants of the window, run action (e.g.
+    window.generate_selected) and wait for it to finish. The latency of each
+    applicant is the time between the emails queued for consecutive ones.
+    """
+    from PyQt6.QtCore import QItemSelection, QItemSelectionModel
+    model = window.model
+    while model.rowCount() < count and model.canFetchMore():
+        model.fetchMore()
+    count = min(count, model.rowCount())
+    if count == 0:
+        return stage_result([], 0.0)
+    selection = QItemSelection(model.index(0, 0), model.index(count - 1, 0))
+    window.tableView.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.ClearAndSelect
+                                             | QItemSelectionModel.SelectionFlag.Rows)
+
+    first_message_id = last_outbox_id()
+    start_time, start = time.time(), time.perf_counter()
+    action()
+    while window.task is not None:
+        app.processEvents()
+        time.sleep(0.005)
+    seconds = time.perf_counter() - start
+
+    queued_at = [start_time] + [created_at for created_at, _ in outbox_rows_after(first_message_id)]
+    latencies = [later - earlier for earlier, later in zip(queued_at, queued_at[1:])]
+    return stage_result(latencies, seconds, failures=len(window.task_errors))
+
+
+def pending_after(message_id):
+    cursor = repository.signup_db().execute("SELECT COUNT(*) FROM outbox WHERE id > ? AND status = 'pending'",
+                                            (message_id,))
+    return cursor.fetchone()[0]
+
+
+def stage_mail_delivery(first_message_id):
+    """
+    Wait until the emails queued since first_message_id are sent (or given
+    up on). The latency of each email is from queued to sent. Emails left in
+    a copied outbox are delivered to the stub too, but not measured.
+    """
+    start = time.perf_counter()
+    deadline = start + DELIVERY_TIMEOUT
+    while pending_after(first_message_id) and time.perf_counter() < deadline:
+        time.sleep(0.05)
+    seconds = time.perf_counter() - start
+    rows = outbox_rows_after(first_message_id)
+    latencies = [sent_at - created_at for created_at, sent_at in rows if sent_at is not None]
+    if latencies:
+        # Measured from the first email queued, since sending overlaps the bulk actions
+        seconds = max(sent_at for _, sent_at in rows if sent_at is not None) - rows[0][0]
+    return stage_result(latencies, seconds, failures=len(rows) - len(latencies))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive the application's flows headlessly on synthetic data and "
+                                                 "report throughput, latency and memory per stage.")
+    parser.add_argument("--signup-db", default=repository.SIGNUP_DB_PATH,
+                        help="database copied as the starting point (the original is never modified)")
+    parser.add_argument("--admin-db", default=repository.ADMIN_DB_PATH,
+                        help="database copied as the starting point (the original is never modified)")
+    parser.add_argument("--empty", action="store_true", help="start from empty databases instead of copies")
+    parser.add_argument("--students", type=int, default=500, help="students driven through signup and details")
+    parser.add_argument("--preload", type=int, default=5000,
+                        help="students inserted directly beforehand, like the rest of a term")
+    parser.add_argument("--admins", type=int, default=5, help="admins logging in")
+    parser.add_argument("--batch", type=int, default=100, help="applicants per bulk generate and bulk reject")
+    parser.add_argument("--repeat", type=int, default=10, help="times the admin table is opened")
+    parser.add_argument("--smtp-port", type=int, default=8025, help="port of the local stub SMTP server")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the synthetic data")
+    parser.add_argument("--output", default="load_test_results.json", help="file to write the results to")
+    args = parser.parse_args()
+
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+    answers = []
+    answer_message_boxes(answers)
+    controller, handler = start_smtp_stub(args.smtp_port)
+
+    rng = random.Random(args.seed)
+    stages = {}
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            if args.empty:
+                create_scratch_databases(directory, None, None)
+            else:
+                create_scratch_databases(directory, args.signup_db, args.admin_db)
+            repository.insert_users(synthetic_students(args.preload, rng, prefix="term"))
+            professor_ids = insert_admins(args.admins)
+            if not professor_ids:
+                raise SystemExit("No free professor ids left for the load test admins.")
+            students = synthetic_students(args.students, rng)
+
+            print(f"Signing up {len(students)} students...")
+            stages["signup"] = stage_signup(app, students)
+            print("Submitting their details...")
+            stages["details"] = stage_details(app, students)
+            print(f"Logging in {len(professor_ids)} admins...")
+            stages["admin_login"], login = stage_admin_login(app, professor_ids)
+            window = login.database_window
+            print("Opening the admin table...")
+            stages["table_open"] = stage_table_open(app, window.session, args.repeat)
+
+            first_message_id = last_outbox_id()
+            print(f"Generating {args.batch} letters...")
+            stages["bulk_generate"] = run_bulk_action(app, window, args.batch, window.generate_selected)
+            print(f"Rejecting {args.batch} applications...")
+            stages["bulk_reject"] = run_bulk_action(app, window, args.batch, window.reject_selected)
+            print("Waiting for the emails to be delivered...")
+            stages["mail_delivery"] = stage_mail_delivery(first_message_id)
+
+            mailer.start_mail_worker().stop()
+            repository.close_connections()
+    finally:
+        controller.stop()
+
+    results = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": vars(args),
+        "stages": stages,
+        "messages_shown": len(answers),
+        "emails_received": handler.received,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    print()
+    for name, result in stages.items():
+        latency = (f"p50 {result['p50'] * 1000:9.2f} ms  p99 {result['p99'] * 1000:9.2f} ms"
+                   if result["operations"] else "no operations")
+        rss = f"{result['peak_rss_mb']:.0f} MB" if result["peak_rss_mb"] is not None else "n/a"
+        print(f"{name:14} {result['operations']:6d} ops  {result['failures']:4d} failed  "
+              f"{result['throughput']:9.1f} ops/s  {latency}  peak RSS {rss}")
+    print(f"The stub SMTP server received {handler.received} emails.")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
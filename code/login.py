@@ -1,19 +1,25 @@
-import sqlite3
 from PyQt6.QtWidgets import QMainWindow, QLineEdit, QApplication, QMessageBox
-from PyQt6.uic import loadUi
 from LOR_python_app.code.database_window import DatabaseWindow
 from LOR_python_app.code.details import FillDetailsWindow
+from LOR_python_app.code import repository
+from LOR_python_app.code.session import Session
+from LOR_python_app.code.ui_forms import reuse_window, setup_ui
 
 
 class Login(QMainWindow):
     def __init__(self):
         super(Login, self).__init__()
-        loadUi("../UI/login.ui", self)
+        setup_ui(self, "login")
         self.pushButton.clicked.connect(self.on_login_button_clicked)
         self.pushButton_2.clicked.connect(self.show_signup_window)
         self.lineEdit_2.setEchoMode(QLineEdit.EchoMode.Password)
         self.show()
 
+    def reset(self):
+        # Clear the credentials when the window is opened again
+        self.lineEdit.clear()
+        self.lineEdit_2.clear()
+
     def on_login_button_clicked(self):
         # Placeholder for login functionality
         print("Login button clicked")
@@ -24,98 +30,53 @@ class Login(QMainWindow):
         # print("Password:", password)
 
         # Perform authentication
-        if self.authenticate(username, password, professor_id):
-            if self.check_admin(professor_id):
-                self.show_database_contents()
+        session = self.authenticate(username, password, professor_id)
+        if session is not None:
+            if session.is_admin:
+                # Load the letter templates and branch matcher while the admin looks at the table
+                session.warm_up()
+                self.show_database_contents(session)
             else:
-                self.show_user_details(username)
+                self.show_user_details(session)
 
     def show_signup_window(self):
-        from signup import SignUpWindow
+        from LOR_python_app.code.signup import SignUpWindow
         self.close()
-        self.signup_window = SignUpWindow()
+        # Going back and forth between login and signup reuses both windows
+        self.signup_window = reuse_window(SignUpWindow)
         self.signup_window.show()
 
     def authenticate(self, username, password, professor_id):
+        """
+        Return the Session of the admin or student the credentials belong
+        to, or None if they are invalid.
+        """
         try:
-            connection = sqlite3.connect("../database/admin.db")
-            cursor = connection.cursor()
-
             # Fetch the row corresponding to the logged-in professor_id
-            cursor.execute("SELECT * FROM admins WHERE professor_id = ? AND password_admin = ?",
-                           (professor_id, password))
-            admin_row = cursor.fetchone()
+            admin = repository.find_admin(professor_id, password)
             print(professor_id)
-            if admin_row is not None:
-                # Fetch all rows except the one corresponding to the logged-in professor_id
-                cursor.execute("SELECT * FROM admins WHERE professor_id != ?", (professor_id,))
-                remaining_rows = cursor.fetchall()
-
-                #thanks mom
-                cursor.execute("SELECT count(*) FROM admins WHERE professor_id = ?", (professor_id,))
-                row_count = cursor.fetchone()
-                # print("Number of Rows: " , row_count)
-
-                # Delete all rows except the one corresponding to the logged-in professor_id
-                cursor.execute("DELETE FROM admins WHERE professor_id != ?", (professor_id,))
-                if row_count == 0:
-                    # Re-insert the row corresponding to the logged-in professor_id at the top
-                    cursor.execute("INSERT INTO admins (username, password_admin, professor_id) VALUES (?, ?, ?)",
-                                   admin_row)
-
-                # Re-insert the remaining rows below the moved row
-                for row in remaining_rows:
-                     cursor.execute("INSERT INTO admins (username, password_admin, professor_id) VALUES (?, ?, ?)", row)
-
-                connection.commit()  # Commit the changes
-                connection.close()
-                return True
+            if admin is not None:
+                # Remember who logged in, letter runs outside the application are signed by the latest admin
+                repository.record_admin_login(admin.professor_id)
+                return Session(admin.username, admin)
             else:
                 # Check if the user exists in the signup database
-                connection = sqlite3.connect("../database/signup.db")
-                cursor = connection.cursor()
-                cursor.execute("SELECT * FROM users WHERE name = ? AND password = ?", (username, password))
-                user = cursor.fetchone()
-                connection.close()
-                if user is not None:
-                    return True
+                if repository.user_credentials_valid(username, password):
+                    return Session(username)
                 else:
                     self.show_error("Error", "Invalid username or password.")
-                    return False
+                    return None
         except Exception as e:
             print("Error occurred while authenticating:", e)
-            return False
-
-    def check_admin(self, professor_id):
-        try:
-            connection = sqlite3.connect("../database/admin.db")
-            cursor = connection.cursor()
-            cursor.execute("SELECT * FROM admins WHERE professor_id = ?", (professor_id,))
-            admin = cursor.fetchone()
-            connection.close()
-            return admin is not None
-        except Exception as e:
-            print("Error occurred while checking admin:", e)
-            return False
-
-    def show_database_contents(self):
-        # Retrieve database contents
-        connection = sqlite3.connect("../database/signup.db")
-        cursor = connection.cursor()
-        cursor.execute("SELECT * FROM users")
-        data = cursor.fetchall()
-        connection.close()
-
-        # Display database contents
-        print("Database Contents:")
-        for row in data:
-            print(row)
+            return None
 
-        self.database_window = DatabaseWindow(data)
+    def show_database_contents(self, session):
+        # The window reads the applicants from the database itself as the table scrolls
+        self.database_window = reuse_window(DatabaseWindow, session)
         self.database_window.show()
 
-    def show_user_details(self, username):
-        self.fill_details_window = FillDetailsWindow(username)
+    def show_user_details(self, session):
+        self.fill_details_window = FillDetailsWindow(session)
         self.fill_details_window.show()
 
     def show_error(self, title, message):
@@ -128,6 +89,6 @@ class Login(QMainWindow):
 
 def main():
     app = QApplication([])
-    login_window = Login()
+    login_window = reuse_window(Login)
     login_window.show()
     app.exec_()
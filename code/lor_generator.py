@@ -0,0 +1,172 @@
+import hashlib
+import io
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from LOR_python_app.code import metrics, repository
+from LOR_python_app.code.lor_templates import get_compiled_template
+
+# Letter template used for each requirement
+TEMPLATE_PATHS = {
+    "Higher Studies": "../LOR.docx",
+    "Professional": "../LOR1.docx",
+}
+
+# Root folder for the generated recommendation letters
+OUTPUT_ROOT = "../All_LORs"
+
+# Set LOR_SAVE_LETTERS=0 to only email letters rendered in memory, without keeping a copy under OUTPUT_ROOT
+SAVE_LETTERS = os.getenv("LOR_SAVE_LETTERS", "1") != "0"
+
+
+def get_template_path(requirement):
+    """
+    Return the letter template for the given requirement, or None if the
+    requirement is not one of the supported ones.
+    """
+    return TEMPLATE_PATHS.get(requirement)
+
+
+def get_pronouns(gender):
+    # Determine pronouns based on the gender
+    if gender.lower() == "male":
+        return "he", "his", "him"
+    return "she", "her", "her"
+
+
+def build_replacements(username, full_name, branch, specialization, requirement, gender, admin_username):
+    he_or_she, his_or_her, him_or_her = get_pronouns(gender)
+    return {
+        "full_name": full_name,
+        "branch": branch,
+        "specialization": specialization,
+        "phone": requirement,
+        "username": username,
+        "admin_username": admin_username,
+        "he_or_she": he_or_she,
+        "his_or_her": his_or_her,
+        "him_or_her": him_or_her,
+    }
+
+
+@dataclass
+class LetterJob:
+    """
+    Everything needed to render one letter, in plain values so it can be sent
+    to a worker process.
+    """
+    username: str
+    template_path: str
+    template_digest: str
+    replacements: dict
+    content_hash: str
+    file_path: str
+
+
+def plan_letter(username, full_name, branch, specialization, requirement, gender, admin_username,
+                selected_branch, output_root=OUTPUT_ROOT):
+    letter_template_path = get_template_path(requirement)
+    if letter_template_path is None:
+        raise ValueError("Requirement must be either 'Higher Studies' or 'Professional'.")
+    template = get_compiled_template(letter_template_path)
+    replacements = build_replacements(username, full_name, branch, specialization, requirement, gender,
+                                      admin_username)
+
+    # The letter only changes when the template or one of the substituted values does
+    key = json.dumps([template.digest, selected_branch, replacements], sort_keys=True)
+    content_hash = hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    # Content-addressed file name, so students sharing a full name do not overwrite each other
+    file_path = os.path.join(output_root, selected_branch, f"{full_name}_LOR_{content_hash[:12]}.docx")
+    return LetterJob(username, letter_template_path, template.digest, replacements, content_hash, file_path)
+
+
+def render_letter(job):
+    # Fill in the placeholders of the compiled letter template and save it as a Word document
+    os.makedirs(os.path.dirname(job.file_path), exist_ok=True)  # Create the folder if it doesn't exist
+    get_compiled_template(job.template_path).save(job.replacements, job.file_path)
+
+
+def render_letter_data(job):
+    # Same as render_letter, into memory instead of a file
+    buffer = io.BytesIO()
+    get_compiled_template(job.template_path).save(job.replacements, buffer)
+    return buffer.getvalue()
+
+
+# Letters rendered in memory are written to disk one at a time on this thread
+_letter_writer = None
+_letter_writer_lock = threading.Lock()
+
+
+def _write_letter(job, data):
+    try:
+        os.makedirs(os.path.dirname(job.file_path), exist_ok=True)
+        with open(job.file_path, "wb") as f:
+            f.write(data)
+        record_letter(job)
+    except Exception as e:
+        print("Error occurred while saving the recommendation letter:", e)
+        raise
+
+
+def save_letter_in_background(job, data):
+    """
+    Write a letter rendered in memory to job.file_path and record it, without
+    waiting for the disk. Returns a Future.
+    """
+    global _letter_writer
+    with _letter_writer_lock:
+        if _letter_writer is None:
+            # Its thread is not a daemon, so pending letters are still written when the application exits
+            _letter_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="letter-writer")
+        return _letter_writer.submit(_write_letter, job, data)
+
+
+def find_cached_letter(job):
+    """
+    Return the path of an identical letter generated earlier, or None.
+    """
+    file_path = repository.find_generated_letter(job.content_hash)
+    if file_path is not None and os.path.exists(file_path):
+        return file_path
+    return None
+
+
+def record_letter(job):
+    # Remember the new letter and remove the student's letters it replaces
+    for file_path in repository.record_generated_letter(job.username, job.content_hash, job.file_path,
+                                                        job.template_digest):
+        if file_path != job.file_path and os.path.exists(file_path):
+            os.remove(file_path)
+
+
+def generate_lor_data(username, full_name, branch, specialization, requirement, gender, admin_username,
+                      selected_branch=None, output_root=OUTPUT_ROOT, save=SAVE_LETTERS):
+    """
+    Render the recommendation letter for one student in memory, ready to be
+    attached to an email. Returns (file name, docx bytes). Unless save is
+    false, a copy is written under <output_root>/<selected_branch>/ in the
+    background. An unchanged letter saved before is read back instead of
+    rendered.
+    """
+    if selected_branch is None:
+        from LOR_python_app.code.branch_matcher import get_branch_similarity
+        selected_branch = get_branch_similarity(branch)
+
+    job = plan_letter(username, full_name, branch, specialization, requirement, gender, admin_username,
+                      selected_branch, output_root)
+    file_name = os.path.basename(job.file_path)
+    cached_path = find_cached_letter(job)
+    if cached_path is not None:
+        metrics.increment("lor_letters_total", result="cached")
+        with open(cached_path, "rb") as f:
+            return file_name, f.read()
+
+    metrics.increment("lor_letters_total", result="rendered")
+    data = render_letter_data(job)
+    if save:
+        save_letter_in_background(job, data)
+    return file_name, data
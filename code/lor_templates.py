@@ -0,0 +1,132 @@
+import hashlib
+import io
+import os
+import re
+import threading
+from copy import deepcopy
+from docx import Document
+from docx.opc.part import XmlPart
+from docx.oxml.ns import qn
+from LOR_python_app.code import metrics
+
+# A placeholder looks like {full_name}
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+
+W_P = qn("w:p")
+W_T = qn("w:t")
+XML_SPACE = qn("xml:space")
+
+
+def _paragraph_texts(paragraph):
+    # Text elements that belong to this paragraph and not to a nested one (e.g. a text box)
+    return [t for t in paragraph.iter(W_T) if next(t.iterancestors(W_P)) is paragraph]
+
+
+def _merge_split_placeholders(paragraph):
+    """
+    Word often splits "{full_name}" over several runs ("{", "full_name", "}").
+    Move every placeholder into the run where it starts so it can be
+    replaced with a single text substitution later.
+    """
+    texts = _paragraph_texts(paragraph)
+    if len(texts) < 2:
+        return
+    joined = "".join(t.text or "" for t in texts)
+
+    # Which text element owns each character of the paragraph
+    owners = []
+    for index, t in enumerate(texts):
+        owners.extend([index] * len(t.text or ""))
+
+    changed = False
+    for match in PLACEHOLDER_PATTERN.finditer(joined):
+        owner = owners[match.start()]
+        if owners[match.end() - 1] != owner:
+            owners[match.start():match.end()] = [owner] * (match.end() - match.start())
+            changed = True
+    if not changed:
+        return
+
+    new_texts = [[] for _ in texts]
+    for char, owner in zip(joined, owners):
+        new_texts[owner].append(char)
+    for t, chars in zip(texts, new_texts):
+        t.text = "".join(chars)
+        t.set(XML_SPACE, "preserve")
+
+
+class CompiledTemplate:
+    """
+    A letter template parsed once, with the location of every placeholder
+    in the body, tables, headers and footers recorded up front.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.mtime = os.stat(path).st_mtime_ns
+        with open(path, "rb") as f:
+            data = f.read()
+        # Identifies the template version in the generated letters manifest
+        self.digest = hashlib.sha256(data).hexdigest()
+        self.document = Document(io.BytesIO(data))
+        self.placeholders = set()
+        self._lock = threading.Lock()
+
+        # (part, original element, [(text element index, text with placeholders)])
+        self._parts = []
+        for part in self.document.part.package.iter_parts():
+            if not isinstance(part, XmlPart):
+                continue
+            element = part._element
+            for paragraph in element.iter(W_P):
+                _merge_split_placeholders(paragraph)
+            slots = []
+            for index, t in enumerate(element.iter(W_T)):
+                if t.text and PLACEHOLDER_PATTERN.search(t.text):
+                    slots.append((index, t.text))
+                    self.placeholders.update(PLACEHOLDER_PATTERN.findall(t.text))
+            if slots:
+                self._parts.append((part, element, slots))
+
+    def save(self, values, target):
+        """
+        Render the template with the given {placeholder: value} mapping and
+        save it to target (a path or a writable binary stream). Unknown
+        placeholders are left untouched.
+        """
+        def substitute(match):
+            return values.get(match.group(1), match.group(0))
+
+        with self._lock:
+            # Substitute on copies of the parts, so the compiled tree stays pristine
+            with metrics.span("lor_template_fill_seconds"):
+                for part, element, slots in self._parts:
+                    rendered = deepcopy(element)
+                    texts = list(rendered.iter(W_T))
+                    for index, text in slots:
+                        texts[index].text = PLACEHOLDER_PATTERN.sub(substitute, text)
+                    part._element = rendered
+            try:
+                with metrics.span("lor_template_save_seconds"):
+                    self.document.save(target)
+            finally:
+                for part, element, _ in self._parts:
+                    part._element = element
+
+
+# Compiled templates by path, recompiled when the file changes on disk
+_compiled_templates = {}
+_compile_lock = threading.Lock()
+
+
+def get_compiled_template(path):
+    mtime = os.stat(path).st_mtime_ns
+    template = _compiled_templates.get(path)
+    if template is not None and template.mtime == mtime:
+        return template
+    with _compile_lock:
+        template = _compiled_templates.get(path)
+        if template is None or template.mtime != mtime:
+            template = CompiledTemplate(path)
+            _compiled_templates[path] = template
+        return template
@@ -0,0 +1,213 @@
+import os
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+from dotenv import load_dotenv
+from LOR_python_app.code import metrics, repository
+
+load_dotenv()
+
+# SMTP settings, overridable so a local stand-in server (e.g. aiosmtpd) can be used
+SMTP_HOST = os.getenv('SMTP_HOST', 'smtp.gmail.com')
+SMTP_PORT = int(os.getenv('SMTP_PORT', '587'))
+SMTP_STARTTLS = os.getenv('SMTP_STARTTLS', '1') == '1'
+
+# MIME type recommendation letters are attached with
+DOCX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Messages sent over one connection before checking the outbox again
+BATCH_SIZE = 20
+# Retry a failed message after RETRY_BASE_DELAY * 2 ** (attempts - 1) seconds
+RETRY_BASE_DELAY = 30
+RETRY_MAX_DELAY = 3600
+MAX_ATTEMPTS = 5
+# Close the SMTP connection after this many idle seconds
+IDLE_TIMEOUT = 60
+
+
+def queue_email(recipient, subject, body, attachment=None, attachment_name=None,
+                attachment_type="application/octet-stream", username=None, application_status=None):
+    """
+    Store a message in the outbox and wake the background sender. If
+    username and application_status are given, the student is moved to that
+    status in the same transaction. Returns the outbox id of the message.
+    """
+    now = time.time()
+    connection = repository.signup_db()
+    with connection:
+        cursor = connection.execute(
+            "INSERT INTO outbox (recipient, subject, body, attachment, attachment_name, attachment_type, "
+            "next_attempt_at, created_at, username, application_status) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (recipient, subject, body, attachment, attachment_name, attachment_type, now, now,
+             username, application_status))
+        if username is not None and application_status is not None:
+            repository.set_application_status([username], application_status)
+    metrics.increment("lor_mail_queued_total")
+    start_mail_worker().wake()
+    return cursor.lastrowid
+
+
+def queue_letter_email(recipient_email, letter_data, file_name, username):
+    # Attach the recommendation letter rendered in memory as a Word document
+    return queue_email(recipient_email, 'Recommendation Letter', 'Please find the attached recommendation letter.',
+                       letter_data, file_name, DOCX_MIME_TYPE, username, repository.STATUS_GENERATED)
+
+
+def queue_rejection_email(recipient_email, username):
+    return queue_email(recipient_email, 'Application Rejection',
+                       'Dear Applicant,\n\nYour application has been rejected. '
+                       'If you have any questions, please contact the authority.',
+                       username=username, application_status=repository.STATUS_REJECTED)
+
+
+def get_delivery_status(message_id):
+    """
+    Return (status, attempts, last_error, sent_at) for an outbox message.
+    """
+    connection = repository.signup_db()
+    cursor = connection.execute("SELECT status, attempts, last_error, sent_at FROM outbox WHERE id = ?",
+                                (message_id,))
+    return cursor.fetchone()
+
+
+def build_message(recipient, subject, body, attachment, attachment_name, attachment_type):
+    msg = EmailMessage()
+    msg['Subject'] = subject
+    msg['From'] = os.getenv('MY_MAIL')  # Sender's email
+    msg['To'] = recipient
+    msg.set_content(body)
+    if attachment is not None:
+        maintype, subtype = (attachment_type or "application/octet-stream").split("/", 1)
+        msg.add_attachment(attachment, maintype=maintype, subtype=subtype, filename=attachment_name)
+    return msg
+
+
+class MailWorker(threading.Thread):
+    """
+    Background sender that drains the outbox over one authenticated SMTP
+    connection, retrying failed messages with exponential backoff.
+    """
+
+    def __init__(self):
+        super(MailWorker, self).__init__(name="mail-worker", daemon=True)
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._smtp = None
+        self._last_used = 0
+
+    def wake(self):
+        self._wake_event.set()
+
+    def stop(self):
+        self._stop_event.set()
+        self._wake_event.set()
+
+    def run(self):
+        connection = repository.signup_db()
+        try:
+            while not self._stop_event.is_set():
+                if self.send_batch(connection):
+                    continue
+
+                # Nothing due: sleep until woken or until the next retry is due
+                cursor = connection.execute("SELECT MIN(next_attempt_at) FROM outbox WHERE status = 'pending'")
+                next_attempt_at = cursor.fetchone()[0]
+                timeout = IDLE_TIMEOUT
+                if next_attempt_at is not None:
+                    timeout = min(max(0, next_attempt_at - time.time()), IDLE_TIMEOUT)
+                woken = self._wake_event.wait(timeout)
+                self._wake_event.clear()
+
+                # Do not hold the SMTP connection open while idle
+                if not woken and time.time() - self._last_used >= IDLE_TIMEOUT:
+                    self._disconnect()
+        finally:
+            self._disconnect()
+            repository.close_connections()
+
+    def send_batch(self, connection):
+        """
+        Send up to BATCH_SIZE due messages. Returns the number of messages handled.
+        """
+        cursor = connection.execute(
+            "SELECT id, recipient, subject, body, attachment, attachment_name, attachment_type, attempts, "
+            "username, application_status "
+            "FROM outbox WHERE status = 'pending' AND next_attempt_at <= ? ORDER BY next_attempt_at LIMIT ?",
+            (time.time(), BATCH_SIZE))
+        rows = cursor.fetchall()
+        for (message_id, recipient, subject, body, attachment, name, attachment_type, attempts,
+             username, application_status) in rows:
+            try:
+                msg = build_message(recipient, subject, body, attachment, name, attachment_type)
+                with metrics.span("lor_mail_send_seconds"):
+                    self._connection().send_message(msg)
+                self._last_used = time.time()
+            except Exception as e:
+                print("Error occurred while sending email:", e)
+                metrics.increment("lor_mail_failures_total")
+                if isinstance(e, (smtplib.SMTPServerDisconnected, OSError)):
+                    self._disconnect()
+                self._record_failure(connection, message_id, attempts + 1, e)
+            else:
+                metrics.increment("lor_mail_sent_total")
+                with connection:
+                    # The attachment is not needed once delivered, so letters do not pile up in signup.db
+                    connection.execute("UPDATE outbox SET status = 'sent', attempts = ?, sent_at = ?, "
+                                       "last_error = NULL, attachment = NULL WHERE id = ?",
+                                       (attempts + 1, time.time(), message_id))
+                    # A delivered letter completes the application, unless it was handled again since
+                    if username is not None and application_status == repository.STATUS_GENERATED:
+                        repository.set_application_status([username], repository.STATUS_SENT,
+                                                          only_from=repository.STATUS_GENERATED)
+        return len(rows)
+
+    def _record_failure(self, connection, message_id, attempts, error):
+        if attempts >= MAX_ATTEMPTS:
+            status, next_attempt_at = 'failed', time.time()
+        else:
+            delay = min(RETRY_BASE_DELAY * 2 ** (attempts - 1), RETRY_MAX_DELAY)
+            status, next_attempt_at = 'pending', time.time() + delay
+        with connection:
+            connection.execute("UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ? "
+                               "WHERE id = ?", (status, attempts, next_attempt_at, str(error), message_id))
+
+    def _connection(self):
+        # Reuse the open connection, checking it is still alive if it sat idle for a while
+        if self._smtp is not None and time.time() - self._last_used > 10:
+            try:
+                self._smtp.noop()
+            except (smtplib.SMTPException, OSError):
+                self._disconnect()
+        if self._smtp is None:
+            smtp = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30)
+            if SMTP_STARTTLS:
+                smtp.starttls()
+            if os.getenv('MY_MAIL') and os.getenv('PASSWORD'):
+                smtp.login(os.getenv('MY_MAIL'), os.getenv('PASSWORD'))
+            self._smtp = smtp
+        return self._smtp
+
+    def _disconnect(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
+
+
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def start_mail_worker():
+    """
+    Start the background sender if it is not running yet and return it.
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = MailWorker()
+            _worker.start()
+        return _worker
@@ -0,0 +1,160 @@
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+
+# Set LOR_METRICS=1 to record metrics, or LOR_METRICS_FILE to also write them to that file on exit
+# (Prometheus text format for a .prom file, JSON otherwise)
+METRICS_FILE = os.getenv("LOR_METRICS_FILE")
+_enabled = os.getenv("LOR_METRICS", "0") != "0" or METRICS_FILE is not None
+
+# Upper bounds of the latency histogram buckets, in seconds
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# {(name, labels): value} and {(name, labels): [bucket counts..., +Inf bucket count, count, sum]}
+_counters = {}
+_histograms = {}
+_lock = threading.Lock()
+
+# Returned by span() while disabled, so a disabled span costs one function call
+_NO_SPAN = nullcontext()
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def is_enabled():
+    return _enabled
+
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def increment(name, amount=1, **labels):
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+def observe(name, seconds, **labels):
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = [0] * (len(BUCKETS) + 3)
+        histogram[bisect_left(BUCKETS, seconds)] += 1
+        histogram[-2] += 1
+        histogram[-1] += seconds
+
+
+@contextmanager
+def _span(name, labels):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+
+def span(name, **labels):
+    """
+    Time the enclosed block into the latency histogram name, e.g.
+    with metrics.span("lor_template_save_seconds"): ...
+    """
+    if not _enabled:
+        return _NO_SPAN
+    return _span(name, labels)
+
+
+def timed(name, **labels):
+    """
+    Decorator timing every call into the histogram name, labelled with the
+    function's name as operation.
+    """
+    def decorator(function):
+        operation_labels = dict(labels, operation=function.__name__)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                observe(name, time.perf_counter() - start, **operation_labels)
+        return wrapper
+    return decorator
+
+
+def snapshot():
+    """
+    Return the current counters and histograms as plain JSON-ready values.
+    """
+    with _lock:
+        counters = [{"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(_counters.items())]
+        histograms = [{"name": name, "labels": dict(labels), "count": histogram[-2], "sum": histogram[-1],
+                       "buckets": dict(zip([str(bound) for bound in BUCKETS] + ["+Inf"], histogram[:-2]))}
+                      for (name, labels), histogram in sorted(_histograms.items())]
+    return {"counters": counters, "histograms": histograms}
+
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in pairs) + "}"
+
+
+def render_prometheus():
+    """
+    Return the metrics in the Prometheus text exposition format.
+    """
+    lines = []
+    with _lock:
+        counters = sorted(_counters.items())
+        histograms = sorted((key, list(histogram)) for key, histogram in _histograms.items())
+
+    declared = set()
+    for (name, labels), value in counters:
+        if name not in declared:
+            lines.append(f"# TYPE {name} counter")
+            declared.add(name)
+        lines.append(f"{name}{_format_labels(labels)} {value}")
+    for (name, labels), histogram in histograms:
+        if name not in declared:
+            lines.append(f"# TYPE {name} histogram")
+            declared.add(name)
+        # Prometheus buckets are cumulative
+        cumulative = 0
+        for bound, count in zip([str(bound) for bound in BUCKETS] + ["+Inf"], histogram[:-2]):
+            cumulative += count
+            lines.append(f"{name}_bucket{_format_labels(labels, [('le', bound)])} {cumulative}")
+        lines.append(f"{name}_count{_format_labels(labels)} {histogram[-2]}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {histogram[-1]}")
+    return "\n".join(lines) + "\n"
+
+
+def dump(path):
+    if path.endswith(".prom"):
+        text = render_prometheus()
+    else:
+        text = json.dumps(snapshot(), indent=2)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+if METRICS_FILE is not None:
+    atexit.register(dump, METRICS_FILE)
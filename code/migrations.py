@@ -0,0 +1,235 @@
+import sqlite3
+from LOR_python_app.code import repository
+
+# Detail columns older signup databases may be missing; they used to be added by the details window
+DETAIL_COLUMNS = ["full_name", "branch", "specialization", "phone", "gender"]
+
+# Columns the admin view sorts and filters on (see applicant_model)
+VIEW_COLUMNS = ["name", "email", "full_name", "branch", "specialization", "phone", "gender"]
+# Of those, the UNIQUE NOT NULL columns: they are sorted on as they are, through their unique index
+UNIQUE_COLUMNS = ["name", "email"]
+
+
+def _create_users_table(connection):
+    connection.execute("""CREATE TABLE IF NOT EXISTS users (
+                              name TEXT NOT NULL UNIQUE,
+                              email TEXT NOT NULL UNIQUE,
+                              password TEXT NOT NULL,
+                              full_name TEXT,
+                              branch TEXT,
+                              specialization TEXT,
+                              phone TEXT,
+                              gender TEXT)""")
+    columns = [column[1] for column in connection.execute("PRAGMA table_info(users)").fetchall()]
+    for column in DETAIL_COLUMNS:
+        if column not in columns:
+            connection.execute(f"ALTER TABLE users ADD COLUMN {column} TEXT")
+
+
+def _create_unique_index(connection, name, table, column):
+    # Databases created before the constraint existed may already hold duplicates
+    duplicate = connection.execute(f"SELECT 1 FROM {table} GROUP BY {column} HAVING COUNT(*) > 1 LIMIT 1").fetchone()
+    connection.execute(f"DROP INDEX IF EXISTS {name}")
+    if duplicate is None:
+        connection.execute(f"CREATE UNIQUE INDEX {name} ON {table} ({column})")
+    else:
+        print(f"Warning: duplicate {table}.{column} values found, creating a non-unique index")
+        connection.execute(f"CREATE INDEX {name} ON {table} ({column})")
+
+
+def _has_unique_constraint(connection, table, column):
+    # A UNIQUE constraint shows up as an index with origin 'u'
+    for _, name, _, origin, _ in connection.execute(f"PRAGMA index_list({table})").fetchall():
+        if origin == "u":
+            columns = [info[2] for info in connection.execute(f"PRAGMA index_info({name})").fetchall()]
+            if columns == [column]:
+                return True
+    return False
+
+
+def _create_users_indexes(connection):
+    # Only legacy tables lack the UNIQUE constraints of _create_users_table, which already index the column
+    for column in UNIQUE_COLUMNS:
+        if not _has_unique_constraint(connection, "users", column):
+            _create_unique_index(connection, f"idx_users_{column}_lookup", "users", column)
+    for column in VIEW_COLUMNS:
+        if column not in UNIQUE_COLUMNS:
+            connection.execute(f"CREATE INDEX IF NOT EXISTS idx_users_{column} ON users (IFNULL({column}, ''))")
+
+
+def _create_outbox_table(connection):
+    connection.execute("""CREATE TABLE IF NOT EXISTS outbox (
+                              id INTEGER PRIMARY KEY AUTOINCREMENT,
+                              recipient TEXT NOT NULL,
+                              subject TEXT NOT NULL,
+                              body TEXT NOT NULL,
+                              attachment BLOB,
+                              attachment_name TEXT,
+                              attachment_type TEXT,
+                              status TEXT NOT NULL DEFAULT 'pending',
+                              attempts INTEGER NOT NULL DEFAULT 0,
+                              next_attempt_at REAL NOT NULL,
+                              last_error TEXT,
+                              created_at REAL NOT NULL,
+                              sent_at REAL)""")
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_outbox_pending ON outbox (status, next_attempt_at)")
+
+
+def _create_generated_letters_table(connection):
+    connection.execute("""CREATE TABLE IF NOT EXISTS generated_letters (
+                              content_hash TEXT PRIMARY KEY,
+                              username TEXT NOT NULL,
+                              file_path TEXT NOT NULL,
+                              template_digest TEXT NOT NULL,
+                              created_at REAL NOT NULL)""")
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_generated_letters_username ON generated_letters (username)")
+
+
+def _add_users_archived_at(connection):
+    # Archived applicants stay in the database but are hidden from the admin view and the letter runs
+    connection.execute("ALTER TABLE users ADD COLUMN archived_at REAL")
+    connection.execute("CREATE INDEX idx_users_archived_at ON users (archived_at)")
+
+
+def _create_users_search_index(connection):
+    # Full-text index over the free-text columns, stored as rowid references into users
+    try:
+        connection.execute("""CREATE VIRTUAL TABLE users_search USING fts5(
+                                  full_name, branch, specialization,
+                                  content='users', content_rowid='rowid',
+                                  prefix='2 3')""")
+    except sqlite3.OperationalError as e:
+        # SQLite builds without FTS5 fall back to LIKE searches, see applicant_model
+        print("Warning: full-text search is not available:", e)
+        return
+    # The triggers keep the index in step with every insert, delete and update of users
+    connection.execute("""CREATE TRIGGER users_search_insert AFTER INSERT ON users BEGIN
+                              INSERT INTO users_search (rowid, full_name, branch, specialization)
+                              VALUES (new.rowid, new.full_name, new.branch, new.specialization);
+                          END""")
+    connection.execute("""CREATE TRIGGER users_search_delete AFTER DELETE ON users BEGIN
+                              INSERT INTO users_search (users_search, rowid, full_name, branch, specialization)
+                              VALUES ('delete', old.rowid, old.full_name, old.branch, old.specialization);
+                          END""")
+    connection.execute("""CREATE TRIGGER users_search_update AFTER UPDATE OF full_name, branch, specialization
+                          ON users BEGIN
+                              INSERT INTO users_search (users_search, rowid, full_name, branch, specialization)
+                              VALUES ('delete', old.rowid, old.full_name, old.branch, old.specialization);
+                              INSERT INTO users_search (rowid, full_name, branch, specialization)
+                              VALUES (new.rowid, new.full_name, new.branch, new.specialization);
+                          END""")
+    connection.execute("INSERT INTO users_search (users_search) VALUES ('rebuild')")
+
+
+def _create_branch_taxonomy_table(connection):
+    # Aliases mapping what students type to the branch folders; when empty, branches.json is used
+    connection.execute("""CREATE TABLE branch_taxonomy (
+                              alias TEXT PRIMARY KEY,
+                              branch TEXT NOT NULL)""")
+
+
+def _add_application_status(connection):
+    # Where each application stands, so the admin view and letter runs only load the pending ones
+    connection.execute("ALTER TABLE users ADD COLUMN status TEXT NOT NULL DEFAULT 'pending'")
+    for column in ("generated_at", "sent_at", "rejected_at"):
+        connection.execute(f"ALTER TABLE users ADD COLUMN {column} REAL")
+    # archived_at is in the index too, so "pending and not archived" is one index range in rowid order
+    connection.execute("CREATE INDEX idx_users_status ON users (status, archived_at)")
+    # The student a message is about and the status it reports, so delivering a letter marks it sent
+    connection.execute("ALTER TABLE outbox ADD COLUMN username TEXT")
+    connection.execute("ALTER TABLE outbox ADD COLUMN application_status TEXT")
+
+    # Work out the status of existing applications from the letters generated and the emails queued so far
+    connection.execute("""UPDATE users SET status = 'generated',
+                              generated_at = (SELECT created_at FROM generated_letters g WHERE g.username = users.name)
+                          WHERE name IN (SELECT username FROM generated_letters)""")
+    connection.execute("""UPDATE users SET status = 'sent',
+                              sent_at = (SELECT MAX(sent_at) FROM outbox o WHERE o.recipient = users.email
+                                         AND o.subject = 'Recommendation Letter' AND o.status = 'sent')
+                          WHERE email IN (SELECT recipient FROM outbox
+                                          WHERE subject = 'Recommendation Letter' AND status = 'sent')""")
+    connection.execute("""UPDATE users SET
+                              rejected_at = (SELECT MAX(created_at) FROM outbox o WHERE o.recipient = users.email
+                                             AND o.subject = 'Application Rejection')
+                          WHERE email IN (SELECT recipient FROM outbox WHERE subject = 'Application Rejection')""")
+    connection.execute("""UPDATE users SET status = 'rejected'
+                          WHERE rejected_at > MAX(IFNULL(generated_at, 0), IFNULL(sent_at, 0))""")
+
+
+def _drop_duplicate_users_indexes(connection):
+    # Databases migrated before _create_users_indexes checked for the UNIQUE constraints got extra
+    # indexes on name and email that only slow down inserts
+    for column in UNIQUE_COLUMNS:
+        connection.execute(f"DROP INDEX IF EXISTS idx_users_{column}")
+        if _has_unique_constraint(connection, "users", column):
+            connection.execute(f"DROP INDEX IF EXISTS idx_users_{column}_lookup")
+
+
+def _create_users_status_sort_indexes(connection):
+    # The admin view lists one status at a time, sorted by one of its columns. With these a page is one
+    # range of an index in display order, instead of sorting every applicant in the status for each page.
+    for column in VIEW_COLUMNS:
+        key = column if column in UNIQUE_COLUMNS else f"IFNULL({column}, '')"
+        connection.execute(f"CREATE INDEX idx_users_status_{column} ON users (status, archived_at, {key})")
+
+
+def _create_admins_table(connection):
+    connection.execute("""CREATE TABLE IF NOT EXISTS admins (
+                              username TEXT NOT NULL,
+                              password_admin TEXT NOT NULL,
+                              professor_id INTEGER NOT NULL CHECK (professor_id BETWEEN 1 AND 100))""")
+
+
+def _create_admins_indexes(connection):
+    _create_unique_index(connection, "idx_admins_professor_id", "admins", "professor_id")
+
+
+def _add_admins_last_login(connection):
+    connection.execute("ALTER TABLE admins ADD COLUMN last_login REAL")
+    connection.execute("CREATE INDEX idx_admins_last_login ON admins (last_login)")
+
+
+# Migration N brings a database from user_version N - 1 to N. Only append to these lists.
+SIGNUP_MIGRATIONS = [
+    _create_users_table,
+    _create_users_indexes,
+    _create_outbox_table,
+    _create_generated_letters_table,
+    _add_users_archived_at,
+    _create_users_search_index,
+    _create_branch_taxonomy_table,
+    _add_application_status,
+    _drop_duplicate_users_indexes,
+    _create_users_status_sort_indexes,
+]
+
+ADMIN_MIGRATIONS = [
+    _create_admins_table,
+    _create_admins_indexes,
+    _add_admins_last_login,
+]
+
+
+def migrate(connection, migrations):
+    """
+    Apply the migrations newer than the database's user_version, each in its
+    own transaction.
+    """
+    version = connection.execute("PRAGMA user_version").fetchone()[0]
+    for number, migration in enumerate(migrations[version:], start=version + 1):
+        connection.execute("BEGIN")
+        try:
+            migration(connection)
+            connection.execute(f"PRAGMA user_version = {number}")
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+
+
+def run_migrations():
+    """
+    Bring signup.db and admin.db to the current schema. Called once at startup.
+    """
+    migrate(repository.signup_db(), SIGNUP_MIGRATIONS)
+    migrate(repository.admin_db(), ADMIN_MIGRATIONS)
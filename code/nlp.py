@@ -1,21 +1,63 @@
-import spacy
+import threading
+import numpy as np
+from LOR_python_app.code import metrics
+from LOR_python_app.code.branch_matcher import BranchMatcher
 
-# Load the English language model
-nlp = spacy.load("en_core_web_sm")
 
-# Define the branch names you want to compare with
-branch_names = ["IT", "Electrical"]
+def _unit_vectors(docs):
+    """
+    Stack the document vectors into a matrix of unit rows. Documents without
+    a vector keep a zero row, which gives a similarity of 0 like spaCy does.
+    """
+    vectors = np.array([doc.vector for doc in docs], dtype="float32")
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+
+# The model is loaded on first use, since importing spaCy and the model takes seconds
+_nlp = None
+_load_lock = threading.Lock()
 
-def get_branch_similarity(branch):
+
+def get_nlp():
     """
-    Calculate similarity between the given branch and predefined branch names.
-    Returns the branch name with the highest similarity.
+    Return the English language model, loading it on first use. Doc vectors in
+    en_core_web_sm come from the tok2vec tensor, so the other components are
+    not needed for similarity.
     """
-    max_similarity = -1
-    selected_branch = None
-    for predefined_branch in branch_names:
-        similarity = nlp(branch).similarity(nlp(predefined_branch))
-        if similarity > max_similarity:
-            max_similarity = similarity
-            selected_branch = predefined_branch
-    return selected_branch
+    global _nlp
+    if _nlp is None:
+        with _load_lock:
+            if _nlp is None:
+                with metrics.span("lor_nlp_model_load_seconds"):
+                    import spacy
+                    _nlp = spacy.load("en_core_web_sm",
+                                      exclude=["tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter"])
+    return _nlp
+
+
+def is_model_loaded():
+    return _nlp is not None
+
+
+class SpacyBranchMatcher(BranchMatcher):
+    """
+    Picks the branch whose name or alias has the most similar spaCy document
+    vector. Needs en_core_web_sm, select it with LOR_BRANCH_MATCHER=spacy.
+    """
+
+    def __init__(self, taxonomy):
+        super(SpacyBranchMatcher, self).__init__(taxonomy)
+        self._alias_branches = []
+        aliases = []
+        for branch, branch_aliases in taxonomy.items():
+            for alias in [branch] + list(branch_aliases):
+                aliases.append(alias)
+                self._alias_branches.append(branch)
+        self._alias_vectors = _unit_vectors(get_nlp().pipe(aliases))
+
+    def match_many(self, texts):
+        # Run the pipeline once over every text and pick the best match
+        similarities = _unit_vectors(get_nlp().pipe(texts)) @ self._alias_vectors.T
+        return [self._alias_branches[index] for index in similarities.argmax(axis=1)]
@@ -0,0 +1,356 @@
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+from LOR_python_app.code import metrics
+
+SIGNUP_DB_PATH = os.getenv("LOR_SIGNUP_DB", "../database/signup.db")
+ADMIN_DB_PATH = os.getenv("LOR_ADMIN_DB", "../database/admin.db")
+
+# Seconds a connection waits for another writer before giving up
+BUSY_TIMEOUT = 5.0
+# Prepared statements kept per connection; every query below is a constant string so they are reused
+CACHED_STATEMENTS = 256
+
+# Columns of users shown in the admin view and used for letters, in table order
+APPLICANT_COLUMNS = ["name", "email", "password", "full_name", "branch", "specialization", "phone", "gender"]
+
+# Application statuses: every student starts pending until their letter is generated (and then sent) or
+# they are rejected
+STATUS_PENDING = "pending"
+STATUS_GENERATED = "generated"
+STATUS_SENT = "sent"
+STATUS_REJECTED = "rejected"
+APPLICATION_STATUSES = [STATUS_PENDING, STATUS_GENERATED, STATUS_SENT, STATUS_REJECTED]
+# Column of users recording when a student reached each status
+STATUS_TIMESTAMPS = {STATUS_GENERATED: "generated_at", STATUS_SENT: "sent_at", STATUS_REJECTED: "rejected_at"}
+
+
+@dataclass
+class Admin:
+    username: str
+    password: str
+    professor_id: int
+
+
+@dataclass
+class Applicant:
+    name: str
+    email: str
+    password: str
+    full_name: Optional[str]
+    branch: Optional[str]
+    specialization: Optional[str]
+    requirement: Optional[str]
+    gender: Optional[str]
+
+
+# sqlite3 connections can only be used on the thread that created them,
+# so each thread keeps one open connection per database file
+_local = threading.local()
+
+
+def configure(signup_path=None, admin_path=None):
+    """
+    Point the repository at other database files, e.g. scratch copies.
+    """
+    global SIGNUP_DB_PATH, ADMIN_DB_PATH
+    if signup_path is not None:
+        SIGNUP_DB_PATH = signup_path
+    if admin_path is not None:
+        ADMIN_DB_PATH = admin_path
+
+
+def _connection(path):
+    connections = getattr(_local, "connections", None)
+    # A forked worker process must not reuse the connections it inherited
+    if connections is None or _local.pid != os.getpid():
+        connections = _local.connections = {}
+        _local.pid = os.getpid()
+    connection = connections.get(path)
+    if connection is None:
+        connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT, cached_statements=CACHED_STATEMENTS)
+        # WAL lets the admin view read while a worker writes; NORMAL sync is safe with WAL
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA busy_timeout={int(BUSY_TIMEOUT * 1000)}")
+        connections[path] = connection
+    return connection
+
+
+# The schema itself is created and upgraded by migrations.run_migrations() at startup
+
+def signup_db():
+    return _connection(SIGNUP_DB_PATH)
+
+
+def admin_db():
+    return _connection(ADMIN_DB_PATH)
+
+
+def close_connections():
+    """
+    Close the connections opened by the calling thread.
+    """
+    connections = getattr(_local, "connections", None)
+    # Connections inherited by a forked worker process belong to the parent, they are only dropped
+    if connections is not None and _local.pid == os.getpid():
+        for connection in connections.values():
+            connection.close()
+    _local.connections = {}
+    _local.pid = os.getpid()
+
+
+# Every query below is timed into the lor_db_seconds histogram when metrics are enabled
+
+# Admins
+
+@metrics.timed("lor_db_seconds")
+def find_admin(professor_id, password) -> Optional[Admin]:
+    cursor = admin_db().execute("SELECT username, password_admin, professor_id FROM admins "
+                                "WHERE professor_id = ? AND password_admin = ?", (professor_id, password))
+    row = cursor.fetchone()
+    return Admin(*row) if row is not None else None
+
+
+@metrics.timed("lor_db_seconds")
+def get_admin(professor_id) -> Optional[Admin]:
+    cursor = admin_db().execute("SELECT username, password_admin, professor_id FROM admins "
+                                "WHERE professor_id = ?", (professor_id,))
+    row = cursor.fetchone()
+    return Admin(*row) if row is not None else None
+
+
+@metrics.timed("lor_db_seconds")
+def record_admin_login(professor_id) -> None:
+    connection = admin_db()
+    with connection:
+        connection.execute("UPDATE admins SET last_login = ? WHERE professor_id = ?", (time.time(), professor_id))
+
+
+@metrics.timed("lor_db_seconds")
+def fetch_admin_username() -> Optional[str]:
+    """
+    Return the username of the admin who logged in most recently.
+    """
+    row = admin_db().execute("SELECT username FROM admins ORDER BY last_login DESC LIMIT 1").fetchone()
+    return row[0] if row is not None else None
+
+
+@metrics.timed("lor_db_seconds")
+def insert_admin(username, password, professor_id) -> None:
+    connection = admin_db()
+    with connection:
+        connection.execute("INSERT INTO admins (username, password_admin, professor_id) VALUES (?, ?, ?)",
+                           (username, password, professor_id))
+
+
+# Students
+
+@metrics.timed("lor_db_seconds")
+def user_credentials_valid(name, password) -> bool:
+    cursor = signup_db().execute("SELECT 1 FROM users WHERE name = ? AND password = ? LIMIT 1", (name, password))
+    return cursor.fetchone() is not None
+
+
+@metrics.timed("lor_db_seconds")
+def username_exists(name) -> bool:
+    return signup_db().execute("SELECT 1 FROM users WHERE name = ? LIMIT 1", (name,)).fetchone() is not None
+
+
+@metrics.timed("lor_db_seconds")
+def email_exists(email) -> bool:
+    return signup_db().execute("SELECT 1 FROM users WHERE email = ? LIMIT 1", (email,)).fetchone() is not None
+
+
+@metrics.timed("lor_db_seconds")
+def insert_user(name, email, password) -> None:
+    connection = signup_db()
+    with connection:
+        connection.execute("INSERT INTO users (name, email, password) VALUES (?, ?, ?)", (name, email, password))
+
+
+@metrics.timed("lor_db_seconds")
+def find_existing_users(candidates) -> List[tuple]:
+    """
+    Return the (name, email) of every existing user whose name or email
+    matches one of the (name, email) candidates, with one set-based query.
+    """
+    connection = signup_db()
+    connection.execute("CREATE TEMP TABLE IF NOT EXISTS import_candidates (name TEXT, email TEXT)")
+    with connection:
+        connection.execute("DELETE FROM import_candidates")
+        connection.executemany("INSERT INTO import_candidates (name, email) VALUES (?, ?)", candidates)
+    cursor = connection.execute("SELECT name, email FROM users "
+                                "WHERE name IN (SELECT name FROM import_candidates) "
+                                "OR email IN (SELECT email FROM import_candidates)")
+    return cursor.fetchall()
+
+
+@metrics.timed("lor_db_seconds")
+def insert_users(applicants) -> None:
+    """
+    Insert many students in a single transaction.
+    """
+    connection = signup_db()
+    with connection:
+        connection.executemany(f"INSERT INTO users ({', '.join(APPLICANT_COLUMNS)}) "
+                               f"VALUES ({', '.join('?' for _ in APPLICANT_COLUMNS)})",
+                               [(applicant.name, applicant.email, applicant.password, applicant.full_name,
+                                 applicant.branch, applicant.specialization, applicant.requirement,
+                                 applicant.gender) for applicant in applicants])
+
+
+@metrics.timed("lor_db_seconds")
+def get_applicant(name) -> Optional[Applicant]:
+    cursor = signup_db().execute(f"SELECT {', '.join(APPLICANT_COLUMNS)} FROM users WHERE name = ?", (name,))
+    row = cursor.fetchone()
+    return Applicant(*row) if row is not None else None
+
+
+@metrics.timed("lor_db_seconds")
+def list_applicants(after_rowid=0, limit=200, branch=None, requirement=None, gender=None,
+                    status=STATUS_PENDING) -> List[tuple]:
+    """
+    Return a page of (rowid, Applicant) ordered by rowid, starting after
+    after_rowid. The filters use the same indexed expressions as the admin
+    view; status None lists applicants in every status.
+    """
+    conditions = ["rowid > ?", "archived_at IS NULL"]
+    params = [after_rowid]
+    if status is not None:
+        conditions.append("status = ?")
+        params.append(status)
+    for column, value in (("branch", branch), ("phone", requirement), ("gender", gender)):
+        if value is not None:
+            conditions.append(f"IFNULL({column}, '') = ?")
+            params.append(value)
+    cursor = signup_db().execute(f"SELECT rowid, {', '.join(APPLICANT_COLUMNS)} FROM users "
+                                 f"WHERE {' AND '.join(conditions)} ORDER BY rowid LIMIT ?", params + [limit])
+    return [(row[0], Applicant(*row[1:])) for row in cursor.fetchall()]
+
+
+@metrics.timed("lor_db_seconds")
+def delete_users(rowids) -> None:
+    """
+    Delete many students by rowid in a single transaction.
+    """
+    connection = signup_db()
+    with connection:
+        connection.executemany("DELETE FROM users WHERE rowid = ?", [(rowid,) for rowid in rowids])
+
+
+@metrics.timed("lor_db_seconds")
+def archive_users(rowids) -> None:
+    """
+    Hide many students from the admin view and letter runs in a single
+    transaction, keeping their rows.
+    """
+    connection = signup_db()
+    with connection:
+        connection.executemany("UPDATE users SET archived_at = ? WHERE rowid = ?",
+                               [(time.time(), rowid) for rowid in rowids])
+
+
+@metrics.timed("lor_db_seconds")
+def set_application_status(names, status, only_from=None) -> None:
+    """
+    Move students to status and record when. Does not commit: call it inside
+    the caller's transaction, so the status changes together with the work
+    that caused it. If only_from is given, only students currently in that
+    status are moved.
+    """
+    condition = "name = ?" if only_from is None else "name = ? AND status = ?"
+    extra = () if only_from is None else (only_from,)
+    now = time.time()
+    signup_db().executemany(f"UPDATE users SET status = ?, {STATUS_TIMESTAMPS[status]} = ? WHERE {condition}",
+                            [(status, now, name) + extra for name in names])
+
+
+@metrics.timed("lor_db_seconds")
+def get_user_details(name) -> Optional[tuple]:
+    """
+    Return (full_name, branch, specialization, phone, gender) for a student.
+    """
+    cursor = signup_db().execute("SELECT full_name, branch, specialization, phone, gender FROM users "
+                                 "WHERE name = ?", (name,))
+    return cursor.fetchone()
+
+
+@metrics.timed("lor_db_seconds")
+def update_user_details(name, full_name, branch, specialization, phone, gender) -> None:
+    connection = signup_db()
+    with connection:
+        connection.execute("UPDATE users SET full_name = ?, branch = ?, specialization = ?, phone = ?, gender = ? "
+                           "WHERE name = ?", (full_name, branch, specialization, phone, gender, name))
+
+
+# Generated letters
+
+@metrics.timed("lor_db_seconds")
+def find_generated_letter(content_hash) -> Optional[str]:
+    cursor = signup_db().execute("SELECT file_path FROM generated_letters WHERE content_hash = ?", (content_hash,))
+    row = cursor.fetchone()
+    return row[0] if row is not None else None
+
+
+@metrics.timed("lor_db_seconds")
+def find_generated_letters(content_hashes) -> dict:
+    """
+    Return {content_hash: file_path} for the hashes that were generated before.
+    """
+    connection = signup_db()
+    connection.execute("CREATE TEMP TABLE IF NOT EXISTS lookup_hashes (content_hash TEXT PRIMARY KEY)")
+    with connection:
+        connection.execute("DELETE FROM lookup_hashes")
+        connection.executemany("INSERT OR IGNORE INTO lookup_hashes (content_hash) VALUES (?)",
+                               [(content_hash,) for content_hash in content_hashes])
+    cursor = connection.execute("SELECT g.content_hash, g.file_path FROM generated_letters g "
+                                "JOIN lookup_hashes l ON l.content_hash = g.content_hash")
+    return dict(cursor.fetchall())
+
+
+@metrics.timed("lor_db_seconds")
+def record_generated_letter(username, content_hash, file_path, template_digest) -> List[str]:
+    """
+    Record a newly generated letter as the student's current one. Returns the
+    file paths of the student's earlier letters, which it supersedes.
+    """
+    connection = signup_db()
+    with connection:
+        cursor = connection.execute("SELECT file_path FROM generated_letters WHERE username = ? AND content_hash != ?",
+                                    (username, content_hash))
+        superseded = [row[0] for row in cursor.fetchall()]
+        connection.execute("DELETE FROM generated_letters WHERE username = ?", (username,))
+        connection.execute("INSERT INTO generated_letters (content_hash, username, file_path, template_digest, "
+                           "created_at) VALUES (?, ?, ?, ?, ?)",
+                           (content_hash, username, file_path, template_digest, time.time()))
+        # Letters emailed from the admin view were marked when queued; this catches letter runs
+        set_application_status([username], STATUS_GENERATED, only_from=STATUS_PENDING)
+    return superseded
+
+
+@metrics.timed("lor_db_seconds")
+def fetch_branch_taxonomy() -> List[tuple]:
+    """
+    Return the (branch, alias) rows of the branch taxonomy in insertion order.
+    """
+    return signup_db().execute("SELECT branch, alias FROM branch_taxonomy ORDER BY rowid").fetchall()
+
+
+@metrics.timed("lor_db_seconds")
+def fetch_eligible_applicants(requirements, statuses=(STATUS_PENDING,)) -> List[Applicant]:
+    """
+    Return every student in one of the given application statuses that has
+    filled in their details with one of the given requirements, leaving out
+    archived ones.
+    """
+    requirements, statuses = list(requirements), list(statuses)
+    cursor = signup_db().execute(
+        f"SELECT {', '.join(APPLICANT_COLUMNS)} FROM users "
+        f"WHERE status IN ({', '.join('?' for _ in statuses)}) AND archived_at IS NULL "
+        f"AND full_name IS NOT NULL AND full_name != '' AND phone IN ({', '.join('?' for _ in requirements)})",
+        statuses + requirements)
+    return [Applicant(*row) for row in cursor.fetchall()]
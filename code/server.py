@@ -0,0 +1,309 @@
+import argparse
+import asyncio
+import json
+import os
+import re
+import secrets
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+from LOR_python_app.code import metrics, repository
+from LOR_python_app.code.lor_generator import (SAVE_LETTERS, find_cached_letter, plan_letter, render_letter_data,
+                                              save_letter_in_background)
+from LOR_python_app.code.mailer import queue_letter_email, queue_rejection_email, start_mail_worker
+from LOR_python_app.code.migrations import run_migrations
+from LOR_python_app.code.branch_matcher import get_branch_similarity, get_matcher
+from LOR_python_app.code.validation import validate_signup
+
+# Largest request body accepted, in bytes
+MAX_BODY_SIZE = 1024 * 1024
+
+# Seconds a login token stays valid after it was last used
+SESSION_TTL = 8 * 60 * 60
+# Logged-in sessions kept at most; the least recently used one is dropped first
+MAX_SESSIONS = 10000
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super(HTTPError, self).__init__(message)
+        self.status = status
+
+
+def int_parameter(query, name, default, minimum=0):
+    """
+    Return the query parameter name as an int, or default if it is missing.
+    Malformed or too small values are the client's mistake, so they are a 400.
+    """
+    value = query.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"{name} must be a whole number.")
+    if number < minimum:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"{name} must be at least {minimum}.")
+    return number
+
+
+def read_file(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class LORService:
+    """
+    Headless HTTP/JSON API over the same flows as the desktop windows. All
+    clients share one branch matcher, one database thread (and so one
+    connection per database) and a process pool for rendering letters.
+    """
+
+    def __init__(self, render_workers=None):
+        # sqlite3 connections belong to one thread, so every database call runs on this one
+        self.db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lor-db")
+        self.render_executor = ProcessPoolExecutor(max_workers=render_workers)
+        # token -> (role, username, expires at), least recently used first
+        self.sessions = OrderedDict()
+        self.routes = [
+            ("POST", re.compile(r"/login"), self.login),
+            ("POST", re.compile(r"/signup"), self.signup),
+            ("POST", re.compile(r"/details"), self.submit_details),
+            ("GET", re.compile(r"/applicants"), self.list_applicants),
+            ("POST", re.compile(r"/applicants/(?P<name>[^/]+)/lor"), self.generate_lor),
+            ("POST", re.compile(r"/applicants/(?P<name>[^/]+)/reject"), self.reject_application),
+            ("GET", re.compile(r"/metrics"), self.export_metrics),
+        ]
+
+    async def db(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.db_executor, function, *args)
+
+    def session_for(self, headers, role):
+        token = headers.get("authorization", "").removeprefix("Bearer ").strip()
+        session = self.sessions.get(token)
+        now = time.monotonic()
+        if session is not None and session[2] <= now:
+            del self.sessions[token]
+            session = None
+        if session is None or session[0] != role:
+            raise HTTPError(HTTPStatus.UNAUTHORIZED, "Please log in first.")
+        # Using a session keeps it alive
+        self.sessions[token] = (session[0], session[1], now + SESSION_TTL)
+        self.sessions.move_to_end(token)
+        return session[1]
+
+    def start_session(self, role, username):
+        token = secrets.token_urlsafe(24)
+        self.sessions[token] = (role, username, time.monotonic() + SESSION_TTL)
+        while len(self.sessions) > MAX_SESSIONS:
+            self.sessions.popitem(last=False)
+        return token
+
+    # Handlers take (request body, query parameters, headers, path parameters) and return (status, payload)
+
+    async def login(self, body, query, headers, name=None):
+        password = body.get("password", "")
+        username = body.get("username", "")
+        professor_id = body.get("professor_id", username)
+
+        admin = await self.db(repository.find_admin, professor_id, password)
+        if admin is not None:
+            await self.db(repository.record_admin_login, admin.professor_id)
+            role, username = "admin", admin.username
+        elif await self.db(repository.user_credentials_valid, username, password):
+            role = "student"
+        else:
+            raise HTTPError(HTTPStatus.UNAUTHORIZED, "Invalid username or password.")
+        return HTTPStatus.OK, {"token": self.start_session(role, username), "role": role}
+
+    async def signup(self, body, query, headers, name=None):
+        name, email, password = body.get("name", ""), body.get("email", ""), body.get("password", "")
+        error = validate_signup(name, email, password)
+        if error is not None:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, error)
+        if await self.db(repository.username_exists, name):
+            raise HTTPError(HTTPStatus.CONFLICT, "Username already exists. Please choose a different one.")
+        if await self.db(repository.email_exists, email):
+            raise HTTPError(HTTPStatus.CONFLICT, "Email already exists. Please choose a different one.")
+        await self.db(repository.insert_user, name, email, password)
+        return HTTPStatus.CREATED, {"name": name}
+
+    async def submit_details(self, body, query, headers, name=None):
+        username = self.session_for(headers, "student")
+        details = [body.get(field, "") for field in ("full_name", "branch", "specialization", "requirement", "gender")]
+        if not all(details):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Please fill in all details.")
+        await self.db(repository.update_user_details, username, *details)
+        return HTTPStatus.OK, {"name": username}
+
+    async def list_applicants(self, body, query, headers, name=None):
+        self.session_for(headers, "admin")
+        after = int_parameter(query, "after", 0)
+        limit = min(int_parameter(query, "limit", 200, minimum=1), 1000)
+        # Pending applicants unless another status, or "all", is asked for
+        status = query.get("status") or repository.STATUS_PENDING
+        if status == "all":
+            status = None
+        elif status not in repository.APPLICATION_STATUSES:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Unknown status {status}.")
+        # A blank filter means no filter
+        page = await self.db(repository.list_applicants, after, limit, query.get("branch") or None,
+                             query.get("requirement") or None, query.get("gender") or None, status)
+        applicants = [dict(asdict(applicant), id=rowid) for rowid, applicant in page]
+        for applicant in applicants:
+            del applicant["password"]
+        next_after = page[-1][0] if len(page) == limit else None
+        return HTTPStatus.OK, {"applicants": applicants, "next_after": next_after}
+
+    async def generate_lor(self, body, query, headers, name=None):
+        admin_username = self.session_for(headers, "admin")
+        applicant = await self.db(repository.get_applicant, name)
+        if applicant is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No applicant named {name}.")
+
+        loop = asyncio.get_running_loop()
+        # The matcher loads its taxonomy from signup.db, so it runs on the database thread as well
+        selected_branch = await self.db(get_branch_similarity, applicant.branch or "")
+        try:
+            job = await self.db(plan_letter, applicant.name, applicant.full_name or "", applicant.branch or "",
+                                applicant.specialization or "", applicant.requirement, applicant.gender or "",
+                                admin_username, selected_branch)
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+
+        cached_path = await self.db(find_cached_letter, job)
+        if cached_path is not None:
+            # File reads would block the event loop too
+            data = await loop.run_in_executor(None, read_file, cached_path)
+        else:
+            # Rendering is CPU bound, so it runs in the process pool, into memory
+            with metrics.span("lor_letter_render_seconds"):
+                data = await loop.run_in_executor(self.render_executor, render_letter_data, job)
+            if SAVE_LETTERS:
+                save_letter_in_background(job, data)
+
+        message_id = await self.db(queue_letter_email, applicant.email, data, os.path.basename(job.file_path),
+                                   applicant.name)
+        saved_path = cached_path or (job.file_path if SAVE_LETTERS else None)
+        return HTTPStatus.OK, {"file_path": saved_path, "branch": selected_branch, "message_id": message_id}
+
+    async def reject_application(self, body, query, headers, name=None):
+        self.session_for(headers, "admin")
+        applicant = await self.db(repository.get_applicant, name)
+        if applicant is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No applicant named {name}.")
+        message_id = await self.db(queue_rejection_email, applicant.email, applicant.name)
+        return HTTPStatus.OK, {"message_id": message_id}
+
+    async def export_metrics(self, body, query, headers, name=None):
+        # Plain text in the Prometheus exposition format, for scraping
+        if not metrics.is_enabled():
+            raise HTTPError(HTTPStatus.NOT_FOUND, "Metrics are disabled, start the server with --metrics.")
+        return HTTPStatus.OK, metrics.render_prometheus()
+
+    async def dispatch(self, method, target, headers, body):
+        url = urlsplit(target)
+        # Blank values are kept so "?limit=" is reported instead of silently ignored
+        query = {key: values[-1] for key, values in parse_qs(url.query, keep_blank_values=True).items()}
+        try:
+            for route_method, pattern, handler in self.routes:
+                match = pattern.fullmatch(url.path)
+                if match is None:
+                    continue
+                if route_method != method:
+                    raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "Method not allowed.")
+                try:
+                    data = json.loads(body) if body else {}
+                except ValueError:
+                    raise HTTPError(HTTPStatus.BAD_REQUEST, "Request body must be JSON.")
+                path_parameters = {key: unquote(value) for key, value in match.groupdict().items()}
+                with metrics.span("lor_http_request_seconds", route=handler.__name__):
+                    return await handler(data, query, headers, **path_parameters)
+            raise HTTPError(HTTPStatus.NOT_FOUND, "Not found.")
+        except HTTPError as e:
+            return e.status, {"error": str(e)}
+        except Exception as e:
+            print("Error occurred while handling request:", e)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error."}
+
+    async def handle_connection(self, reader, writer):
+        try:
+            # One request after another on the same connection until the client closes it
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_SIZE:
+                    status, payload = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Request body too large."}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = await self.dispatch(method, target, headers, body)
+                    keep_alive = headers.get("connection", "").lower() != "close"
+
+                if isinstance(payload, str):
+                    data, content_type = payload.encode("utf-8"), "text/plain; version=0.0.4"
+                else:
+                    data, content_type = json.dumps(payload).encode("utf-8"), "application/json"
+                writer.write(f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                             f"Content-Type: {content_type}\r\n"
+                             f"Content-Length: {len(data)}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def close(self):
+        self.render_executor.shutdown()
+        self.db_executor.shutdown()
+
+
+async def serve(host, port, render_workers, enable_metrics=False):
+    if enable_metrics:
+        metrics.enable()
+    service = LORService(render_workers)
+    # Prepare the schema and the branch matcher once, before accepting clients
+    await service.db(run_migrations)
+    await service.db(get_matcher)
+    start_mail_worker()
+
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    print(f"Serving on http://{host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the LOR application over a local HTTP API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of rendering processes")
+    parser.add_argument("--metrics", action="store_true", help="record metrics and serve them on GET /metrics")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.metrics))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import threading
+from LOR_python_app.code import repository
+from LOR_python_app.code.branch_matcher import get_matcher
+from LOR_python_app.code.lor_generator import TEMPLATE_PATHS
+from LOR_python_app.code.lor_templates import get_compiled_template
+
+
+class Session:
+    """
+    Created by Login when someone signs in and handed to the windows it
+    opens, so they know who is signed in without looking it up again.
+    """
+
+    def __init__(self, username, admin=None):
+        self.username = username
+        # The signed-in admin's profile, None for students
+        self.admin = admin
+        # signup.db connection of the GUI thread, shared by the windows; worker threads open their own
+        self.signup_db = repository.signup_db()
+
+    @property
+    def is_admin(self):
+        return self.admin is not None
+
+    @property
+    def admin_username(self):
+        # Letters are signed by the admin of the session
+        return self.admin.username if self.admin is not None else None
+
+    def warm_up(self):
+        """
+        Prime the module-level caches of compiled letter templates
+        (lor_templates) and of the branch matcher on a daemon thread, while
+        the admin looks at the table. Nothing is stored on the session.
+        """
+        threading.Thread(target=self._prime_letter_caches, name="session-warm-up", daemon=True).start()
+
+    @staticmethod
+    def _prime_letter_caches():
+        try:
+            for path in TEMPLATE_PATHS.values():
+                get_compiled_template(path)
+            get_matcher()
+        except Exception as e:
+            print("Error occurred while preparing the session:", e)
+        finally:
+            # The taxonomy is read on this thread, do not leave its connection open
+            repository.close_connections()
@@ -0,0 +1,76 @@
+# ui-digest: c042db73b6495468ae3b65423cff7d7083e125f9f609ce5a9455df205fa181f9
+# Form implementation generated from reading ui file '../UI/admin.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_AdminWindow(object):
+    def setupUi(self, AdminWindow):
+        AdminWindow.setObjectName("AdminWindow")
+        AdminWindow.resize(654, 528)
+        AdminWindow.setStyleSheet("background-color: rgb(47, 30, 111);")
+        self.centralwidget = QtWidgets.QWidget(parent=AdminWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.label_username = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_username.setGeometry(QtCore.QRect(60, 190, 131, 31))
+        self.label_username.setStyleSheet("color: rgb(255, 255, 255);\n"
+"font: 700 16pt \"Segoe UI\";")
+        self.label_username.setObjectName("label_username")
+        self.label_password = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_password.setGeometry(QtCore.QRect(60, 260, 121, 31))
+        self.label_password.setStyleSheet("color: rgb(255, 255, 255);\n"
+"font: 700 16pt \"Segoe UI\";")
+        self.label_password.setObjectName("label_password")
+        self.lineedit_username = QtWidgets.QLineEdit(parent=self.centralwidget)
+        self.lineedit_username.setGeometry(QtCore.QRect(250, 190, 281, 31))
+        self.lineedit_username.setStyleSheet("background-color: rgb(255, 255, 255);\n"
+"font: 700 16pt \"Segoe UI\";")
+        self.lineedit_username.setInputMethodHints(QtCore.Qt.InputMethodHint.ImhNone)
+        self.lineedit_username.setObjectName("lineedit_username")
+        self.lineedit_password = QtWidgets.QLineEdit(parent=self.centralwidget)
+        self.lineedit_password.setGeometry(QtCore.QRect(250, 260, 281, 31))
+        self.lineedit_password.setStyleSheet("background-color: rgb(255, 255, 255);\n"
+"font: 700 16pt \"Segoe UI\";")
+        self.lineedit_password.setInputMethodHints(QtCore.Qt.InputMethodHint.ImhHiddenText|QtCore.Qt.InputMethodHint.ImhNoAutoUppercase|QtCore.Qt.InputMethodHint.ImhNoPredictiveText|QtCore.Qt.InputMethodHint.ImhSensitiveData)
+        self.lineedit_password.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
+        self.lineedit_password.setObjectName("lineedit_password")
+        self.button_signup = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.button_signup.setGeometry(QtCore.QRect(260, 400, 141, 61))
+        self.button_signup.setStyleSheet("background-color: rgb(137, 174, 255);\n"
+"font: 700 12pt \"Segoe UI\";")
+        self.button_signup.setObjectName("button_signup")
+        self.label = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label.setGeometry(QtCore.QRect(250, 50, 251, 41))
+        self.label.setStyleSheet("font: 700 20pt \"Segoe UI\";\n"
+"color: rgb(255, 255, 255);")
+        self.label.setObjectName("label")
+        self.label_professor_id = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_professor_id.setGeometry(QtCore.QRect(60, 330, 121, 31))
+        self.label_professor_id.setStyleSheet("color: rgb(255, 255, 255);\n"
+"font: 700 16pt \"Segoe UI\";")
+        self.label_professor_id.setObjectName("label_professor_id")
+        self.lineedit_professor_id = QtWidgets.QLineEdit(parent=self.centralwidget)
+        self.lineedit_professor_id.setGeometry(QtCore.QRect(250, 330, 281, 31))
+        self.lineedit_professor_id.setStyleSheet("background-color: rgb(255, 255, 255);\n"
+"font: 700 16pt \"Segoe UI\";")
+        self.lineedit_professor_id.setInputMethodHints(QtCore.Qt.InputMethodHint.ImhDigitsOnly)
+        self.lineedit_professor_id.setObjectName("lineedit_professor_id")
+        AdminWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(AdminWindow)
+        QtCore.QMetaObject.connectSlotsByName(AdminWindow)
+
+    def retranslateUi(self, AdminWindow):
+        _translate = QtCore.QCoreApplication.translate
+        AdminWindow.setWindowTitle(_translate("AdminWindow", "Admin Window"))
+        self.label_username.setText(_translate("AdminWindow", "Username:"))
+        self.label_password.setText(_translate("AdminWindow", "Password:"))
+        self.button_signup.setText(_translate("AdminWindow", "Sign Up"))
+        self.label.setText(_translate("AdminWindow", "Admin Signup"))
+        self.label_professor_id.setText(_translate("AdminWindow", "Professor ID:"))
@@ -0,0 +1,24 @@
+# ui-digest: 716e4461141364f78703b4b195bc39616c4cde3eadc8bd8fda4ef08ea2485f58
+# Form implementation generated from reading ui file '../UI/database.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_DatabaseWindow(object):
+    def setupUi(self, DatabaseWindow):
+        DatabaseWindow.setObjectName("DatabaseWindow")
+        DatabaseWindow.resize(1150, 600)
+        self.tableView = QtWidgets.QTableView(parent=DatabaseWindow)
+        self.tableView.setObjectName("tableView")
+
+        self.retranslateUi(DatabaseWindow)
+        QtCore.QMetaObject.connectSlotsByName(DatabaseWindow)
+
+    def retranslateUi(self, DatabaseWindow):
+        pass
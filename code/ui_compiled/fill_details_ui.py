@@ -0,0 +1,175 @@
+# ui-digest: 160490ed93bb8301b8b3d26d273ba82430d8a792f76330a4c178d4fb2b2ef59e
+# Form implementation generated from reading ui file '../UI/fill_details.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_FillDetailsWindow(object):
+    def setupUi(self, FillDetailsWindow):
+        FillDetailsWindow.setObjectName("FillDetailsWindow")
+        FillDetailsWindow.setWindowModality(QtCore.Qt.WindowModality.NonModal)
+        FillDetailsWindow.setEnabled(True)
+        FillDetailsWindow.resize(496, 637)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(FillDetailsWindow.sizePolicy().hasHeightForWidth())
+        FillDetailsWindow.setSizePolicy(sizePolicy)
+        FillDetailsWindow.setStyleSheet("")
+        self.centralwidget = QtWidgets.QWidget(parent=FillDetailsWindow)
+        self.centralwidget.setEnabled(True)
+        self.centralwidget.setStyleSheet("")
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setSizeConstraint(QtWidgets.QLayout.SizeConstraint.SetNoConstraint)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.widget = QtWidgets.QWidget(parent=self.centralwidget)
+        self.widget.setStyleSheet("")
+        self.widget.setObjectName("widget")
+        self.phone_label = QtWidgets.QLabel(parent=self.widget)
+        self.phone_label.setGeometry(QtCore.QRect(140, 330, 133, 24))
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.phone_label.sizePolicy().hasHeightForWidth())
+        self.phone_label.setSizePolicy(sizePolicy)
+        self.phone_label.setStyleSheet("font: 16pt \"Times New Roman\";")
+        self.phone_label.setObjectName("phone_label")
+        self.branch_label = QtWidgets.QLabel(parent=self.widget)
+        self.branch_label.setGeometry(QtCore.QRect(140, 150, 67, 24))
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.branch_label.sizePolicy().hasHeightForWidth())
+        self.branch_label.setSizePolicy(sizePolicy)
+        self.branch_label.setStyleSheet("font: 16pt \"Times New Roman\";")
+        self.branch_label.setObjectName("branch_label")
+        self.submit_button = QtWidgets.QPushButton(parent=self.widget)
+        self.submit_button.setGeometry(QtCore.QRect(140, 540, 201, 41))
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.submit_button.sizePolicy().hasHeightForWidth())
+        self.submit_button.setSizePolicy(sizePolicy)
+        self.submit_button.setStyleSheet("font: 16pt \"Times New Roman\";")
+        self.submit_button.setObjectName("submit_button")
+        self.name_label = QtWidgets.QLabel(parent=self.widget)
+        self.name_label.setGeometry(QtCore.QRect(140, 70, 56, 24))
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.name_label.sizePolicy().hasHeightForWidth())
+        self.name_label.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("Times New Roman")
+        font.setPointSize(16)
+        font.setBold(False)
+        font.setItalic(False)
+        self.name_label.setFont(font)
+        self.name_label.setStyleSheet("font: 16pt \"Times New Roman\";")
+        self.name_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.name_label.setObjectName("name_label")
+        self.full_name_input = QtWidgets.QLineEdit(parent=self.widget)
+        self.full_name_input.setEnabled(True)
+        self.full_name_input.setGeometry(QtCore.QRect(140, 100, 200, 30))
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.full_name_input.sizePolicy().hasHeightForWidth())
+        self.full_name_input.setSizePolicy(sizePolicy)
+        self.full_name_input.setMinimumSize(QtCore.QSize(200, 30))
+        font = QtGui.QFont()
+        font.setPointSize(15)
+        font.setKerning(True)
+        self.full_name_input.setFont(font)
+        self.full_name_input.setStyleSheet("background-color: rgb(255, 255, 255);")
+        self.full_name_input.setText("")
+        self.full_name_input.setFrame(True)
+        self.full_name_input.setObjectName("full_name_input")
+        self.welcome_label = QtWidgets.QLabel(parent=self.widget)
+        self.welcome_label.setGeometry(QtCore.QRect(-30, 0, 568, 50))
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.welcome_label.sizePolicy().hasHeightForWidth())
+        self.welcome_label.setSizePolicy(sizePolicy)
+        self.welcome_label.setMinimumSize(QtCore.QSize(0, 50))
+        self.welcome_label.setStyleSheet("font: 9pt \"Times New Roman\";\n"
+"font: 15pt \"Segoe UI\";")
+        self.welcome_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.welcome_label.setObjectName("welcome_label")
+        self.specialization_input = QtWidgets.QLineEdit(parent=self.widget)
+        self.specialization_input.setGeometry(QtCore.QRect(140, 270, 200, 30))
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.specialization_input.sizePolicy().hasHeightForWidth())
+        self.specialization_input.setSizePolicy(sizePolicy)
+        self.specialization_input.setMinimumSize(QtCore.QSize(200, 30))
+        font = QtGui.QFont()
+        font.setPointSize(15)
+        self.specialization_input.setFont(font)
+        self.specialization_input.setObjectName("specialization_input")
+        self.phone_input = QtWidgets.QComboBox(parent=self.widget)
+        self.phone_input.setGeometry(QtCore.QRect(140, 370, 200, 30))
+        self.phone_input.setStyleSheet("font: 12pt \"Segoe UI\";")
+        self.phone_input.setObjectName("phone_input")
+        self.phone_input.addItem("")
+        self.phone_input.addItem("")
+        self.branch_input = QtWidgets.QLineEdit(parent=self.widget)
+        self.branch_input.setEnabled(True)
+        self.branch_input.setGeometry(QtCore.QRect(140, 180, 200, 30))
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.branch_input.sizePolicy().hasHeightForWidth())
+        self.branch_input.setSizePolicy(sizePolicy)
+        self.branch_input.setMinimumSize(QtCore.QSize(200, 30))
+        font = QtGui.QFont()
+        font.setPointSize(15)
+        self.branch_input.setFont(font)
+        self.branch_input.setObjectName("branch_input")
+        self.specialization_label = QtWidgets.QLabel(parent=self.widget)
+        self.specialization_label.setGeometry(QtCore.QRect(140, 240, 125, 24))
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.specialization_label.sizePolicy().hasHeightForWidth())
+        self.specialization_label.setSizePolicy(sizePolicy)
+        self.specialization_label.setStyleSheet("font: 16pt \"Times New Roman\";")
+        self.specialization_label.setObjectName("specialization_label")
+        self.gender_label = QtWidgets.QLabel(parent=self.widget)
+        self.gender_label.setGeometry(QtCore.QRect(150, 440, 91, 16))
+        self.gender_label.setStyleSheet("font: 16pt \"Times New Roman\";")
+        self.gender_label.setObjectName("gender_label")
+        self.gender_input = QtWidgets.QComboBox(parent=self.widget)
+        self.gender_input.setGeometry(QtCore.QRect(140, 470, 200, 30))
+        self.gender_input.setStyleSheet("font: 12pt \"Segoe UI\";")
+        self.gender_input.setObjectName("gender_input")
+        self.gender_input.addItem("")
+        self.gender_input.addItem("")
+        self.verticalLayout.addWidget(self.widget)
+        FillDetailsWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(FillDetailsWindow)
+        QtCore.QMetaObject.connectSlotsByName(FillDetailsWindow)
+
+    def retranslateUi(self, FillDetailsWindow):
+        _translate = QtCore.QCoreApplication.translate
+        self.phone_label.setText(_translate("FillDetailsWindow", "Requirement:"))
+        self.branch_label.setText(_translate("FillDetailsWindow", "Branch:"))
+        self.submit_button.setText(_translate("FillDetailsWindow", "Submit"))
+        self.name_label.setText(_translate("FillDetailsWindow", "Name:"))
+        self.welcome_label.setText(_translate("FillDetailsWindow", "Please fill in the required details"))
+        self.phone_input.setItemText(0, _translate("FillDetailsWindow", "Higher Studies"))
+        self.phone_input.setItemText(1, _translate("FillDetailsWindow", "Professional"))
+        self.specialization_label.setText(_translate("FillDetailsWindow", "Specialization:"))
+        self.gender_label.setText(_translate("FillDetailsWindow", "Gender:"))
+        self.gender_input.setItemText(0, _translate("FillDetailsWindow", "Male"))
+        self.gender_input.setItemText(1, _translate("FillDetailsWindow", "Female"))
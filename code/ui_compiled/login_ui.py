@@ -0,0 +1,107 @@
+# ui-digest: 640ddda850de5ac59691e0197be44202aa95f6137ce69fb3221722abc33778ff
+# Form implementation generated from reading ui file '../UI/login.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1110, 629)
+        MainWindow.setStyleSheet("background-color: rgb(47, 30, 111);")
+        self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
+        self.centralwidget.setEnabled(True)
+        self.centralwidget.setObjectName("centralwidget")
+        self.label = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label.setGeometry(QtCore.QRect(100, 30, 221, 71))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(24)
+        font.setBold(True)
+        font.setItalic(False)
+        font.setUnderline(True)
+        self.label.setFont(font)
+        self.label.setStyleSheet("color: rgb(255, 255, 255);\n"
+"\n"
+"font: 20pt \"Segoe UI\";\n"
+"font: 700 24pt \"Segoe UI\";")
+        self.label.setScaledContents(False)
+        self.label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.label.setObjectName("label")
+        self.label_2 = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_2.setGeometry(QtCore.QRect(110, 150, 291, 31))
+        self.label_2.setStyleSheet("color: rgb(255, 255, 255);\n"
+"font: 12pt \"Segoe UI\";\n"
+"font: 24pt \"Segoe UI\";")
+        self.label_2.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.label_2.setObjectName("label_2")
+        self.label_3 = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_3.setGeometry(QtCore.QRect(120, 280, 151, 31))
+        self.label_3.setStyleSheet("color: rgb(255, 255, 255);\n"
+"font: 24pt \"Segoe UI\";")
+        self.label_3.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.label_3.setObjectName("label_3")
+        self.lineEdit = QtWidgets.QLineEdit(parent=self.centralwidget)
+        self.lineEdit.setGeometry(QtCore.QRect(120, 210, 241, 31))
+        self.lineEdit.setStyleSheet("background-color: rgb(255, 255, 255);\n"
+"font: 16pt \"Segoe UI\";")
+        self.lineEdit.setObjectName("lineEdit")
+        self.lineEdit_2 = QtWidgets.QLineEdit(parent=self.centralwidget)
+        self.lineEdit_2.setGeometry(QtCore.QRect(120, 330, 241, 31))
+        self.lineEdit_2.setStyleSheet("background-color: rgb(255, 255, 255);\n"
+"font: 16pt \"Segoe UI\";")
+        self.lineEdit_2.setObjectName("lineEdit_2")
+        self.pushButton = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.pushButton.setEnabled(True)
+        self.pushButton.setGeometry(QtCore.QRect(120, 420, 121, 41))
+        self.pushButton.setStyleSheet("background-color: rgb(255, 255, 255);\n"
+"background-color: rgb(137, 174, 255);\n"
+"font: 16pt \"Segoe UI\";")
+        self.pushButton.setObjectName("pushButton")
+        self.label_4 = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_4.setGeometry(QtCore.QRect(80, 510, 291, 31))
+        self.label_4.setStyleSheet("color: rgb(255, 255, 255);\n"
+"font: 12pt \"Segoe UI\";")
+        self.label_4.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.label_4.setObjectName("label_4")
+        self.pushButton_2 = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.pushButton_2.setGeometry(QtCore.QRect(400, 510, 81, 31))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setItalic(False)
+        self.pushButton_2.setFont(font)
+        self.pushButton_2.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.ArrowCursor))
+        self.pushButton_2.setStyleSheet("font: 12pt \"Segoe UI\";\n"
+"color: rgb(0, 0, 0);\n"
+"background-color: rgb(137, 174, 255);\n"
+"")
+        self.pushButton_2.setObjectName("pushButton_2")
+        self.label_5 = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_5.setGeometry(QtCore.QRect(570, 0, 541, 631))
+        self.label_5.setStyleSheet("background-color: rgb(255, 255, 255);")
+        self.label_5.setText("")
+        self.label_5.setPixmap(QtGui.QPixmap("../UI/../office.jpg"))
+        self.label_5.setScaledContents(True)
+        self.label_5.setObjectName("label_5")
+        MainWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.label.setText(_translate("MainWindow", "LOGIN"))
+        self.label_2.setText(_translate("MainWindow", "Username/ Prof. ID :"))
+        self.label_3.setText(_translate("MainWindow", "Password :"))
+        self.pushButton.setText(_translate("MainWindow", "Login"))
+        self.label_4.setText(_translate("MainWindow", "Don\'t have account? Signup now"))
+        self.pushButton_2.setText(_translate("MainWindow", "SignUp"))
@@ -0,0 +1,123 @@
+# ui-digest: 0e999c7807ce6e66234613ee7cc9509e9e76dbc0a077e2f5d441d01319e9252e
+# Form implementation generated from reading ui file '../UI/signup.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_SignUpWindow(object):
+    def setupUi(self, SignUpWindow):
+        SignUpWindow.setObjectName("SignUpWindow")
+        SignUpWindow.resize(1110, 629)
+        SignUpWindow.setStyleSheet("background-color: rgb(47, 30, 111);")
+        self.centralwidget = QtWidgets.QWidget(parent=SignUpWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.label = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label.setGeometry(QtCore.QRect(100, 20, 221, 71))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(24)
+        font.setBold(True)
+        font.setItalic(False)
+        font.setUnderline(True)
+        self.label.setFont(font)
+        self.label.setStyleSheet("color: rgb(255, 255, 255);\n"
+"font: 20pt \"Segoe UI\";\n"
+"font: 700 24pt \"Segoe UI\";")
+        self.label.setScaledContents(False)
+        self.label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.label.setObjectName("label")
+        self.label_2 = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_2.setGeometry(QtCore.QRect(80, 110, 151, 31))
+        self.label_2.setStyleSheet("color: rgb(255, 255, 255);\n"
+"font: 24pt \"Segoe UI\";")
+        self.label_2.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.label_2.setObjectName("label_2")
+        self.label_3 = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_3.setGeometry(QtCore.QRect(80, 210, 151, 31))
+        self.label_3.setStyleSheet("color: rgb(255, 255, 255);\n"
+"font: 24pt \"Segoe UI\";")
+        self.label_3.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.label_3.setObjectName("label_3")
+        self.label_4 = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_4.setGeometry(QtCore.QRect(100, 330, 151, 31))
+        self.label_4.setStyleSheet("color: rgb(255, 255, 255);\n"
+"font: 24pt \"Segoe UI\";")
+        self.label_4.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.label_4.setObjectName("label_4")
+        self.lineEdit = QtWidgets.QLineEdit(parent=self.centralwidget)
+        self.lineEdit.setGeometry(QtCore.QRect(110, 160, 241, 31))
+        self.lineEdit.setStyleSheet("background-color: rgb(255, 255, 255);\n"
+"font: 16pt \"Segoe UI\";")
+        self.lineEdit.setObjectName("lineEdit")
+        self.lineEdit_2 = QtWidgets.QLineEdit(parent=self.centralwidget)
+        self.lineEdit_2.setGeometry(QtCore.QRect(110, 270, 241, 31))
+        self.lineEdit_2.setStyleSheet("background-color: rgb(255, 255, 255);\n"
+"font: 16pt \"Segoe UI\";")
+        self.lineEdit_2.setObjectName("lineEdit_2")
+        self.lineEdit_3 = QtWidgets.QLineEdit(parent=self.centralwidget)
+        self.lineEdit_3.setGeometry(QtCore.QRect(110, 380, 241, 31))
+        self.lineEdit_3.setStyleSheet("background-color: rgb(255, 255, 255);\n"
+"font: 16pt \"Segoe UI\";")
+        self.lineEdit_3.setObjectName("lineEdit_3")
+        self.pushButton = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.pushButton.setEnabled(True)
+        self.pushButton.setGeometry(QtCore.QRect(110, 460, 121, 41))
+        self.pushButton.setStyleSheet("background-color: rgb(255, 255, 255);\n"
+"background-color: rgb(137, 174, 255);\n"
+"font: 16pt \"Segoe UI\";")
+        self.pushButton.setObjectName("pushButton")
+        self.pushButton_2 = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.pushButton_2.setGeometry(QtCore.QRect(410, 540, 81, 31))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setItalic(False)
+        self.pushButton_2.setFont(font)
+        self.pushButton_2.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.ArrowCursor))
+        self.pushButton_2.setStyleSheet("font: 12pt \"Segoe UI\";\n"
+"color: rgb(0, 0, 0);\n"
+"background-color: rgb(137, 174, 255);\n"
+"")
+        self.pushButton_2.setObjectName("pushButton_2")
+        self.admin_button = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.admin_button.setGeometry(QtCore.QRect(240, 460, 121, 41))
+        self.admin_button.setStyleSheet("background-color: rgb(255, 255, 255);\n"
+"background-color: rgb(137, 174, 255);\n"
+"font: 16pt \"Segoe UI\";")
+        self.admin_button.setObjectName("admin_button")
+        self.label_5 = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_5.setGeometry(QtCore.QRect(50, 530, 331, 41))
+        self.label_5.setStyleSheet("color: rgb(255, 255, 255);\n"
+"font: 12pt \"Segoe UI\";")
+        self.label_5.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.label_5.setObjectName("label_5")
+        self.label_6 = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_6.setGeometry(QtCore.QRect(570, 0, 541, 631))
+        self.label_6.setStyleSheet("background-color: rgb(255, 255, 255);")
+        self.label_6.setText("")
+        self.label_6.setPixmap(QtGui.QPixmap("../UI/../office.jpg"))
+        self.label_6.setScaledContents(True)
+        self.label_6.setObjectName("label_6")
+        SignUpWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(SignUpWindow)
+        QtCore.QMetaObject.connectSlotsByName(SignUpWindow)
+
+    def retranslateUi(self, SignUpWindow):
+        _translate = QtCore.QCoreApplication.translate
+        SignUpWindow.setWindowTitle(_translate("SignUpWindow", "Sign Up"))
+        self.label.setText(_translate("SignUpWindow", "Sign Up"))
+        self.label_2.setText(_translate("SignUpWindow", "Name :"))
+        self.label_3.setText(_translate("SignUpWindow", "Email :"))
+        self.label_4.setText(_translate("SignUpWindow", "Password :"))
+        self.pushButton.setText(_translate("SignUpWindow", "Sign Up"))
+        self.pushButton_2.setText(_translate("SignUpWindow", "Login"))
+        self.admin_button.setText(_translate("SignUpWindow", "Admin"))
+        self.label_5.setText(_translate("SignUpWindow", "Already have an account?"))
@@ -0,0 +1,120 @@
+import hashlib
+import importlib
+import io
+import os
+import sys
+from PyQt6 import uic
+
+UI_DIR = "../UI"
+# Python classes generated from the .ui files, kept next to this module
+COMPILED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ui_compiled")
+COMPILED_PACKAGE = "LOR_python_app.code.ui_compiled"
+
+# First line of a generated module, recording the .ui file it was generated from
+DIGEST_PREFIX = "# ui-digest: "
+
+_form_classes = {}
+_windows = {}
+
+
+def _ui_digest(ui_path):
+    with open(ui_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _compiled_path(name):
+    return os.path.join(COMPILED_DIR, f"{name}_ui.py")
+
+
+def is_stale(name):
+    """
+    Return True if the generated module for ../UI/<name>.ui is missing or was
+    generated from a different version of the .ui file.
+    """
+    try:
+        with open(_compiled_path(name), encoding="utf-8") as f:
+            first_line = f.readline().strip()
+    except OSError:
+        return True
+    return first_line != DIGEST_PREFIX + _ui_digest(os.path.join(UI_DIR, f"{name}.ui"))
+
+
+def compile_form(name):
+    # Generate the module with pyuic, tagged with the digest of its .ui file
+    ui_path = os.path.join(UI_DIR, f"{name}.ui")
+    source = io.StringIO()
+    uic.compileUi(ui_path, source)
+    os.makedirs(COMPILED_DIR, exist_ok=True)
+    with open(_compiled_path(name), "w", encoding="utf-8") as f:
+        f.write(DIGEST_PREFIX + _ui_digest(ui_path) + "\n")
+        f.write(source.getvalue())
+
+
+def compile_all():
+    """
+    Regenerate every stale form. Returns the names of the forms compiled.
+    """
+    compiled = []
+    for file_name in sorted(os.listdir(UI_DIR)):
+        name, extension = os.path.splitext(file_name)
+        if extension == ".ui" and is_stale(name):
+            compile_form(name)
+            compiled.append(name)
+    return compiled
+
+
+def _form_class(name):
+    form_class = _form_classes.get(name)
+    if form_class is None:
+        module_name = f"{COMPILED_PACKAGE}.{name}_ui"
+        if is_stale(name):
+            compile_form(name)
+            importlib.invalidate_caches()
+            if module_name in sys.modules:
+                importlib.reload(sys.modules[module_name])
+        module = importlib.import_module(module_name)
+        form_class = next(value for key, value in vars(module).items() if key.startswith("Ui_"))
+        _form_classes[name] = form_class
+    return form_class
+
+
+def setup_ui(window, name):
+    """
+    Build the widgets of ../UI/<name>.ui on window, like loadUi does, but from
+    the class generated ahead of time instead of parsing the XML each time.
+    """
+    try:
+        form_class = _form_class(name)
+    except OSError as e:
+        # e.g. a read-only install that cannot regenerate a stale form
+        print("Error occurred while compiling the UI form:", e)
+        uic.loadUi(os.path.join(UI_DIR, f"{name}.ui"), window)
+        return
+    form = form_class()
+    form.setupUi(window)
+    # loadUi makes the widgets attributes of the window, the windows rely on that
+    for attribute, value in vars(form).items():
+        setattr(window, attribute, value)
+
+
+def reuse_window(window_class, *args):
+    """
+    Return the window of this class opened before, reset for another use, or
+    create it the first time. Windows that hold per-session state
+    implement reset(*args).
+    """
+    window = _windows.get(window_class)
+    if window is None:
+        window = _windows[window_class] = window_class(*args)
+    else:
+        window.reset(*args)
+    return window
+
+
+def main():
+    compiled = compile_all()
+    print(f"Compiled {', '.join(compiled)}" if compiled else "All UI forms are up to date.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,18 @@
+import re
+
+# Signup rules shared by the signup window and the bulk import
+EMAIL_PATTERN = re.compile('[a-z0-9A-Z]*@student.sfit.ac.in')
+USERNAME_PATTERN = re.compile('[a-z0-9A-Z_]*')
+
+
+def validate_signup(name, email, password):
+    """
+    Return the error message for invalid signup values, or None if they are valid.
+    """
+    if not EMAIL_PATTERN.match(email):
+        return "Invalid credentials.Please enter college email address"
+    if not USERNAME_PATTERN.match(name):
+        return "Please enter a combination from a-z,A-Z,0-9,_"
+    if not name or not email or not password:
+        return "Please fill in all fields."
+    return None
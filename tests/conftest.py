@@ -0,0 +1,74 @@
+import os
+import sys
+import types
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CODE_DIR = os.path.join(ROOT, "code")
+
+# The modules import each other as LOR_python_app.code, the name of the checkout folder,
+# so register the checkout under that name wherever it was cloned
+if "LOR_python_app" not in sys.modules:
+    package = types.ModuleType("LOR_python_app")
+    package.__path__ = [ROOT]
+    sys.modules["LOR_python_app"] = package
+
+from LOR_python_app.code import branch_matcher, mailer, repository
+from LOR_python_app.code.migrations import run_migrations
+
+STUDENTS = [
+    repository.Applicant("alice", "alice@student.sfit.ac.in", "pw", "Alice Rao", "Comps", "AI",
+                         "Higher Studies", "Female"),
+    repository.Applicant("bob", "bob@student.sfit.ac.in", "pw", "Bob Shah", "EXTC", "VLSI",
+                         "Professional", "Male"),
+    repository.Applicant("carol", "carol@student.sfit.ac.in", "pw", "Carol Dsouza", "Info Tech", "Networks",
+                         "Higher Studies", "Female"),
+]
+
+
+class IdleMailWorker:
+    # Stands in for the mail worker thread, so queued messages stay in the outbox
+    def wake(self):
+        pass
+
+
+@pytest.fixture
+def databases(tmp_path):
+    """
+    Point the repository at migrated scratch copies of signup.db and
+    admin.db in tmp_path, and back at the real ones afterwards.
+    """
+    signup_path, admin_path = repository.SIGNUP_DB_PATH, repository.ADMIN_DB_PATH
+    repository.configure(str(tmp_path / "signup.db"), str(tmp_path / "admin.db"))
+    run_migrations()
+    yield tmp_path
+    repository.close_connections()
+    repository.configure(signup_path, admin_path)
+
+
+@pytest.fixture
+def code_dir(monkeypatch):
+    # Templates and branches.json are found relative to code/, like when the app is started
+    monkeypatch.chdir(CODE_DIR)
+    return CODE_DIR
+
+
+@pytest.fixture
+def students(databases, monkeypatch):
+    """
+    The STUDENTS, all pending, and two admins (professor ids 1 and 2) in
+    the scratch databases. Queued emails are not sent.
+    """
+    monkeypatch.setattr(mailer, "start_mail_worker", IdleMailWorker)
+    repository.insert_admin("Prof A", "pw", 1)
+    repository.insert_admin("Prof B", "pw", 2)
+    repository.insert_users(STUDENTS)
+    yield databases
+    # The matcher and its cache are module-wide, do not leak them into other tests
+    branch_matcher.set_matcher(None)
+
+
+@pytest.fixture
+def statuses(databases):
+    # Call it for the current {username: application status}
+    return lambda: dict(repository.signup_db().execute("SELECT name, status FROM users").fetchall())
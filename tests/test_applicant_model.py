@@ -0,0 +1,157 @@
+import pytest
+from LOR_python_app.code import repository
+
+pytest.importorskip("PyQt6.QtCore")
+from PyQt6.QtCore import Qt
+from LOR_python_app.code.applicant_model import DATA_COLUMNS, SORT_COLUMNS, ApplicantTableModel, _match_query
+
+SORTABLE = [DATA_COLUMNS.index(column) for column in SORT_COLUMNS]
+ORDERS = [Qt.SortOrder.AscendingOrder, Qt.SortOrder.DescendingOrder]
+
+
+@pytest.fixture
+def model(databases):
+    repository.insert_users([
+        repository.Applicant(f"student{i}", f"student{i}@student.sfit.ac.in", "pw", f"Student {i % 3}",
+                             ["IT", "Electrical", None][i % 3], "AI", "Higher Studies", ["Male", "Female"][i % 2])
+        for i in range(7)
+    ])
+    model = ApplicantTableModel(repository.signup_db())
+    # Small pages, so a few rows are enough to page through several times
+    model.FETCH_SIZE = 3
+    return model
+
+
+def page_plans(model, action):
+    """
+    Run action and return the query plan of every page it read.
+    """
+    statements = []
+    connection = model._connection
+    connection.set_trace_callback(statements.append)
+    try:
+        action()
+    finally:
+        connection.set_trace_callback(None)
+    return [[row[3] for row in connection.execute("EXPLAIN QUERY PLAN " + statement)]
+            for statement in statements if statement.startswith("SELECT u.rowid")]
+
+
+@pytest.mark.parametrize("status", [repository.STATUS_PENDING, None])
+@pytest.mark.parametrize("order", ORDERS)
+@pytest.mark.parametrize("column", SORTABLE)
+def test_sorted_pages_are_read_in_index_order(model, column, order, status):
+    model.set_filters(status=status)
+
+    def read_pages():
+        model.sort(column, order)
+        model.fetchMore()
+
+    plans = page_plans(model, read_pages)
+
+    # The first page and the keyset page after it
+    assert len(plans) == 2
+    for plan in plans:
+        assert not [step for step in plan if "TEMP B-TREE" in step], plan
+        assert any("INDEX" in step for step in plan), plan
+
+
+def read_all(model):
+    while model.canFetchMore():
+        model.fetchMore()
+    return [model.row_id(row) for row in range(model.rowCount())]
+
+
+@pytest.mark.parametrize("status", [repository.STATUS_PENDING, None])
+@pytest.mark.parametrize("order", ORDERS)
+@pytest.mark.parametrize("column", SORTABLE)
+def test_keyset_pages_have_no_duplicates_or_gaps(model, column, order, status):
+    repository.set_application_status(["student2", "student5"], repository.STATUS_REJECTED)
+    repository.signup_db().commit()
+    repository.archive_users([4])
+    model.set_filters(status=status)
+
+    model.sort(column, order)
+    rowids = read_all(model)
+
+    # Names sort like the model does: NULL as '', ties broken by rowid in the same direction
+    cursor = repository.signup_db().execute(f"SELECT rowid, {DATA_COLUMNS[column]}, status FROM users "
+                                            f"WHERE archived_at IS NULL")
+    expected = sorted(((value or "", rowid) for rowid, value, row_status in cursor.fetchall()
+                       if status is None or row_status == status),
+                      reverse=order == Qt.SortOrder.DescendingOrder)
+    assert rowids == [rowid for _, rowid in expected]
+    assert model._has_more is False
+
+
+def fts_rowids(order):
+    cursor = repository.signup_db().execute(f"SELECT rowid FROM users_search WHERE users_search MATCH ? "
+                                            f"ORDER BY {order}", (_match_query("student"),))
+    return [row[0] for row in cursor.fetchall()]
+
+
+def test_one_character_words_wait_for_the_next_keystroke():
+    assert _match_query("s") is None
+    assert _match_query("Student a") == '"Student"*'
+    assert _match_query("st ai") == '"st"* "ai"*'
+
+
+def test_narrow_search_lists_best_matches_first(model):
+    model.set_search("student")
+
+    assert model._ranked
+    assert read_all(model) == fts_rowids("rank, rowid")
+
+
+def test_broad_search_lists_matches_in_signup_order(model):
+    model.RANKED_SEARCH_LIMIT = 2
+    model.set_search("student")
+
+    assert not model._ranked
+    assert read_all(model) == fts_rowids("rowid")
+
+
+@pytest.mark.parametrize("ranked_limit", [1000, 2])
+@pytest.mark.parametrize("order", ORDERS)
+def test_sorted_search_pages_in_column_order(model, order, ranked_limit):
+    model.RANKED_SEARCH_LIMIT = ranked_limit
+    model.sort(DATA_COLUMNS.index("full_name"), order)
+    model.set_search("student")
+
+    rowids = read_all(model)
+    expected = sorted(fts_rowids("rowid"), key=lambda rowid: (f"Student {(rowid - 1) % 3}", rowid),
+                      reverse=order == Qt.SortOrder.DescendingOrder)
+    assert rowids == expected
+
+
+def test_search_keeps_the_filters(model):
+    repository.set_application_status(["student3"], repository.STATUS_REJECTED)
+    repository.signup_db().commit()
+    repository.archive_users([2])
+    model.set_filters(gender="Female")
+    model.set_search("student")
+
+    # Odd students are Female; student1 (rowid 2) is archived and student3 rejected
+    assert [model.applicant(row).name for row in range(len(read_all(model)))] == ["student5"]
+
+
+@pytest.mark.parametrize("ranked_limit", [1000, 2])
+@pytest.mark.parametrize("column", [None] + SORTABLE)
+def test_search_pages_never_run_the_match_per_applicant(model, column, ranked_limit):
+    model.RANKED_SEARCH_LIMIT = ranked_limit
+    if column is not None:
+        model.sort(column)
+
+    def read_pages():
+        model.set_search("student")
+        model.fetchMore()
+
+    plans = page_plans(model, read_pages)
+
+    assert len(plans) == 2
+    for plan in plans:
+        # A rowid = constraint on users_search means the full-text query runs once per applicant
+        assert not [step for step in plan if "VIRTUAL TABLE INDEX 0:=" in step], plan
+        if column is None and ranked_limit == 2:
+            # Broad unsorted searches stream the matches in rowid order
+            assert not [step for step in plan if "TEMP B-TREE" in step], plan
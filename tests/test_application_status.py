@@ -0,0 +1,160 @@
+import smtplib
+import sqlite3
+import pytest
+from LOR_python_app.code import mailer, repository
+from LOR_python_app.code.migrations import SIGNUP_MIGRATIONS, _add_application_status, migrate
+from LOR_python_app.code.repository import STATUS_GENERATED, STATUS_PENDING, STATUS_REJECTED, STATUS_SENT
+
+
+class FakeSMTP:
+    def __init__(self, error=None):
+        self.error = error
+        self.sent = []
+
+    def send_message(self, msg):
+        if self.error is not None:
+            raise self.error
+        self.sent.append(msg)
+
+
+def send_outbox(monkeypatch, smtp):
+    worker = mailer.MailWorker()
+    monkeypatch.setattr(worker, "_connection", lambda: smtp)
+    return worker.send_batch(repository.signup_db())
+
+
+def test_students_start_pending(students, statuses):
+    assert set(statuses().values()) == {STATUS_PENDING}
+    assert [a.name for _, a in repository.list_applicants()] == ["alice", "bob", "carol"]
+
+
+def test_status_changes_record_when(students, statuses):
+    repository.set_application_status(["alice", "bob"], STATUS_REJECTED)
+    repository.signup_db().commit()
+
+    assert statuses() == {"alice": STATUS_REJECTED, "bob": STATUS_REJECTED, "carol": STATUS_PENDING}
+    rejected_at = repository.signup_db().execute("SELECT rejected_at FROM users WHERE name = 'alice'").fetchone()[0]
+    assert rejected_at is not None
+
+
+def test_only_from_leaves_other_statuses_alone(students, statuses):
+    repository.set_application_status(["bob"], STATUS_REJECTED)
+    repository.set_application_status(["alice", "bob"], STATUS_GENERATED, only_from=STATUS_PENDING)
+    repository.signup_db().commit()
+
+    assert statuses() == {"alice": STATUS_GENERATED, "bob": STATUS_REJECTED, "carol": STATUS_PENDING}
+
+
+def test_status_change_is_part_of_the_callers_transaction(students, statuses):
+    connection = repository.signup_db()
+    with connection:
+        repository.set_application_status(["alice"], STATUS_SENT)
+    connection.execute("BEGIN")
+    repository.set_application_status(["bob"], STATUS_SENT)
+    connection.rollback()
+
+    assert statuses() == {"alice": STATUS_SENT, "bob": STATUS_PENDING, "carol": STATUS_PENDING}
+
+
+def test_listing_and_letter_runs_filter_on_status(students):
+    repository.set_application_status(["alice"], STATUS_GENERATED)
+    repository.set_application_status(["bob"], STATUS_REJECTED)
+    repository.signup_db().commit()
+
+    assert [a.name for _, a in repository.list_applicants()] == ["carol"]
+    assert [a.name for _, a in repository.list_applicants(status=STATUS_REJECTED)] == ["bob"]
+    assert [a.name for _, a in repository.list_applicants(status=None)] == ["alice", "bob", "carol"]
+    requirements = ["Higher Studies", "Professional"]
+    assert [a.name for a in repository.fetch_eligible_applicants(requirements)] == ["carol"]
+    assert [a.name for a in repository.fetch_eligible_applicants(
+        requirements, [STATUS_PENDING, STATUS_GENERATED])] == ["alice", "carol"]
+
+
+def test_generated_letter_moves_only_pending_students(students, statuses):
+    repository.set_application_status(["bob"], STATUS_SENT)
+    repository.signup_db().commit()
+
+    repository.record_generated_letter("alice", "hash-a", "a.docx", "digest")
+    repository.record_generated_letter("bob", "hash-b", "b.docx", "digest")
+
+    assert statuses() == {"alice": STATUS_GENERATED, "bob": STATUS_SENT, "carol": STATUS_PENDING}
+
+
+def test_queued_emails_move_the_student(students, statuses):
+    mailer.queue_letter_email("alice@student.sfit.ac.in", b"letter", "Alice_LOR.docx", "alice")
+    mailer.queue_rejection_email("bob@student.sfit.ac.in", "bob")
+
+    assert statuses() == {"alice": STATUS_GENERATED, "bob": STATUS_REJECTED, "carol": STATUS_PENDING}
+    rows = repository.signup_db().execute("SELECT username, application_status FROM outbox ORDER BY id").fetchall()
+    assert rows == [("alice", STATUS_GENERATED), ("bob", STATUS_REJECTED)]
+
+
+def test_delivered_letter_marks_the_student_sent(students, monkeypatch, statuses):
+    message_id = mailer.queue_letter_email("alice@student.sfit.ac.in", b"letter", "Alice_LOR.docx", "alice")
+    smtp = FakeSMTP()
+
+    assert send_outbox(monkeypatch, smtp) == 1
+
+    assert len(smtp.sent) == 1
+    assert statuses()["alice"] == STATUS_SENT
+    assert mailer.get_delivery_status(message_id)[:3] == ("sent", 1, None)
+    # The letter is not kept in the outbox once delivered
+    attachment = repository.signup_db().execute("SELECT attachment FROM outbox WHERE id = ?",
+                                                (message_id,)).fetchone()[0]
+    assert attachment is None
+
+
+def test_delivered_rejection_does_not_mark_the_student_sent(students, monkeypatch, statuses):
+    mailer.queue_rejection_email("bob@student.sfit.ac.in", "bob")
+
+    send_outbox(monkeypatch, FakeSMTP())
+
+    assert statuses()["bob"] == STATUS_REJECTED
+
+
+def test_letter_delivered_after_a_rejection_does_not_undo_it(students, monkeypatch, statuses):
+    mailer.queue_letter_email("alice@student.sfit.ac.in", b"letter", "Alice_LOR.docx", "alice")
+    mailer.queue_rejection_email("alice@student.sfit.ac.in", "alice")
+
+    send_outbox(monkeypatch, FakeSMTP())
+
+    assert statuses()["alice"] == STATUS_REJECTED
+
+
+def test_failed_delivery_keeps_the_letter_for_a_retry(students, monkeypatch, statuses):
+    message_id = mailer.queue_letter_email("alice@student.sfit.ac.in", b"letter", "Alice_LOR.docx", "alice")
+
+    send_outbox(monkeypatch, FakeSMTP(smtplib.SMTPRecipientsRefused({})))
+
+    assert statuses()["alice"] == STATUS_GENERATED
+    status, attempts, last_error, _ = mailer.get_delivery_status(message_id)
+    assert (status, attempts) == ("pending", 1)
+    assert last_error is not None
+    attachment = repository.signup_db().execute("SELECT attachment FROM outbox WHERE id = ?",
+                                                (message_id,)).fetchone()[0]
+    assert attachment == b"letter"
+
+
+def test_existing_applications_get_their_status_from_history(tmp_path):
+    connection = sqlite3.connect(str(tmp_path / "signup.db"))
+    migrate(connection, SIGNUP_MIGRATIONS[:SIGNUP_MIGRATIONS.index(_add_application_status)])
+    connection.executemany("INSERT INTO users (name, email, password) VALUES (?, ?, 'pw')",
+                           [(name, f"{name}@student.sfit.ac.in") for name in ("alice", "bob", "carol", "dave")])
+    connection.executemany("INSERT INTO generated_letters (content_hash, username, file_path, template_digest, "
+                           "created_at) VALUES (?, ?, ?, 'digest', ?)",
+                           [("hash-a", "alice", "a.docx", 10), ("hash-b", "bob", "b.docx", 10),
+                            ("hash-d", "dave", "d.docx", 30)])
+    connection.executemany("INSERT INTO outbox (recipient, subject, body, status, next_attempt_at, created_at, "
+                           "sent_at) VALUES (?, ?, '', ?, 0, ?, ?)",
+                           [("bob@student.sfit.ac.in", "Recommendation Letter", "sent", 11, 12),
+                            ("carol@student.sfit.ac.in", "Application Rejection", "sent", 20, 21),
+                            ("dave@student.sfit.ac.in", "Application Rejection", "sent", 20, 21)])
+    connection.commit()
+
+    migrate(connection, SIGNUP_MIGRATIONS)
+
+    rows = connection.execute("SELECT name, status FROM users ORDER BY rowid").fetchall()
+    connection.close()
+    # dave was rejected, then a newer letter was generated for him
+    assert rows == [("alice", STATUS_GENERATED), ("bob", STATUS_SENT), ("carol", STATUS_REJECTED),
+                    ("dave", STATUS_GENERATED)]
@@ -0,0 +1,117 @@
+import os
+import shutil
+import sys
+import docx
+import pytest
+from LOR_python_app.code import batch_generate, repository
+from LOR_python_app.code.lor_generator import TEMPLATE_PATHS
+
+# The letter templates are found relative to code/
+pytestmark = pytest.mark.usefixtures("code_dir")
+
+
+def run_batch(monkeypatch, databases, *arguments):
+    monkeypatch.setattr(sys, "argv", ["batch_generate", "--signup-db", str(databases / "signup.db"),
+                                      "--admin-db", str(databases / "admin.db"),
+                                      "--output", str(databases / "letters"), "--workers", "1"] + list(arguments))
+    batch_generate.main()
+
+
+def letters(databases):
+    found = []
+    for folder, _, files in os.walk(databases / "letters"):
+        found.extend(os.path.relpath(os.path.join(folder, name), databases / "letters") for name in files)
+    return sorted(found)
+
+
+def test_letters_are_generated_in_their_branch_folder(students, monkeypatch, capsys, statuses):
+    run_batch(monkeypatch, students, "--professor-id", "1")
+
+    assert "Letters generated: 3  unchanged: 0  failed: 0" in capsys.readouterr().out
+    assert [os.path.dirname(path) for path in letters(students)] == ["Electrical", "IT", "IT"]
+    assert set(statuses().values()) == {repository.STATUS_GENERATED}
+
+
+def test_unchanged_letters_are_skipped(students, monkeypatch, capsys):
+    run_batch(monkeypatch, students, "--professor-id", "1")
+    first = letters(students)
+    capsys.readouterr()
+
+    run_batch(monkeypatch, students, "--professor-id", "1")
+
+    assert "Generating 0 letters with 1 workers (3 unchanged)" in capsys.readouterr().out
+    assert letters(students) == first
+
+
+def test_deleted_letters_are_generated_again(students, monkeypatch, capsys):
+    run_batch(monkeypatch, students, "--professor-id", "1")
+    removed = letters(students)[0]
+    os.remove(students / "letters" / removed)
+    capsys.readouterr()
+
+    run_batch(monkeypatch, students, "--professor-id", "1")
+
+    assert "Generating 1 letters with 1 workers (2 unchanged)" in capsys.readouterr().out
+    assert removed in letters(students)
+
+
+def test_changed_letters_supersede_the_old_ones(students, monkeypatch, capsys):
+    run_batch(monkeypatch, students, "--professor-id", "1")
+    first = letters(students)
+    capsys.readouterr()
+
+    # Another admin signs every letter, so every letter changes
+    run_batch(monkeypatch, students, "--professor-id", "2")
+
+    assert "Letters generated: 3  unchanged: 0  failed: 0" in capsys.readouterr().out
+    second = letters(students)
+    assert len(second) == 3
+    assert not set(first) & set(second)
+    paths = repository.signup_db().execute("SELECT file_path FROM generated_letters").fetchall()
+    assert sorted(os.path.relpath(path, students / "letters") for path, in paths) == second
+
+
+def test_template_change_only_rewrites_its_letters(students, monkeypatch, capsys):
+    template_path = str(students / "LOR.docx")
+    shutil.copy(TEMPLATE_PATHS["Higher Studies"], template_path)
+    monkeypatch.setitem(TEMPLATE_PATHS, "Higher Studies", template_path)
+    run_batch(monkeypatch, students, "--professor-id", "1")
+    capsys.readouterr()
+
+    document = docx.Document(template_path)
+    document.add_paragraph("Reviewed by the department.")
+    document.save(template_path)
+    run_batch(monkeypatch, students, "--professor-id", "1")
+
+    # alice and carol asked for Higher Studies letters, bob's Professional letter is left alone
+    assert "Generating 2 letters with 1 workers (1 unchanged)" in capsys.readouterr().out
+    assert len(letters(students)) == 3
+
+
+def test_default_run_includes_generated_and_sent_students(students, monkeypatch, capsys, statuses):
+    repository.set_application_status(["alice"], repository.STATUS_GENERATED)
+    repository.set_application_status(["bob"], repository.STATUS_SENT)
+    repository.set_application_status(["carol"], repository.STATUS_REJECTED)
+    repository.signup_db().commit()
+
+    run_batch(monkeypatch, students, "--professor-id", "1")
+
+    assert "Letters generated: 2  unchanged: 0  failed: 0" in capsys.readouterr().out
+    # Generating a letter again does not move a sent application back
+    assert statuses() == {"alice": repository.STATUS_GENERATED, "bob": repository.STATUS_SENT,
+                          "carol": repository.STATUS_REJECTED}
+
+
+def test_status_option_limits_the_run(students, monkeypatch, capsys):
+    repository.set_application_status(["alice", "bob", "carol"], repository.STATUS_GENERATED)
+    repository.signup_db().commit()
+
+    run_batch(monkeypatch, students, "--professor-id", "1", "--status", "pending")
+
+    assert "No eligible students found." in capsys.readouterr().out
+    assert letters(students) == []
+
+
+def test_missing_admin_stops_the_run(students, monkeypatch):
+    with pytest.raises(SystemExit, match="No admin found"):
+        run_batch(monkeypatch, students, "--professor-id", "3")
@@ -0,0 +1,116 @@
+import json
+import pytest
+from LOR_python_app.code import branch_matcher, repository
+from LOR_python_app.code.branch_matcher import NgramBranchMatcher, create_matcher, normalize
+
+TAXONOMY = {
+    "IT": ["Information Technology", "Computer Engineering", "Comp Sci", "CS"],
+    "Electrical": ["Electrical Engineering", "Electronics and Telecommunication", "EXTC"],
+}
+
+
+class CountingMatcher(NgramBranchMatcher):
+    # Records what reaches the matcher, i.e. what was not answered from the cache
+    def __init__(self, taxonomy):
+        super(CountingMatcher, self).__init__(taxonomy)
+        self.calls = []
+
+    def match_many(self, texts):
+        self.calls.append(list(texts))
+        return super(CountingMatcher, self).match_many(texts)
+
+
+@pytest.fixture
+def matcher():
+    matcher = CountingMatcher(TAXONOMY)
+    branch_matcher.set_matcher(matcher)
+    yield matcher
+    branch_matcher.set_matcher(None)
+
+
+def test_normalize():
+    assert normalize("  Comp. Sci ") == "comp sci"
+    assert normalize("E&TC") == "e and tc"
+    assert normalize("Electronics & Telecom") == "electronics and telecom"
+
+
+def test_aliases_match_whatever_the_case_and_punctuation():
+    matcher = NgramBranchMatcher(TAXONOMY)
+
+    assert matcher.match("comp sci") == "IT"
+    assert matcher.match("COMP. SCI.") == "IT"
+    assert matcher.match("Information-Technology") == "IT"
+    assert matcher.match("extc") == "Electrical"
+    # The branch names are aliases of themselves
+    assert matcher.match("electrical") == "Electrical"
+
+
+def test_other_texts_match_the_most_similar_alias():
+    matcher = NgramBranchMatcher(TAXONOMY)
+
+    assert matcher.match("Informaton Technolgy") == "IT"
+    assert matcher.match("Computer Engg") == "IT"
+    assert matcher.match("Electronics & Telecom") == "Electrical"
+    assert matcher.match("Electrical Engg") == "Electrical"
+    assert matcher.match_many(["Comp Engineering", "Electronics"]) == ["IT", "Electrical"]
+
+
+def test_texts_sharing_nothing_fall_back_to_the_first_branch():
+    matcher = NgramBranchMatcher(TAXONOMY)
+
+    assert matcher.match("") == "IT"
+    assert matcher.match("???") == "IT"
+
+
+def test_unknown_engine_is_refused():
+    with pytest.raises(ValueError):
+        create_matcher("word2vec", TAXONOMY)
+
+
+def test_taxonomy_table_comes_first(databases, tmp_path, monkeypatch):
+    path = tmp_path / "branches.json"
+    path.write_text(json.dumps({"Mechanical": ["Mech"]}))
+    monkeypatch.setattr(branch_matcher, "TAXONOMY_FILE", str(path))
+
+    assert branch_matcher.load_taxonomy() == {"Mechanical": ["Mech"]}
+
+    connection = repository.signup_db()
+    with connection:
+        connection.executemany("INSERT INTO branch_taxonomy (alias, branch) VALUES (?, ?)",
+                               [("Comps", "IT"), ("EXTC", "Electrical"), ("CS", "IT")])
+    assert branch_matcher.load_taxonomy() == {"IT": ["Comps", "CS"], "Electrical": ["EXTC"]}
+
+
+def test_default_branches_without_a_taxonomy(databases, tmp_path, monkeypatch):
+    monkeypatch.setattr(branch_matcher, "TAXONOMY_FILE", str(tmp_path / "missing.json"))
+
+    assert branch_matcher.load_taxonomy() == {"IT": ["IT"], "Electrical": ["Electrical"]}
+
+
+def test_spellings_of_a_branch_share_a_cache_entry(matcher):
+    results = branch_matcher.get_branch_similarities(["Comp Sci", "comp sci", "Comp. Sci", "EXTC"])
+
+    assert results == ["IT", "IT", "IT", "Electrical"]
+    assert matcher.calls == [["comp sci", "extc"]]
+
+    assert branch_matcher.get_branch_similarity("  COMP SCI ") == "IT"
+    assert matcher.calls == [["comp sci", "extc"]]
+
+
+def test_cache_is_bounded(matcher, monkeypatch):
+    monkeypatch.setattr(branch_matcher, "CACHE_SIZE", 2)
+
+    branch_matcher.get_branch_similarities(["CS", "EXTC", "Comp Sci"])
+    branch_matcher.get_branch_similarities(["CS"])
+
+    # CS was the least recently used entry, so it was evicted and classified again
+    assert matcher.calls == [["cs", "extc", "comp sci"], ["cs"]]
+
+
+def test_setting_a_matcher_clears_the_cache(matcher):
+    branch_matcher.get_branch_similarities(["CS"])
+    other = CountingMatcher({"Electrical": ["CS"]})
+    branch_matcher.set_matcher(other)
+
+    assert branch_matcher.get_branch_similarity("CS") == "Electrical"
+    assert other.calls == [["cs"]]
@@ -0,0 +1,66 @@
+import os
+import sys
+import zipfile
+from LOR_python_app.code import export_lors
+
+
+def add_letter(root, branch, name, data=b"letter"):
+    folder = root / branch
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / name).write_bytes(data)
+
+
+def run_export(monkeypatch, *arguments):
+    monkeypatch.setattr(sys, "argv", ["export_lors"] + [str(argument) for argument in arguments])
+    export_lors.main()
+
+
+def test_missing_letters_folder_exports_nothing(tmp_path, monkeypatch, capsys):
+    archive = tmp_path / "out.zip"
+
+    run_export(monkeypatch, archive, "--output", tmp_path / "All_LORs")
+
+    assert capsys.readouterr().out == "No letters to export.\n"
+    assert not archive.exists()
+
+
+def test_missing_branch_folder_exports_nothing(tmp_path, monkeypatch, capsys):
+    add_letter(tmp_path / "All_LORs", "IT", "Alice_LOR.docx")
+    archive = tmp_path / "out.zip"
+
+    run_export(monkeypatch, archive, "--output", tmp_path / "All_LORs", "--branch", "Electrical")
+
+    assert capsys.readouterr().out == "No letters to export.\n"
+    assert not archive.exists()
+
+
+def test_letters_are_stored_by_branch(tmp_path):
+    root = tmp_path / "All_LORs"
+    add_letter(root, "IT", "Alice_LOR.docx")
+    add_letter(root, "Electrical", "Bob_LOR.docx", b"other letter")
+    add_letter(root, "IT", "notes.txt")
+
+    assert export_lors.export_letters(str(tmp_path / "out.zip"), str(root)) == 2
+
+    with zipfile.ZipFile(tmp_path / "out.zip") as archive:
+        assert archive.namelist() == ["Electrical/Bob_LOR.docx", "IT/Alice_LOR.docx"]
+        assert archive.read("Electrical/Bob_LOR.docx") == b"other letter"
+        assert {info.compress_type for info in archive.infolist()} == {zipfile.ZIP_STORED}
+
+
+def test_incremental_export_only_writes_new_and_changed_letters(tmp_path):
+    root = tmp_path / "All_LORs"
+    manifest = str(tmp_path / "manifest.json")
+    add_letter(root, "IT", "Alice_LOR.docx")
+    add_letter(root, "IT", "Carol_LOR.docx")
+    assert export_lors.export_letters(str(tmp_path / "first.zip"), str(root), manifest_path=manifest) == 2
+
+    # Nothing changed: no archive is left behind and the manifest is kept
+    assert export_lors.export_letters(str(tmp_path / "second.zip"), str(root), manifest_path=manifest) == 0
+    assert not os.path.exists(tmp_path / "second.zip")
+
+    add_letter(root, "IT", "Carol_LOR.docx", b"changed letter")
+    add_letter(root, "Electrical", "Bob_LOR.docx")
+    assert export_lors.export_letters(str(tmp_path / "third.zip"), str(root), manifest_path=manifest) == 2
+    with zipfile.ZipFile(tmp_path / "third.zip") as archive:
+        assert archive.namelist() == ["Electrical/Bob_LOR.docx", "IT/Carol_LOR.docx"]
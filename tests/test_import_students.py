@@ -0,0 +1,101 @@
+import csv
+import os
+import sys
+from LOR_python_app.code import import_students, repository
+
+
+def student(name, email=None, password="pw", **details):
+    return dict(name=name, email=email or f"{name}@student.sfit.ac.in", password=password, **details)
+
+
+def test_valid_students_are_accepted(databases):
+    applicants, rejected = import_students.check_students([
+        student("alice", full_name="Alice Rao", branch="Comps", phone="Higher Studies", gender="Female"),
+        student("bob"),
+    ])
+
+    assert rejected == []
+    assert [a.name for a in applicants] == ["alice", "bob"]
+    assert applicants[0].requirement == "Higher Studies"
+    # Blank optional fields are stored as NULL
+    assert applicants[1].full_name is None
+
+
+def test_invalid_rows_are_rejected_with_their_row_number(databases):
+    applicants, rejected = import_students.check_students([
+        student("alice"),
+        student("bob", email="bob@gmail.com"),
+        student("carol", password=""),
+        student("alice", email="alice2@student.sfit.ac.in"),
+        student("dave", email="alice@student.sfit.ac.in"),
+    ])
+
+    assert [a.name for a in applicants] == ["alice"]
+    assert rejected == [
+        (2, "bob", "Invalid credentials.Please enter college email address"),
+        (3, "carol", "Please fill in all fields."),
+        (4, "alice", "Username already used on row 1"),
+        (5, "dave", "Email already used on row 1"),
+    ]
+
+
+def test_existing_users_are_rejected(databases):
+    repository.insert_user("alice", "alice@student.sfit.ac.in", "pw")
+    repository.insert_user("bob", "bob@student.sfit.ac.in", "pw")
+
+    applicants, rejected = import_students.check_students([
+        student("alice", email="new@student.sfit.ac.in"),
+        student("robert", email="bob@student.sfit.ac.in"),
+        student("carol"),
+    ])
+
+    assert [a.name for a in applicants] == ["carol"]
+    assert rejected == [(1, "alice", "Username already exists"), (2, "robert", "Email already exists")]
+
+
+def write_csv(path, records):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["name", "email", "password", "full_name", "phone"])
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def test_import_inserts_accepted_rows(databases, monkeypatch, capsys):
+    path = databases / "students.csv"
+    write_csv(path, [student("alice", full_name="Alice Rao", phone="Professional"),
+                     student("bob", email="bob@gmail.com", full_name="", phone="")])
+    monkeypatch.setattr(sys, "argv", ["import_students", str(path), "--signup-db", str(databases / "signup.db")])
+
+    import_students.main()
+
+    assert "Imported 1 of 2 students, rejected 1." in capsys.readouterr().out
+    assert repository.get_applicant("alice").requirement == "Professional"
+    assert repository.get_applicant("bob") is None
+
+
+def test_dry_run_inserts_nothing(databases, monkeypatch, capsys):
+    path = databases / "students.csv"
+    write_csv(path, [student("alice", full_name="", phone="")])
+    monkeypatch.setattr(sys, "argv", ["import_students", str(path), "--signup-db", str(databases / "signup.db"),
+                                      "--dry-run"])
+
+    import_students.main()
+
+    assert "Would import 1 of 1 students, rejected 0." in capsys.readouterr().out
+    assert repository.get_applicant("alice") is None
+
+
+def test_import_leaves_admin_db_alone(tmp_path, monkeypatch):
+    monkeypatch.setattr(repository, "SIGNUP_DB_PATH", str(tmp_path / "signup.db"))
+    monkeypatch.setattr(repository, "ADMIN_DB_PATH", str(tmp_path / "admin.db"))
+    path = tmp_path / "students.json"
+    path.write_text('[{"name": "alice", "email": "alice@student.sfit.ac.in", "password": "pw"}]')
+    monkeypatch.setattr(sys, "argv", ["import_students", str(path), "--signup-db", str(tmp_path / "signup.db")])
+
+    try:
+        import_students.main()
+        assert repository.get_applicant("alice") is not None
+    finally:
+        repository.close_connections()
+
+    assert not os.path.exists(tmp_path / "admin.db")
@@ -0,0 +1,111 @@
+import io
+import os
+from docx import Document
+from lxml import etree
+from LOR_python_app.code import lor_templates
+from LOR_python_app.code.lor_templates import CompiledTemplate, _merge_split_placeholders, get_compiled_template
+
+
+def add_runs(paragraph, *texts):
+    # One run per text, the way Word splits a placeholder that was typed in pieces
+    for text in texts:
+        paragraph.add_run(text)
+    return paragraph
+
+
+def write_template(path):
+    document = Document()
+    add_runs(document.add_paragraph(), "Dear {", "full_", "name}, from {dept}")
+    add_runs(document.add_paragraph(), "Kept as {unknown} and {", "also_unknown}")
+    add_runs(document.add_table(rows=1, cols=1).cell(0, 0).paragraphs[0], "Branch: {bra", "nch}")
+    section = document.sections[0]
+    add_runs(section.header.paragraphs[0], "{", "date", "}")
+    add_runs(section.footer.paragraphs[0], "Letter for {full_name}")
+    document.save(str(path))
+    return str(path)
+
+
+def render(template, values):
+    target = io.BytesIO()
+    template.save(values, target)
+    document = Document(io.BytesIO(target.getvalue()))
+    section = document.sections[0]
+    return {
+        "body": [paragraph.text for paragraph in document.paragraphs],
+        "table": document.tables[0].cell(0, 0).text,
+        "header": section.header.paragraphs[0].text,
+        "footer": section.footer.paragraphs[0].text,
+    }
+
+
+def compiled_xml(template):
+    return [etree.tostring(element) for _, element, _ in template._parts]
+
+
+VALUES = {"full_name": "Alice Rao", "dept": "IT", "branch": "Computer Engineering", "date": "1 June 2024"}
+
+
+def test_split_placeholder_moves_into_the_run_where_it_starts():
+    paragraph = add_runs(Document().add_paragraph(), "Dear {", "full_", "name}, from {dept}")
+
+    _merge_split_placeholders(paragraph._p)
+
+    assert [run.text for run in paragraph.runs] == ["Dear {full_name}", "", ", from {dept}"]
+
+
+def test_paragraph_without_split_placeholders_is_left_alone():
+    paragraph = add_runs(Document().add_paragraph(), "Dear ", "{full_name}", ", {dept}")
+    before = etree.tostring(paragraph._p)
+
+    _merge_split_placeholders(paragraph._p)
+
+    assert etree.tostring(paragraph._p) == before
+
+
+def test_placeholders_are_found_in_body_tables_headers_and_footers(tmp_path):
+    template = CompiledTemplate(write_template(tmp_path / "LOR.docx"))
+
+    assert template.placeholders == {"full_name", "dept", "unknown", "also_unknown", "branch", "date"}
+
+
+def test_placeholders_are_filled_everywhere(tmp_path):
+    template = CompiledTemplate(write_template(tmp_path / "LOR.docx"))
+
+    rendered = render(template, VALUES)
+
+    assert rendered["body"] == ["Dear Alice Rao, from IT", "Kept as {unknown} and {also_unknown}"]
+    assert rendered["table"] == "Branch: Computer Engineering"
+    assert rendered["header"] == "1 June 2024"
+    assert rendered["footer"] == "Letter for Alice Rao"
+
+
+def test_compiled_template_is_unchanged_by_rendering(tmp_path):
+    template = CompiledTemplate(write_template(tmp_path / "LOR.docx"))
+    compiled = compiled_xml(template)
+
+    first = render(template, VALUES)
+    second = render(template, {"full_name": "Bob Shah"})
+
+    assert compiled_xml(template) == compiled
+    assert first["footer"] == "Letter for Alice Rao"
+    # Nothing of the first letter leaks into the second
+    assert second["body"] == ["Dear Bob Shah, from {dept}", "Kept as {unknown} and {also_unknown}"]
+    assert second["table"] == "Branch: {branch}"
+    assert second["header"] == "{date}"
+
+
+def test_template_is_compiled_again_when_the_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(lor_templates, "_compiled_templates", {})
+    path = write_template(tmp_path / "LOR.docx")
+    template = get_compiled_template(path)
+    assert get_compiled_template(path) is template
+
+    document = Document(path)
+    document.add_paragraph("{signature}")
+    document.save(path)
+    os.utime(path, ns=(template.mtime + 10 ** 9, template.mtime + 10 ** 9))
+
+    changed = get_compiled_template(path)
+    assert changed is not template
+    assert "signature" in changed.placeholders
+    assert changed.digest != template.digest
@@ -0,0 +1,131 @@
+import sqlite3
+import pytest
+from LOR_python_app.code import repository
+from LOR_python_app.code.migrations import (ADMIN_MIGRATIONS, DETAIL_COLUMNS, SIGNUP_MIGRATIONS,
+                                            _drop_duplicate_users_indexes, migrate, run_migrations)
+
+
+@pytest.fixture
+def legacy_databases(tmp_path):
+    """
+    signup.db and admin.db as the application created them before
+    migrations existed: only some detail columns, no constraints, duplicates.
+    """
+    signup_path, admin_path = str(tmp_path / "signup.db"), str(tmp_path / "admin.db")
+    connection = sqlite3.connect(signup_path)
+    connection.execute("CREATE TABLE users (name TEXT, email TEXT, password TEXT, full_name TEXT, branch TEXT)")
+    connection.executemany("INSERT INTO users (name, email, password, full_name, branch) VALUES (?, ?, ?, ?, ?)",
+                           [("alice", "alice@student.sfit.ac.in", "pw", "Alice Rao", "Comps"),
+                            ("bob", "bob@student.sfit.ac.in", "pw", None, None),
+                            ("bob", "bob2@student.sfit.ac.in", "pw", None, None)])
+    connection.commit()
+    connection.close()
+    connection = sqlite3.connect(admin_path)
+    connection.execute("CREATE TABLE admins (username TEXT, password_admin TEXT, professor_id INTEGER)")
+    connection.execute("INSERT INTO admins (username, password_admin, professor_id) VALUES ('Prof', 'pw', 7)")
+    connection.commit()
+    connection.close()
+
+    old_signup, old_admin = repository.SIGNUP_DB_PATH, repository.ADMIN_DB_PATH
+    repository.configure(signup_path, admin_path)
+    yield tmp_path
+    repository.close_connections()
+    repository.configure(old_signup, old_admin)
+
+
+def user_version(connection):
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def columns(connection, table):
+    return [column[1] for column in connection.execute(f"PRAGMA table_info({table})").fetchall()]
+
+
+def indexes(connection, table):
+    return {row[1]: row[2] for row in connection.execute(f"PRAGMA index_list({table})").fetchall()}
+
+
+def test_new_databases_reach_the_latest_version(databases):
+    assert user_version(repository.signup_db()) == len(SIGNUP_MIGRATIONS)
+    assert user_version(repository.admin_db()) == len(ADMIN_MIGRATIONS)
+    assert "status" in columns(repository.signup_db(), "users")
+    assert "last_login" in columns(repository.admin_db(), "admins")
+
+
+def test_legacy_databases_keep_their_rows(legacy_databases, capsys):
+    run_migrations()
+
+    signup = repository.signup_db()
+    assert user_version(signup) == len(SIGNUP_MIGRATIONS)
+    for column in DETAIL_COLUMNS + ["archived_at", "status"]:
+        assert column in columns(signup, "users")
+    rows = signup.execute("SELECT name, email, status FROM users ORDER BY rowid").fetchall()
+    assert rows == [("alice", "alice@student.sfit.ac.in", "pending"),
+                    ("bob", "bob@student.sfit.ac.in", "pending"),
+                    ("bob", "bob2@student.sfit.ac.in", "pending")]
+    assert repository.get_admin(7).username == "Prof"
+
+    # The duplicate name gets a plain index instead of failing the migration
+    assert "duplicate users.name values found" in capsys.readouterr().out
+    unique = indexes(signup, "users")
+    assert unique["idx_users_name_lookup"] == 0
+    assert unique["idx_users_email_lookup"] == 1
+
+
+def test_name_and_email_are_indexed_once(databases):
+    # The UNIQUE constraints of the users table are all the indexes name and email need
+    names = indexes(repository.signup_db(), "users")
+    assert sorted(name for name in names if name.startswith("sqlite_autoindex_users")) == [
+        "sqlite_autoindex_users_1", "sqlite_autoindex_users_2"]
+    assert not [name for name in names if name.startswith(("idx_users_name", "idx_users_email"))]
+
+
+def test_duplicate_indexes_of_earlier_versions_are_dropped(tmp_path):
+    connection = sqlite3.connect(str(tmp_path / "signup.db"))
+    migrate(connection, SIGNUP_MIGRATIONS[:SIGNUP_MIGRATIONS.index(_drop_duplicate_users_indexes)])
+    for column in ("name", "email"):
+        connection.execute(f"CREATE UNIQUE INDEX idx_users_{column}_lookup ON users ({column})")
+        connection.execute(f"CREATE INDEX idx_users_{column} ON users (IFNULL({column}, ''))")
+    connection.commit()
+
+    migrate(connection, SIGNUP_MIGRATIONS)
+
+    names = indexes(connection, "users")
+    connection.close()
+    assert not [name for name in names if name.startswith(("idx_users_name", "idx_users_email"))]
+
+
+def test_legacy_rows_are_searchable(legacy_databases):
+    run_migrations()
+
+    # The search index is filled from the rows that existed before it
+    signup = repository.signup_db()
+    rows = signup.execute("SELECT rowid FROM users_search WHERE users_search MATCH 'alice'").fetchall()
+    assert rows == [(1,)]
+
+
+def test_running_again_changes_nothing(legacy_databases):
+    run_migrations()
+    signup = repository.signup_db()
+    schema = signup.execute("SELECT sql FROM sqlite_master ORDER BY name").fetchall()
+
+    run_migrations()
+    migrate(signup, SIGNUP_MIGRATIONS)
+
+    assert user_version(signup) == len(SIGNUP_MIGRATIONS)
+    assert user_version(repository.admin_db()) == len(ADMIN_MIGRATIONS)
+    assert signup.execute("SELECT sql FROM sqlite_master ORDER BY name").fetchall() == schema
+    assert signup.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 3
+
+
+def test_failed_migration_is_rolled_back(databases):
+    def broken(connection):
+        connection.execute("CREATE TABLE half_done (id INTEGER)")
+        raise RuntimeError("boom")
+
+    signup = repository.signup_db()
+    with pytest.raises(RuntimeError):
+        migrate(signup, SIGNUP_MIGRATIONS + [broken])
+
+    assert user_version(signup) == len(SIGNUP_MIGRATIONS)
+    assert signup.execute("SELECT 1 FROM sqlite_master WHERE name = 'half_done'").fetchone() is None
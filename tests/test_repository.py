@@ -0,0 +1,49 @@
+import threading
+from LOR_python_app.code import repository
+
+
+def run_on_thread(function):
+    errors = []
+
+    def target():
+        try:
+            function()
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    return errors
+
+
+def test_each_thread_has_its_own_connection(databases):
+    connections = []
+
+    def open_connection():
+        connections.append(repository.signup_db())
+        repository.close_connections()
+
+    assert run_on_thread(open_connection) == []
+    assert connections[0] is not repository.signup_db()
+
+
+def test_closing_before_opening_keeps_the_thread_usable(databases):
+    def close_then_query():
+        repository.close_connections()
+        try:
+            assert repository.username_exists("nobody") is False
+        finally:
+            repository.close_connections()
+
+    assert run_on_thread(close_then_query) == []
+
+
+def test_closed_connections_are_reopened(databases):
+    repository.insert_user("alice", "alice@student.sfit.ac.in", "pw")
+    first = repository.signup_db()
+
+    repository.close_connections()
+
+    assert repository.signup_db() is not first
+    assert repository.username_exists("alice")
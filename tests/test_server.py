@@ -0,0 +1,72 @@
+import asyncio
+import functools
+import json
+import threading
+import pytest
+from LOR_python_app.code import lor_generator, repository, server
+
+# The letter templates are found relative to code/
+pytestmark = pytest.mark.usefixtures("code_dir")
+
+
+@pytest.fixture
+def service(students, monkeypatch):
+    # Letters are saved, whatever LOR_SAVE_LETTERS was when the modules were imported, in the scratch
+    # folder instead of All_LORs
+    monkeypatch.setattr(server, "SAVE_LETTERS", True)
+    monkeypatch.setattr(server, "plan_letter",
+                        functools.partial(lor_generator.plan_letter, output_root=str(students / "All_LORs")))
+    service = server.LORService(render_workers=1)
+    yield service
+    service.close()
+
+
+def generate(service, name):
+    headers = {"authorization": f"Bearer {service.start_session('admin', 'Prof A')}"}
+    return asyncio.run(service.dispatch("POST", f"/applicants/{name}/lor", headers, b""))
+
+
+def record_threads(monkeypatch, module, name):
+    """
+    Replace module.name with a wrapper and return the list of thread names
+    it is called on.
+    """
+    function = getattr(module, name)
+    threads = []
+
+    def recorded(*args, **kwargs):
+        threads.append(threading.current_thread().name)
+        return function(*args, **kwargs)
+
+    monkeypatch.setattr(module, name, recorded)
+    return threads
+
+
+def test_branch_matcher_runs_on_the_database_thread(service, monkeypatch):
+    classified = record_threads(monkeypatch, server, "get_branch_similarity")
+    taxonomy = record_threads(monkeypatch, repository, "fetch_branch_taxonomy")
+
+    status, payload = generate(service, "alice")
+
+    assert status == 200, payload
+    assert classified and all(name.startswith("lor-db") for name in classified)
+    assert taxonomy and all(name.startswith("lor-db") for name in taxonomy)
+
+
+def test_cached_letter_is_read_off_the_event_loop(service, monkeypatch):
+    saves = []
+    save = server.save_letter_in_background
+    monkeypatch.setattr(server, "save_letter_in_background", lambda job, data: saves.append(save(job, data)))
+    status, first = generate(service, "alice")
+    assert status == 200, first
+    # The copy is written after the response; wait for it so the next request finds it
+    saves[0].result(timeout=10)
+    reads = record_threads(monkeypatch, server, "read_file")
+
+    status, second = generate(service, "alice")
+
+    assert status == 200, second
+    assert second["file_path"] == first["file_path"]
+    assert len(saves) == 1
+    # asyncio.run runs the event loop on the test's own thread
+    assert reads and threading.current_thread().name not in reads